@@ -1,11 +1,1326 @@
-from typing import Any, Optional, List
+import asyncio
+import functools
+import importlib.util
+import itertools
+import json
+import keyword
+import os
+import random
+import re
+import sqlite3
+import string
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Callable, Generator, Iterator, NamedTuple, Optional, List, Union
+from urllib.parse import quote, urlencode
+
+import httpx
+from loguru import logger
 from universal_mcp.applications import APIApplication
 from universal_mcp.integrations import Integration
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+if orjson is not None:
+    _dumps = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+class _ResponseCache:
+    """
+    Thread-safe LRU of successful JSON GET responses, keyed by full request URL.
+
+    Entries are served without touching the network for ``ttl`` seconds after
+    they were stored or last revalidated. Older entries are kept so that their
+    ETag can be used for a conditional request. A ``maxsize`` of zero disables
+    the cache. Bodies larger than ``max_entry_bytes`` (typically big listing
+    pages) are not kept, and least recently used entries are evicted once the
+    bodies held exceed ``max_bytes`` in total, which bounds memory whatever the
+    entry count.
+
+    Keys matched by ``long_lived`` are fresh for ``long_ttl`` seconds instead.
+
+    With a ``store``, entries are also written through to disk and memory
+    misses fall back to it, so cached reads (and their ETags) survive process
+    restarts.
+    """
+
+    __slots__ = ("maxsize", "ttl", "long_ttl", "long_lived", "max_entry_bytes", "max_bytes", "store", "_entries", "_bytes", "_lock")
+
+    def __init__(self, maxsize: int, ttl: float, max_entry_bytes: int = 1 << 20, max_bytes: int = 64 << 20, store: Optional["_ResponseStore"] = None, long_ttl: Optional[float] = None, long_lived: Optional[Callable[[str], bool]] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.long_ttl = ttl if long_ttl is None else long_ttl
+        self.long_lived = long_lived
+        self.max_entry_bytes = max_entry_bytes
+        self.max_bytes = max_bytes
+        self.store = store
+        self._entries: OrderedDict[str, tuple[float, httpx.Response]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[tuple[httpx.Response, bool]]:
+        """Return the cached response for ``key`` and whether it is still fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[1], entry[0] > time.monotonic()
+        if self.store is None:
+            return None
+        stored = self.store.get(key)
+        if stored is None:
+            return None
+        stored_at, response = stored
+        expires = time.monotonic() + stored_at + self.ttl_for(key) - time.time()
+        self._insert(key, expires, response)
+        return response, expires > time.monotonic()
+
+    def ttl_for(self, key: str) -> float:
+        """Seconds a response for ``key`` is served without revalidation."""
+        if self.long_lived is not None and self.long_lived(key):
+            return self.long_ttl
+        return self.ttl
+
+    def put(self, key: str, response: httpx.Response) -> None:
+        """Store ``response``, fresh for ``ttl_for(key)`` seconds."""
+        if len(response.content) > self.max_entry_bytes:
+            with self._lock:
+                self._pop(key)
+            if self.store is not None:
+                self.store.delete(key)
+            return
+        self._insert(key, time.monotonic() + self.ttl_for(key), response)
+        if self.store is not None:
+            self.store.put(key, response)
+
+    def _insert(self, key: str, expires: float, response: httpx.Response) -> None:
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (expires, response)
+            self._bytes += len(response.content)
+            while self._entries and (len(self._entries) > self.maxsize or self._bytes > self.max_bytes):
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        # Callers hold the lock.
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1].content)
+
+    def invalidate(self, prefix: str, nested: bool = True) -> None:
+        """Drop every entry for ``prefix`` itself (with any query) or, if ``nested``, any path below it."""
+        with self._lock:
+            for key in [key for key in self._entries if _is_under(key, prefix, nested)]:
+                self._pop(key)
+        if self.store is not None:
+            self.store.invalidate(prefix, nested)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.store is not None:
+            self.store.clear()
+
+
+class _ResponseStore:
+    """
+    SQLite-backed persistent level of ``_ResponseCache``.
+
+    Rows hold the body, ETag and content type of a cached response with the
+    wall-clock time it was stored. At most ``max_entries`` rows are kept; the
+    oldest are pruned as new ones arrive.
+    """
+
+    __slots__ = ("max_entries", "_db", "_lock", "_writes")
+
+    def __init__(self, directory: str, max_entries: int) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(os.path.join(directory, "responses.sqlite3"), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, stored_at REAL, etag TEXT, content_type TEXT, body BLOB)")
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get(self, key: str) -> Optional[tuple[float, httpx.Response]]:
+        with self._lock:
+            row = self._db.execute("SELECT stored_at, etag, content_type, body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        stored_at, etag, content_type, body = row
+        headers = {"content-type": content_type}
+        if etag:
+            headers["etag"] = etag
+        return stored_at, httpx.Response(200, headers=headers, content=body)
+
+    def put(self, key: str, response: httpx.Response) -> None:
+        row = (key, time.time(), response.headers.get("etag"), response.headers.get("content-type", ""), response.content)
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)", row)
+            self._writes += 1
+            if self._writes % 256 == 0:
+                self._db.execute("DELETE FROM responses WHERE key NOT IN (SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)", (self.max_entries,))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def invalidate(self, prefix: str, nested: bool = True) -> None:
+        """Drop every row for ``prefix`` itself (with any query) or, if ``nested``, any path below it."""
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM responses WHERE key = ? OR substr(key, 1, ?) IN (?, ?)",
+                (prefix, len(prefix) + 1, prefix + "?", prefix + "/" if nested else prefix + "?"),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+
+# Box-defined metadata templates and enterprise template schemas (the security
+# classification schema among them) change rarely and their own writes
+# invalidate them, so they can be cached for ``schema_cache_ttl`` instead.
+_LONG_LIVED_PATH = re.compile(r"/metadata_templates/(?:global(?:[/?]|$)|enterprise(?:_\d+)?/[^/?]+/schema(?:\?|$))")
+
+
+_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class _Throttle:
+    """
+    Pacing shared by every request of one app, sync and async alike.
+
+    ``rate`` (requests per second) optionally enables a token bucket holding
+    up to one second of burst. Independently, a 429 from Box pauses all
+    requests until its ``Retry-After`` has passed, so that concurrent callers
+    wait together instead of each running into the limit in turn.
+    """
+
+    __slots__ = ("rate", "_tokens", "_updated", "_resume_at", "_lock")
+
+    def __init__(self, rate: Optional[float] = None) -> None:
+        self.rate = rate
+        self._tokens = rate or 0.0
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """Take a slot for one request and return how long to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._resume_at - now
+            if self.rate:
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate) - 1
+                self._updated = now
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self.rate)
+            return max(wait, 0.0)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+class _Credentials(httpx.Auth):
+    """
+    Authenticate every request with the integration's credentials.
+
+    The credentials are resolved on the first request and shared by every
+    later one. When Box rejects a request with ``401 Unauthorized``, because
+    the access token expired or was rotated, they are resolved again and
+    the request is retried once with the fresh headers, which later requests
+    then reuse.
+    """
+
+    def __init__(self, resolve: Callable[[], httpx.Headers]) -> None:
+        self._resolve = resolve
+        self._headers: Optional[httpx.Headers] = None
+        self._lock = threading.Lock()
+
+    def headers(self, stale: Optional[httpx.Headers] = None) -> httpx.Headers:
+        """Current credential headers, resolved again if they are still the rejected ``stale`` ones."""
+        with self._lock:
+            if self._headers is None or self._headers is stale:
+                self._headers = self._resolve()
+            return self._headers
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        headers = self.headers()
+        request.headers.update(headers)
+        response = yield request
+        if response.status_code == 401:
+            request.headers.update(self.headers(stale=headers))
+            yield request
+
+
+def _retry_delay(request: httpx.Request, response: httpx.Response, attempt: int, backoff: float) -> Optional[float]:
+    """
+    Seconds to wait before replaying ``request`` after ``response``, or
+    None when it must not be retried.
+
+    A 429 is retried for every method, because Box rejects the request
+    before acting on it. The server's ``Retry-After`` is honoured when
+    present. Otherwise the wait falls back to jittered exponential
+    backoff, so that concurrent callers do not retry in lockstep. Transient
+    5xx statuses are only retried for idempotent methods.
+    """
+    status = response.status_code
+    if status == 429:
+        try:
+            return max(float(response.headers["Retry-After"]), 0.0)
+        except (KeyError, ValueError):
+            return backoff * 2 ** attempt * random.uniform(1.0, 2.0)
+    if status in _RETRY_STATUSES and request.method in _RETRY_METHODS:
+        return backoff * 2 ** attempt
+    return None
+
+
+class _RetryTransport(httpx.BaseTransport):
+    """
+    Retry requests that Box throttled (429) or that failed with a transient 5xx.
+
+    Attempts are spaced ``backoff * 2 ** attempt`` seconds apart unless the
+    response carries ``Retry-After``. Writes that are not idempotent (POST)
+    are only replayed after a 429. Every send first waits on ``throttle``.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, retries: int, backoff: float = 0.3, throttle: Optional[_Throttle] = None) -> None:
+        self._transport = transport
+        self._retries = retries
+        self._backoff = backoff
+        self._throttle = throttle or _Throttle()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._send(request)
+        for attempt in range(self._retries):
+            delay = _retry_delay(request, response, attempt, self._backoff)
+            if delay is None:
+                break
+            response.close()
+            if response.status_code == 429:
+                self._throttle.pause(delay)
+            else:
+                time.sleep(delay)
+            response = self._send(request)
+        return response
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        wait = self._throttle.delay()
+        if wait:
+            time.sleep(wait)
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """
+    Async counterpart of ``_RetryTransport``.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, retries: int, backoff: float = 0.3, throttle: Optional[_Throttle] = None) -> None:
+        self._transport = transport
+        self._retries = retries
+        self._backoff = backoff
+        self._throttle = throttle or _Throttle()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._send(request)
+        for attempt in range(self._retries):
+            delay = _retry_delay(request, response, attempt, self._backoff)
+            if delay is None:
+                break
+            await response.aclose()
+            if response.status_code == 429:
+                self._throttle.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+            response = await self._send(request)
+        return response
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        wait = self._throttle.delay()
+        if wait:
+            await asyncio.sleep(wait)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _is_under(key: str, prefix: str, nested: bool = True) -> bool:
+    """Whether ``key`` is the URL ``prefix`` itself, a query of it or, if ``nested``, a path below it."""
+    return key == prefix or key.startswith((prefix + "/", prefix + "?") if nested else prefix + "?")
+
+
+def _cache_key(url: str, params: Optional[dict[str, Any]]) -> str:
+    # The fragment that tells apart tools such as get_shared_link is never sent,
+    # so it must not separate their cache entries from those of the plain URL.
+    url = url.partition("#")[0]
+    if not params:
+        return url
+    return url + "?" + urlencode(sorted(params.items()), doseq=True)
+
+
+class _Endpoint(NamedTuple):
+    """
+    Declarative description of one Box REST operation.
+
+    ``path`` is a ``str.format`` template whose fields are the required path
+    parameters. ``query`` and ``body`` list the optional parameters sent in
+    the query string and request body; ``body`` may instead name a single
+    parameter that is sent verbatim as the whole body. ``choices`` pairs
+    parameters with the only values the API accepts for them, so a typo is
+    rejected locally instead of costing a round-trip. Body fields listed in
+    ``nullable`` are always sent, as JSON ``null`` when None, because the API
+    gives ``null`` a meaning of its own.
+    """
+
+    method: str
+    path: str
+    query: tuple[str, ...] = ()
+    body: Union[tuple[str, ...], str, None] = None
+    content_type: str = "application/json"
+    files: tuple[str, ...] = ()
+    choices: tuple[tuple[str, frozenset[str]], ...] = ()
+    nullable: tuple[str, ...] = ()
+
+
+def _invalid_choice(name: str, value: Any, choices: frozenset[str]) -> None:
+    raise ValueError(f"Invalid value {value!r} for parameter '{name}'; expected one of: {', '.join(sorted(choices))}.")
+
+
+# Box rejects offsets beyond this; larger listings must be walked with markers.
+_MAX_OFFSET = 10000
+
+
+def _offset_too_large(offset: Any, usemarker: bool) -> None:
+    hint = "use marker-based pagination (usemarker=True) instead" if usemarker else "narrow the query instead"
+    raise ValueError(f"Box rejects offset {offset!r} above {_MAX_OFFSET}; {hint}.")
+
+
+def _csv(value: Any) -> Any:
+    """
+    Box takes arrays of scalars as a single comma-separated query value, and
+    arrays of objects (``mdfilters``) as a JSON array.
+    """
+    if isinstance(value, (list, tuple)):
+        if any(isinstance(item, (dict, list, tuple)) for item in value):
+            return _dumps(list(value)).decode()
+        return ",".join(map(str, value))
+    return value
+
+
+def _argument(key: str) -> str:
+    """Python parameter name for an API field (``from`` is exposed as ``from_``)."""
+    return key + "_" if keyword.iskeyword(key) else key
+
+
+def _compile_request_builder(endpoint: _Endpoint) -> Callable[..., tuple]:
+    """
+    Generate the straight-line request builder for one endpoint.
+
+    The returned function takes the base URL plus the tool's arguments as
+    keywords (optional ones defaulting to None) and returns
+    ``(url, params, body, files)``. Unset optional fields are dropped with
+    one ``is not None`` test each, so the hot path carries no loops over the
+    endpoint description. Required path parameters must be neither None nor
+    empty, since an empty ID would address the parent collection instead,
+    and are percent-encoded into the path. Offsets Box would reject are
+    refused before any request is sent.
+    """
+    path_params = [field for _, field, _, _ in string.Formatter().parse(endpoint.path) if field]
+    body_fields = endpoint.body if isinstance(endpoint.body, tuple) else ()
+    arguments = path_params + [f"{_argument(key)}=None" for key in endpoint.query + body_fields + endpoint.files]
+    if isinstance(endpoint.body, str):
+        arguments.append(f"{endpoint.body}=None")
+    lines = [f"def build(_base_url, *, {', '.join(arguments)}):" if arguments else "def build(_base_url):"]
+    for name in path_params:
+        lines += [f"    if {name} is None or {name} == '':", f"        raise ValueError(\"Missing required parameter '{name}'.\")"]
+    namespace: dict[str, Any] = {"_invalid_choice": _invalid_choice, "_csv": _csv, "_quote": quote}
+    for key, values in endpoint.choices:
+        name = _argument(key)
+        namespace[f"_{name}_choices"] = values
+        lines += [f"    if {name} is not None and {name} not in _{name}_choices:", f"        _invalid_choice({key!r}, {name}, _{name}_choices)"]
+    if "offset" in endpoint.query:
+        namespace["_offset_too_large"] = _offset_too_large
+        lines += [f"    if offset is not None and int(offset) > {_MAX_OFFSET}:", f"        _offset_too_large(offset, {'usemarker' in endpoint.query})"]
+
+    def collect(target: str, keys: tuple[str, ...], convert: str = "") -> None:
+        lines.append(f"    {target} = {{}}")
+        for key in keys:
+            value = f"{convert}({_argument(key)})" if convert else _argument(key)
+            if key in endpoint.nullable:
+                lines.append(f"    {target}[{key!r}] = {value}")
+            else:
+                lines.extend([f"    if {_argument(key)} is not None:", f"        {target}[{key!r}] = {value}"])
+
+    collect("_query", endpoint.query, "_csv")
+    if isinstance(endpoint.body, tuple):
+        collect("_body", endpoint.body)
+    elif endpoint.body is not None and endpoint.method == "POST" and endpoint.content_type == "application/json":
+        lines.append(f"    _body = {{}} if {endpoint.body} is None else {endpoint.body}")
+    else:
+        lines.append(f"    _body = {endpoint.body}")
+    collect("_files", endpoint.files)
+    for name in path_params:
+        lines.append(f"    {name} = _quote(str({name}), safe='')")
+    lines.append(f"    return f{'{_base_url}' + endpoint.path!r}, _query or None, _body, _files or None")
+    exec("\n".join(lines), namespace)
+    return namespace["build"]
+
+
+_REQUEST_BUILDERS: dict[str, Callable[..., tuple]] = {}
+
+
+def _request_builder(operation: str) -> Callable[..., tuple]:
+    """Return the compiled request builder for ``operation``, compiling it on first use."""
+    build = _REQUEST_BUILDERS.get(operation)
+    if build is None:
+        build = _REQUEST_BUILDERS[operation] = _compile_request_builder(_ENDPOINTS.get(operation) or _BINARY_ENDPOINTS[operation])
+    return build
+
+
+def _fields(operation: str) -> tuple[str, ...]:
+    """Query and body fields of a table-driven operation (empty for unknown ones)."""
+    endpoint = _ENDPOINTS.get(operation)
+    if endpoint is None:
+        return ()
+    return endpoint.query + (endpoint.body if isinstance(endpoint.body, tuple) else ())
+
+
+def _marker_arguments(operation: str, arguments: dict[str, Any]) -> Optional[str]:
+    """
+    Validate a marker-paginated listing, switch it to marker paging and pop the start marker.
+    """
+    fields = _fields(operation)
+    if "marker" not in fields:
+        raise ValueError(f"'{operation}' is not a marker-paginated listing.")
+    if "usemarker" in fields:
+        arguments["usemarker"] = True
+    return arguments.pop("marker", None)
+
+
+def _offset_arguments(operation: str, arguments: dict[str, Any], page_size: int) -> tuple[int, int]:
+    """
+    Validate an offset-paginated listing and pop its starting offset and page size.
+    """
+    fields = _fields(operation)
+    if "offset" not in fields or "limit" not in fields:
+        raise ValueError(f"'{operation}' is not an offset-paginated listing.")
+    return int(arguments.pop("offset", None) or 0), int(arguments.pop("limit", None) or page_size)
+
+
+def _page_stride(page: dict[str, Any], limit: int) -> int:
+    """
+    Entries per page actually served, which Box may clamp below the requested ``limit``.
+    """
+    served = page.get("limit")
+    if not isinstance(served, int) or served <= 0:
+        served = len(page.get("entries") or ())
+    return min(served, limit)
+
+
+def _batch_calls(calls: List[tuple[str, dict[str, Any]]]) -> list[tuple[str, dict[str, Any]]]:
+    """
+    Validate a batch of ``(operation, arguments)`` pairs before any of them is sent.
+    """
+    calls = [(operation, dict(arguments)) for operation, arguments in calls]
+    for operation, _ in calls:
+        if operation not in _ENDPOINTS:
+            raise ValueError(f"'{operation}' is not a Box API tool.")
+    return calls
+
+
+def _result_or_exception(function: Callable[[Any], Any], item: Any) -> Any:
+    try:
+        return function(item)
+    except Exception as e:
+        return e
+
+
+_FOLDER_DETAILS = (
+    ("folder", "get_folders_id"),
+    ("metadata", "get_folders_id_metadata"),
+    ("collaborations", "get_folders_id_collaborations"),
+    ("app_item_associations", "get_folder_app_item_associations"),
+    ("classification", "get_folder_security_classification"),
+)
+
+
+def _metadata_fields(templates: List[tuple[str, str]], fields: Optional[List[str]]) -> list[str]:
+    """``fields`` plus the ``metadata.<scope>.<template_key>`` attribute of each template."""
+    return [*(fields or ()), *(f"metadata.{scope}.{template_key}" for scope, template_key in templates)]
+
+
+def _none_if_missing(call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Return ``call(*args, **kwargs)``, or None if Box answers 404 Not Found."""
+    try:
+        return call(*args, **kwargs)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return None
+        raise
+
+
+def _decode(response: httpx.Response) -> Any:
+    """Raise for error statuses, then decode a JSON body (None when there is none)."""
+    status = response.status_code
+    if status >= 400:
+        response.raise_for_status()
+    content = response.content
+    if status in (204, 205) or not content or content.isspace():
+        return None
+    try:
+        return _loads(content)
+    except ValueError:
+        return None
+
+
+def _encode_body(data: Any, content_type: str) -> tuple[Any, str]:
+    """
+    Pre-serialize JSON bodies with the fast encoder.
+
+    The base client encodes ``application/json`` bodies with the stdlib via
+    ``json=`` and hands every other type to ``content=`` untouched, which
+    rejects the lists used by ``application/json-patch+json`` operations.
+    JSON bodies are therefore turned into bytes here; plain JSON is labelled
+    with an explicit charset so that the base client sends those bytes as
+    they are.
+
+    Returns:
+        tuple[Any, str]: The body to send and its content type.
+    """
+    if content_type == "application/json":
+        if data is None or isinstance(data, bytes):
+            return data, content_type
+        return _dumps(data), "application/json; charset=utf-8"
+    if content_type.endswith("+json") and not isinstance(data, (bytes, str)):
+        return _dumps(data), content_type
+    return data, content_type
+
+
+def _request_content(data: Any, content_type: str, files: Optional[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Keyword arguments that send ``data`` the way APIApplication's writers do.
+    """
+    if content_type == "multipart/form-data":
+        return {"data": data, "files": files}
+    if content_type == "application/x-www-form-urlencoded":
+        return {"headers": {"Content-Type": content_type}, "data": data}
+    content, content_type = _encode_body(data, content_type)
+    return {"headers": {"Content-Type": content_type}, "content": content}
+
+
 class BoxApp(APIApplication):
-    def __init__(self, integration: Integration = None, **kwargs) -> None:
+    def __init__(self, integration: Integration = None, max_connections: int = 128, max_keepalive_connections: int = 64, connect_retries: int = 3, status_retries: int = 3, rate_limit: Optional[float] = None, http2: bool = True, cache_ttl: float = 0.0, schema_cache_ttl: Optional[float] = None, cache_size: int = 4096, cache_entry_bytes: int = 1 << 20, cache_bytes: int = 64 << 20, cache_dir: Optional[str] = None, warm_up: bool = False, **kwargs) -> None:
         super().__init__(name='box', integration=integration, **kwargs)
         self.base_url = "https://api.box.com/2.0"
+        self._limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections, keepalive_expiry=60.0)
+        self._connect_retries = connect_retries
+        self._status_retries = status_retries
+        self._throttle = _Throttle(rate_limit)
+        self._http2 = http2 and _HAS_H2
+        # The disk level holds many times the in-memory working set across runs.
+        store = _ResponseStore(cache_dir, max_entries=16 * cache_size) if cache_dir and cache_size else None
+        self._cache = _ResponseCache(maxsize=cache_size, ttl=cache_ttl, max_entry_bytes=cache_entry_bytes, max_bytes=cache_bytes, store=store, long_ttl=schema_cache_ttl, long_lived=self._is_long_lived)
+        self._client_lock = threading.Lock()
+        self._credentials = _Credentials(self._client_headers)
+        if self._client is not None and self._client.auth is None:
+            self._client.auth = self._credentials
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Key of every GET on the wire -> [write generation, fetches running].
+        self._generations: dict[str, list[int]] = {}
+        if warm_up:
+            self.warm_up()
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        Pooled keep-alive client shared by every request this app makes.
+
+        The connection pool is sized explicitly so that concurrent callers reuse
+        warm TLS connections to api.box.com instead of queueing behind httpx's
+        default limits. Failed connection attempts, throttled (429) requests
+        and idempotent requests answered with a transient 5xx are retried
+        with backoff before surfacing to the caller; a 429 pauses every
+        request until its ``Retry-After`` has passed, and ``rate_limit``
+        optionally caps the request rate. A request rejected with a 401 is
+        retried once with freshly resolved credentials. When the ``h2`` package is
+        installed, requests are multiplexed over HTTP/2 so concurrent calls
+        share a single connection. Responses are negotiated compressed (gzip,
+        deflate and zstd, plus Brotli when ``brotli`` is installed), which
+        shrinks large JSON listings several-fold on the wire.
+
+        Returns:
+            httpx.Client: The lazily created, shared HTTP client.
+        """
+        client = self._client
+        if not client:
+            # Locked so that threads racing to the first request share one pool.
+            with self._client_lock:
+                if not self._client:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        auth=self._credentials,
+                        timeout=self.default_timeout,
+                        transport=_RetryTransport(httpx.HTTPTransport(limits=self._limits, retries=self._connect_retries, http2=self._http2), retries=self._status_retries, throttle=self._throttle),
+                    )
+                client = self._client
+        return client
+
+    def _get(self, url: str, params: Optional[dict[str, Any]] = None) -> httpx.Response:
+        """
+        Make a GET request, serving repeated reads from the response cache.
+
+        Cached responses younger than ``cache_ttl`` are returned directly.
+        Older ones are revalidated with ``If-None-Match``; a ``304 Not
+        Modified`` answer reuses the cached body instead of downloading and
+        decoding it again. Binary downloads and error responses are never
+        cached.
+
+        Concurrent identical GETs are coalesced: while one is in flight, other
+        threads asking for the same URL wait for and share its response (or
+        exception) instead of sending their own.
+        """
+        key = _cache_key(url, params)
+        cached = self._cache.get(key) if self._cache.maxsize else None
+        if cached is not None and cached[1]:
+            return cached[0]
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future = self._inflight[key] = Future()
+        if pending is not None:
+            return pending.result()
+        try:
+            response = self._fetch(url, params, key, cached)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def _fetch(self, url: str, params: Optional[dict[str, Any]], key: str, cached: Optional[tuple[httpx.Response, bool]]) -> httpx.Response:
+        if not self._cache.maxsize:
+            return super()._get(url, params=params or None)
+        etag = cached[0].headers.get("etag") if cached is not None else None
+        generation = self._begin_fetch(key)
+        try:
+            response = self.client.get(url, params=params or None, headers={"If-None-Match": etag} if etag else None)
+        finally:
+            current = self._end_fetch(key, generation)
+        return self._remember(key, cached, response, current)
+
+    def _begin_fetch(self, key: str) -> int:
+        """Register a GET for ``key`` going on the wire and return the write generation it reads."""
+        with self._inflight_lock:
+            entry = self._generations.setdefault(key, [0, 0])
+            entry[1] += 1
+            return entry[0]
+
+    def _end_fetch(self, key: str, generation: int) -> bool:
+        """Unregister a finished GET; whether no write touched ``key`` while it was on the wire."""
+        with self._inflight_lock:
+            entry = self._generations[key]
+            entry[1] -= 1
+            if not entry[1]:
+                del self._generations[key]
+            return entry[0] == generation
+
+    def _remember(self, key: str, cached: Optional[tuple[httpx.Response, bool]], response: httpx.Response, current: bool = True) -> httpx.Response:
+        """
+        Resolve a (possibly conditional) GET response against the cache.
+
+        A response that is not ``current`` was requested before a write to
+        its resource and may predate it: it is returned to its caller but
+        not cached.
+        """
+        if response.status_code == 304 and cached is not None:
+            response = cached[0]
+        else:
+            response.raise_for_status()
+            if response.status_code != 200 or not response.headers.get("content-type", "").startswith("application/json"):
+                return response
+        if not current:
+            return response
+        if self._cache.ttl_for(key) or response.headers.get("etag"):
+            self._cache.put(key, response)
+        return response
+
+    def _is_long_lived(self, key: str) -> bool:
+        """Whether ``key`` is a metadata template read cached for ``schema_cache_ttl``."""
+        return key.startswith(self.base_url) and _LONG_LIVED_PATH.match(key, len(self.base_url)) is not None
+
+    def _client_headers(self) -> httpx.Headers:
+        """
+        Credential headers every request shares.
+
+        ``_Credentials`` resolves them once and again only after a 401, rather
+        than on every write. The ``Content-Type`` that ``_get_headers`` adds
+        is dropped: it is set per request, and applied to every request it
+        would override the boundary of multipart uploads.
+        """
+        headers = httpx.Headers(self._get_headers())
+        headers.pop("Content-Type", None)
+        return headers
+
+    def _post(self, url: str, data: Any, params: Optional[dict[str, Any]] = None, content_type: str = "application/json", files: Optional[dict[str, Any]] = None) -> httpx.Response:
+        return self._write("POST", url, data, params, content_type, files)
+
+    def _put(self, url: str, data: Any, params: Optional[dict[str, Any]] = None, content_type: str = "application/json", files: Optional[dict[str, Any]] = None) -> httpx.Response:
+        return self._write("PUT", url, data, params, content_type, files)
+
+    def _write(self, method: str, url: str, data: Any, params: Optional[dict[str, Any]], content_type: str, files: Optional[dict[str, Any]]) -> httpx.Response:
+        """
+        Send a request body on the shared client and invalidate the resource it touches.
+        """
+        try:
+            response = self.client.request(method, url, params=params or None, **_request_content(data, content_type, files))
+            response.raise_for_status()
+            return response
+        finally:
+            self._invalidate(url)
+
+    def _delete(self, url: str, params: Optional[dict[str, Any]] = None) -> httpx.Response:
+        try:
+            return super()._delete(url, params=params or None)
+        finally:
+            self._invalidate(url)
+
+    def _invalidate(self, url: str) -> None:
+        """
+        Forget cached reads of the resource a write touched.
+
+        The resource is the first two path segments below the API root (for
+        example ``/files/123`` for a write to ``/files/123/copy``), so the
+        object itself and all of its sub-collections are refetched. Filtered
+        listings of the top-level collection (``/folder_locks?folder_id=1``
+        after a write to ``/folder_locks/9``) are dropped too, while its
+        other members stay cached. Reads of either already in flight are
+        detached, so later callers do not join a request that was sent
+        before the write, and their responses are not cached when they
+        arrive.
+        """
+        segments = url[len(self.base_url):].partition("#")[0].partition("?")[0].strip("/").split("/")
+        prefix = f"{self.base_url}/{'/'.join(segments[:2])}"
+        self._cache.invalidate(prefix)
+        self._forget_inflight(prefix)
+        if len(segments) > 1:
+            collection = f"{self.base_url}/{segments[0]}"
+            self._cache.invalidate(collection, nested=False)
+            self._forget_inflight(collection, nested=False)
+
+    def _forget_inflight(self, prefix: str, nested: bool = True) -> None:
+        with self._inflight_lock:
+            for key in [key for key in self._inflight if _is_under(key, prefix, nested)]:
+                del self._inflight[key]
+            for key, entry in self._generations.items():
+                if _is_under(key, prefix, nested):
+                    entry[0] += 1
+
+    def _call(self, operation: str, **arguments: Any) -> Any:
+        """
+        Issue the request described by ``_ENDPOINTS[operation]`` and decode the response.
+
+        Args:
+            operation: Name of the tool being invoked.
+            **arguments: The tool's arguments, by parameter name.
+
+        Returns:
+            Any: The decoded JSON body, or None for empty responses.
+
+        Raises:
+            ValueError: If a required path parameter is None.
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        endpoint = _ENDPOINTS[operation]
+        url, params, body, files = _request_builder(operation)(self.base_url, **arguments)
+        method = endpoint.method
+        if method == "GET":
+            response = self._get(url, params=params)
+        elif method == "DELETE":
+            response = self._delete(url, params=params)
+        elif method == "POST":
+            response = self._post(url, data=body, params=params, content_type=endpoint.content_type, files=files)
+        elif method == "PUT":
+            response = self._put(url, data=body, params=params, content_type=endpoint.content_type, files=files)
+        else:
+            response = self._options(url, data=body, params=params)
+        return _decode(response)
+
+    def _options(self, url: str, data: Any = None, params: Optional[dict[str, Any]] = None) -> httpx.Response:
+        """
+        Make an OPTIONS request to the specified URL over the pooled client.
+
+        Args:
+            url: The URL to send the request to
+            data: Optional JSON-serializable request body, sent even when empty
+            params: Optional query parameters
+
+        Returns:
+            httpx.Response: The response from the server
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        content = _request_content(data, "application/json", None) if data is not None else {}
+        response = self.client.request("OPTIONS", url, params=params or None, **content)
+        response.raise_for_status()
+        return response
+
+    def warm_up(self) -> threading.Thread:
+        """
+        Open a pooled connection to Box in the background.
+
+        DNS resolution, the TCP connect and the TLS handshake then overlap with
+        application startup instead of delaying the first tool call. The
+        client is created before the thread starts, and the probe is sent
+        without credentials, so nothing is looked up on the caller's behalf.
+        Failures are logged and otherwise ignored; the first real request
+        simply connects as usual.
+
+        Returns:
+            threading.Thread: The daemon thread doing the warm-up.
+        """
+        thread = threading.Thread(target=self._warm_up, args=(self.client,), name="box-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm_up(self, client: httpx.Client) -> None:
+        try:
+            client.head(self.base_url, auth=None, timeout=5)
+        except Exception as e:
+            logger.debug(f"Box connection warm-up failed: {e}")
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP client and release its connections.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "BoxApp":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get_files_id_with_metadata(self, file_id: str, templates: List[tuple[str, str]], fields: Optional[List[str]] = None) -> dict[str, Any]:
+        """
+        Fetch a file together with metadata instances in a single request.
+
+        Box returns the instances of the requested templates inline under the
+        file's ``metadata`` attribute, saving one round-trip per template
+        compared to calling the per-template metadata tools.
+
+        Args:
+            file_id: The ID of the file.
+            templates: ``(scope, template_key)`` pairs, e.g. ``[("enterprise", "invoice"), ("global", "properties")]``.
+            fields: Optional further attributes to include. As with any ``fields``
+                request, only the mini representation plus these attributes is returned.
+
+        Returns:
+            dict[str, Any]: The file, with ``metadata[scope][template_key]`` for each template applied to it.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        return self.get_files_id(file_id, fields=_metadata_fields(templates, fields))
+
+    def get_folders_id_with_metadata(self, folder_id: str, templates: List[tuple[str, str]], fields: Optional[List[str]] = None) -> dict[str, Any]:
+        """
+        Fetch a folder together with metadata instances in a single request.
+
+        Args:
+            folder_id: The ID of the folder.
+            templates: ``(scope, template_key)`` pairs to include.
+            fields: Optional further attributes to include.
+
+        Returns:
+            dict[str, Any]: The folder, with ``metadata[scope][template_key]`` for each template applied to it.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        return self.get_folders_id(folder_id, fields=_metadata_fields(templates, fields))
+
+    def get_folders_id_details(self, folder_id: str, concurrency: int = 8) -> dict[str, Any]:
+        """
+        Fetch everything a folder details view needs with concurrent requests.
+
+        The folder, its metadata instances, collaborations, app item
+        associations and security classification are requested at once
+        (multiplexed over one connection with HTTP/2), so the view costs about
+        one round-trip instead of five.
+
+        Args:
+            folder_id: The ID of the folder.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            dict[str, Any]: ``folder``, ``metadata``, ``collaborations``, ``app_item_associations``
+            and ``classification``; a part is None when Box answers 404 for it (e.g. no
+            classification applied).
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails with a status other than 404.
+        """
+        results = self._map_concurrently(lambda operation: _none_if_missing(self._call, operation, folder_id=folder_id), [operation for _, operation in _FOLDER_DETAILS], concurrency)
+        return {part: result for (part, _), result in zip(_FOLDER_DETAILS, results)}
+
+    def get_files_many(self, file_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Fetch file information for many files concurrently.
+
+        Args:
+            file_ids: IDs of the files to fetch.
+            fields: Optional attributes to include for every file.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            list[dict[str, Any]]: File objects in the same order as ``file_ids``.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        return self._map_concurrently(lambda file_id: self.get_files_id(file_id, fields=fields), file_ids, concurrency)
+
+    def get_files_many_comments(self, file_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Fetch the first page of comments of many files concurrently.
+
+        Args:
+            file_ids: IDs of the files whose comments to fetch.
+            fields: Optional attributes to include for every comment.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            list[dict[str, Any]]: Comment listings in the same order as ``file_ids``.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        return self._map_concurrently(lambda file_id: self.get_files_id_comments(file_id, fields=fields), file_ids, concurrency)
+
+    def get_files_many_metadata(self, file_ids: List[str], concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Fetch the metadata instances of many files concurrently.
+
+        Args:
+            file_ids: IDs of the files whose metadata to fetch.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            list[dict[str, Any]]: Metadata listings in the same order as ``file_ids``.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        return self._map_concurrently(self.get_files_id_metadata, file_ids, concurrency)
+
+    def get_files_many_versions(self, file_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Fetch the first page of versions of many files concurrently.
+
+        Args:
+            file_ids: IDs of the files whose versions to fetch.
+            fields: Optional attributes to include for every version.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            list[dict[str, Any]]: Version listings in the same order as ``file_ids``.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        return self._map_concurrently(lambda file_id: self.get_files_id_versions(file_id, fields=fields), file_ids, concurrency)
+
+    def get_file_requests_many(self, file_request_ids: List[str], concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Fetch many file requests concurrently.
+
+        Args:
+            file_request_ids: IDs of the file requests to fetch.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            list[dict[str, Any]]: File requests in the same order as ``file_request_ids``.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        return self._map_concurrently(self.get_file_requests_id, file_request_ids, concurrency)
+
+    def get_comments_many(self, comment_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Fetch many comments concurrently.
+
+        Args:
+            comment_ids: IDs of the comments to fetch.
+            fields: Optional attributes to include for every comment.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            list[dict[str, Any]]: Comments in the same order as ``comment_ids``.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        return self._map_concurrently(lambda comment_id: self.get_comments_id(comment_id, fields=fields), comment_ids, concurrency)
+
+    def get_collaborations_many(self, collaboration_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Fetch many collaborations concurrently, e.g. to hydrate the entries of a ``get_collaborations`` listing.
+
+        Args:
+            collaboration_ids: IDs of the collaborations to fetch.
+            fields: Optional attributes to include for every collaboration.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            list[dict[str, Any]]: Collaborations in the same order as ``collaboration_ids``.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        return self._map_concurrently(lambda collaboration_id: self.get_collaborations_id(collaboration_id, fields=fields), collaboration_ids, concurrency)
+
+    def delete_files_many(self, file_ids: List[str], concurrency: int = 16) -> None:
+        """
+        Delete many files concurrently.
+
+        Args:
+            file_ids: IDs of the files to delete.
+            concurrency: Maximum number of requests in flight at once.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        self._map_concurrently(self.delete_files_id, file_ids, concurrency)
+
+    def apply_metadata_cascade_policies_many(self, metadata_cascade_policy_ids: List[str], conflict_resolution: Optional[str] = None, concurrency: int = 16, return_exceptions: bool = False) -> list[Any]:
+        """
+        Force-apply many metadata cascade policies concurrently.
+
+        Args:
+            metadata_cascade_policy_ids: IDs of the cascade policies to apply.
+            conflict_resolution: How to handle existing metadata instances, ``'none'`` or ``'overwrite'``.
+            concurrency: Maximum number of requests in flight at once.
+            return_exceptions: Return a failed application's exception in its slot instead of raising it, so one rejected policy does not hide the outcome of the rest.
+
+        Returns:
+            list[Any]: Each application's result (or exception) in the same order as ``metadata_cascade_policy_ids``.
+
+        Raises:
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code) and ``return_exceptions`` is false.
+        """
+        return self._map_concurrently(lambda policy_id: self.apply_metadata_cascade_policy_by_id(policy_id, conflict_resolution=conflict_resolution), metadata_cascade_policy_ids, concurrency, return_exceptions)
+
+    def call_many(self, calls: List[tuple[str, dict[str, Any]]], concurrency: int = 16) -> list[Any]:
+        """
+        Issue a batch of unrelated API calls concurrently.
+
+        Box has no batch endpoint, so the calls are sent as separate requests
+        over the shared client; with HTTP/2 they are multiplexed on one
+        connection and the batch costs about one round-trip instead of one
+        per call. Every operation is checked before the first request is sent.
+
+        Args:
+            calls: ``(tool_name, arguments)`` pairs, e.g. ``('get_folder_locks', {'folder_id': '1'})``.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            list[Any]: Each call's result, in the same order as ``calls``.
+
+        Raises:
+            ValueError: If a tool name is not a Box API tool.
+            HTTPError: Raised when any of the API requests fails (e.g., non-2XX status code).
+        """
+        return self._map_concurrently(lambda call: self._call(call[0], **call[1]), _batch_calls(calls), concurrency)
+
+    @staticmethod
+    def _map_concurrently(function: Callable[[Any], Any], items: List[Any], concurrency: int, return_exceptions: bool = False) -> list[Any]:
+        """
+        Apply ``function`` to every item on a bounded thread pool, preserving order.
+
+        The workers share the pooled client, so with HTTP/2 the requests are
+        multiplexed over one connection. The first exception is re-raised,
+        unless ``return_exceptions`` puts each one in its item's slot.
+        """
+        if return_exceptions:
+            function = functools.partial(_result_or_exception, function)
+        items = list(items)
+        if len(items) <= 1 or concurrency <= 1:
+            return [function(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as pool:
+            return list(pool.map(function, items))
+
+    def iter_folders_id_items(self, folder_id: str, fields: Optional[List[str]] = None, sort: Optional[str] = None, direction: Optional[str] = None, page_size: int = 1000) -> Iterator[dict[str, Any]]:
+        """
+        Iterate every item in a folder using marker-based pagination.
+
+        Each page is fetched by keyset position rather than offset, so the
+        cost per page stays flat however deep into a large folder the walk
+        goes, and the 10000-item offset limit does not apply. Offset paging
+        through ``get_folders_id_items`` remains available.
+
+        Args:
+            folder_id: The ID of the folder. The root folder of a Box account is always ``'0'``.
+            fields: Optional attributes to include for every item.
+            sort: Optional secondary sort attribute.
+            direction: Optional sort direction, ``'ASC'`` or ``'DESC'``.
+            page_size: Items requested per page (at most 1000).
+
+        Returns:
+            Iterator[dict[str, Any]]: The folder's files, folders and web links, in order.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        return self.iter_marker_entries('get_folders_id_items', folder_id=folder_id, fields=fields, sort=sort, direction=direction, limit=page_size)
+
+    def walk_folders_id(self, folder_id: str, fields: Optional[List[str]] = None, concurrency: int = 8) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Walk a folder tree breadth-first, listing subfolders in parallel.
+
+        Every folder is listed with marker pagination on a bounded thread
+        pool; subfolders are submitted as soon as their parent's listing
+        arrives, so a deep tree costs roughly one round-trip per level instead
+        of one per folder. Items are yielded as their folder completes, so the
+        order across folders is not deterministic.
+
+        Args:
+            folder_id: The ID of the folder to walk. The root folder of a Box account is always ``'0'``.
+            fields: Optional attributes to include for every item.
+            concurrency: Maximum number of folders listed at once.
+
+        Returns:
+            Iterator[tuple[str, dict[str, Any]]]: ``(parent_folder_id, item)`` for every item in the tree.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        def list_folder(parent_id: str) -> tuple[str, list[dict[str, Any]]]:
+            return parent_id, list(self.iter_marker_entries('get_folders_id_items', prefetch=False, folder_id=parent_id, fields=fields, limit=1000))
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+            pending = {pool.submit(list_folder, folder_id)}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        parent_id, items = future.result()
+                        for item in items:
+                            if item.get("type") == "folder":
+                                pending.add(pool.submit(list_folder, item["id"]))
+                            yield parent_id, item
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_marker_entries(self, operation: str, prefetch: bool = True, **arguments: Any) -> Iterator[Any]:
+        """
+        Iterate every entry of a marker-paginated listing.
+
+        Each page only reveals the marker of the next one, so pages cannot be
+        requested in parallel. With ``prefetch`` the next page is requested on
+        a background thread as soon as its marker is known, overlapping that
+        round-trip with the caller's processing of the current page.
+
+        Args:
+            operation: Name of a listing tool that takes a ``marker`` argument, e.g. ``'get_files_id_collaborations'``.
+            prefetch: Whether to fetch the next page while the current one is consumed.
+            **arguments: Arguments for the listing tool. ``marker`` optionally sets the starting page.
+
+        Returns:
+            Iterator[Any]: The ``entries`` of every page, in order.
+
+        Raises:
+            ValueError: If ``operation`` is not a marker-paginated listing.
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        marker = _marker_arguments(operation, arguments)
+        page = self._call(operation, marker=marker, **arguments)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            while page:
+                marker = page.get("next_marker")
+                upcoming = pool.submit(self._call, operation, marker=marker, **arguments) if marker and prefetch else None
+                yield from page.get("entries", ())
+                if upcoming is not None:
+                    page = upcoming.result()
+                else:
+                    page = self._call(operation, marker=marker, **arguments) if marker else None
+
+    def iter_offset_entries(self, operation: str, page_size: int = 1000, prefetch: int = 2, **arguments: Any) -> Iterator[Any]:
+        """
+        Iterate every entry of an offset-paginated listing.
+
+        The first page's ``total_count`` tells which offsets remain, and its
+        ``limit`` (or entry count) how many entries Box actually serves per
+        page, which may be fewer than requested; up to ``prefetch`` later
+        pages are then requested in parallel while the caller consumes the
+        current one. Listings that also support markers are
+        walked with ``iter_marker_entries`` instead (unless a starting
+        ``offset`` is given), which has no offset cap; the others stop at
+        Box's maximum offset of 10000.
+
+        Args:
+            operation: Name of a listing tool that takes ``offset`` and ``limit``, e.g. ``'get_files_id_versions'``.
+            page_size: Entries requested per page, unless ``limit`` is given.
+            prefetch: Number of pages requested ahead of the one being consumed.
+            **arguments: Arguments for the listing tool. ``offset`` optionally sets the first entry.
+
+        Returns:
+            Iterator[Any]: The ``entries`` of every page, in order.
+
+        Raises:
+            ValueError: If ``operation`` is not an offset-paginated listing.
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        offset, limit = _offset_arguments(operation, arguments, page_size)
+        if not offset and "marker" in _fields(operation):
+            yield from self.iter_marker_entries(operation, prefetch=prefetch > 0, limit=limit, **arguments)
+            return
+        page = self._call(operation, offset=offset, limit=limit, **arguments)
+        if not page:
+            return
+        limit = _page_stride(page, limit)
+        # Box still serves the page starting at _MAX_OFFSET itself.
+        end = min(page.get("total_count") or 0, _MAX_OFFSET + 1)
+        offsets = iter(range(offset + limit, end, limit) if limit else ())
+        with ThreadPoolExecutor(max_workers=max(prefetch, 1)) as pool:
+            pending = deque(pool.submit(self._call, operation, offset=o, limit=limit, **arguments) for o in itertools.islice(offsets, prefetch))
+            while page:
+                yield from page.get("entries", ())
+                following = next(offsets, None)
+                if following is not None:
+                    pending.append(pool.submit(self._call, operation, offset=following, limit=limit, **arguments))
+                page = pending.popleft().result() if pending else None
 
     def get_authorize(self, response_type: str, client_id: str, redirect_uri: Optional[str] = None, state: Optional[str] = None, scope: Optional[str] = None) -> Any:
         """
@@ -46,16 +1361,7 @@ class BoxApp(APIApplication):
         Tags:
             Authorization, important
         """
-        url = f"{self.base_url}/authorize"
-        query_params = {k: v for k, v in [('response_type', response_type), ('client_id', client_id), ('redirect_uri', redirect_uri), ('state', state), ('scope', scope)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_authorize', response_type=response_type, client_id=client_id, redirect_uri=redirect_uri, state=state, scope=scope)
 
     def post_oauth_token(self, grant_type: Optional[str] = None, client_id: Optional[str] = None, client_secret: Optional[str] = None, code: Optional[str] = None, refresh_token: Optional[str] = None, assertion: Optional[str] = None, subject_token: Optional[str] = None, subject_token_type: Optional[str] = None, actor_token: Optional[str] = None, actor_token_type: Optional[str] = None, scope: Optional[str] = None, resource: Optional[str] = None, box_subject_type: Optional[str] = None, box_subject_id: Optional[str] = None, box_shared_link: Optional[str] = None) -> dict[str, Any]:
         """
@@ -129,35 +1435,7 @@ class BoxApp(APIApplication):
         Tags:
             Authorization
         """
-        request_body_data = None
-        request_body_data = {
-            'grant_type': grant_type,
-            'client_id': client_id,
-            'client_secret': client_secret,
-            'code': code,
-            'refresh_token': refresh_token,
-            'assertion': assertion,
-            'subject_token': subject_token,
-            'subject_token_type': subject_token_type,
-            'actor_token': actor_token,
-            'actor_token_type': actor_token_type,
-            'scope': scope,
-            'resource': resource,
-            'box_subject_type': box_subject_type,
-            'box_subject_id': box_subject_id,
-            'box_shared_link': box_shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/oauth2/token"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/x-www-form-urlencoded')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_oauth_token', grant_type=grant_type, client_id=client_id, client_secret=client_secret, code=code, refresh_token=refresh_token, assertion=assertion, subject_token=subject_token, subject_token_type=subject_token_type, actor_token=actor_token, actor_token_type=actor_token_type, scope=scope, resource=resource, box_subject_type=box_subject_type, box_subject_id=box_subject_id, box_shared_link=box_shared_link)
 
     def post_oauth_token_refresh(self, grant_type: Optional[str] = None, client_id: Optional[str] = None, client_secret: Optional[str] = None, refresh_token: Optional[str] = None) -> dict[str, Any]:
         """
@@ -181,24 +1459,7 @@ class BoxApp(APIApplication):
         Tags:
             Authorization
         """
-        request_body_data = None
-        request_body_data = {
-            'grant_type': grant_type,
-            'client_id': client_id,
-            'client_secret': client_secret,
-            'refresh_token': refresh_token,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/oauth2/token#refresh"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/x-www-form-urlencoded')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_oauth_token_refresh', grant_type=grant_type, client_id=client_id, client_secret=client_secret, refresh_token=refresh_token)
 
     def post_oauth_revoke(self, client_id: Optional[str] = None, client_secret: Optional[str] = None, token: Optional[str] = None) -> Any:
         """
@@ -221,23 +1482,7 @@ class BoxApp(APIApplication):
         Tags:
             Authorization
         """
-        request_body_data = None
-        request_body_data = {
-            'client_id': client_id,
-            'client_secret': client_secret,
-            'token': token,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/oauth2/revoke"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/x-www-form-urlencoded')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_oauth_revoke', client_id=client_id, client_secret=client_secret, token=token)
 
     def get_files_id(self, file_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -274,18 +1519,7 @@ class BoxApp(APIApplication):
         Tags:
             Files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id', file_id=file_id, fields=fields)
 
     def post_files_id(self, file_id: str, fields: Optional[List[str]] = None, name: Optional[str] = None, parent: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -315,24 +1549,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'parent': parent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_files_id', file_id=file_id, fields=fields, name=name, parent=parent)
 
     def put_files_id(self, file_id: str, fields: Optional[List[str]] = None, name: Optional[str] = None, description: Optional[str] = None, parent: Optional[Any] = None, shared_link: Optional[Any] = None, lock: Optional[dict[str, Any]] = None, disposition_at: Optional[str] = None, permissions: Optional[dict[str, Any]] = None, collections: Optional[List[dict[str, Any]]] = None, tags: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -402,31 +1619,7 @@ class BoxApp(APIApplication):
         Tags:
             Files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'description': description,
-            'parent': parent,
-            'shared_link': shared_link,
-            'lock': lock,
-            'disposition_at': disposition_at,
-            'permissions': permissions,
-            'collections': collections,
-            'tags': tags,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_files_id', file_id=file_id, fields=fields, name=name, description=description, parent=parent, shared_link=shared_link, lock=lock, disposition_at=disposition_at, permissions=permissions, collections=collections, tags=tags)
 
     def delete_files_id(self, file_id: str) -> Any:
         """
@@ -446,18 +1639,7 @@ class BoxApp(APIApplication):
         Tags:
             Files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_files_id', file_id=file_id)
 
     def list_file_associations(self, file_id: str, limit: Optional[int] = None, marker: Optional[str] = None, application_type: Optional[str] = None) -> dict[str, Any]:
         """
@@ -484,20 +1666,9 @@ class BoxApp(APIApplication):
         Tags:
             App item associations
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/app_item_associations"
-        query_params = {k: v for k, v in [('limit', limit), ('marker', marker), ('application_type', application_type)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('list_file_associations', file_id=file_id, limit=limit, marker=marker, application_type=application_type)
 
-    def get_files_id_content(self, file_id: str, version: Optional[str] = None, access_token: Optional[str] = None) -> Any:
+    def get_files_id_content(self, file_id: str, version: Optional[str] = None, access_token: Optional[str] = None) -> bytes:
         """
         Download file
 
@@ -508,7 +1679,7 @@ class BoxApp(APIApplication):
         When using this parameter, please make sure that the access token is sufficiently scoped down to only allow read access to that file and no other files or folders. Example: 'c3FIOG9vSGV4VHo4QzAyg5T1JvNnJoZ3ExaVNyQWw6WjRsanRKZG5lQk9qUE1BVQ'.
 
         Returns:
-            Any: Returns the requested file if the client has the **follow
+            bytes: Returns the requested file if the client has the **follow
         redirects** setting enabled to automatically
         follow HTTP `3xx` responses as redirects. If not, the request
         will return `302` instead.
@@ -517,23 +1688,58 @@ class BoxApp(APIApplication):
 
         Raises:
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
-            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
         Tags:
             Downloads
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/content"
-        query_params = {k: v for k, v in [('version', version), ('access_token', access_token)] if v is not None}
-        response = self._get(url, params=query_params)
+        url, params, _, _ = _request_builder('get_files_id_content')(self.base_url, file_id=file_id, version=version, access_token=access_token)
+        response = self.client.get(url, params=params, follow_redirects=True)
         response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return response.content
+
+    def iter_files_id_content(self, file_id: str, version: Optional[str] = None, access_token: Optional[str] = None, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+        """
+        Stream a file's content in chunks instead of buffering it in memory.
+
+        Args:
+            file_id: The ID of the file to download.
+            version: Optional file version to download.
+            access_token: Optional scoped-down token that pre-authenticates the download, as for ``get_files_id_content``.
+            chunk_size: Size in bytes of each yielded chunk.
+
+        Returns:
+            Iterator[bytes]: The file content, ``chunk_size`` bytes at a time.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        url, params, _, _ = _request_builder('get_files_id_content')(self.base_url, file_id=file_id, version=version, access_token=access_token)
+        with self.client.stream("GET", url, params=params, follow_redirects=True) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes(chunk_size)
+
+    def download_files_id_content(self, file_id: str, path: str, version: Optional[str] = None, access_token: Optional[str] = None, chunk_size: int = 1 << 20) -> int:
+        """
+        Download a file straight to disk, holding at most one chunk in memory.
+
+        Args:
+            file_id: The ID of the file to download.
+            path: Local path the content is written to.
+            version: Optional file version to download.
+            access_token: Optional scoped-down token that pre-authenticates the download.
+            chunk_size: Size in bytes of each chunk read from the network.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+        """
+        written = 0
+        with open(path, "wb") as fh:
+            for chunk in self.iter_files_id_content(file_id, version=version, access_token=access_token, chunk_size=chunk_size):
+                written += fh.write(chunk)
+        return written
 
     def post_files_id_content(self, file_id: str, fields: Optional[List[str]] = None, attributes: Optional[dict[str, Any]] = None, file: Optional[bytes] = None) -> dict[str, Any]:
         """
@@ -583,28 +1789,7 @@ class BoxApp(APIApplication):
         Tags:
             Uploads
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        files_data = None
-        request_body_data = {}
-        files_data = {}
-        if attributes is not None:
-            request_body_data['attributes'] = attributes
-        if file is not None:
-            files_data['file'] = file
-        files_data = {k: v for k, v in files_data.items() if v is not None}
-        if not files_data: files_data = None
-        url = f"{self.base_url}/files/{file_id}/content"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, files=files_data, params=query_params, content_type='multipart/form-data')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_files_id_content', file_id=file_id, fields=fields, attributes=attributes, file=file)
 
     def options_files_content(self, name: Optional[str] = None, size: Optional[int] = None, parent: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -626,23 +1811,7 @@ class BoxApp(APIApplication):
         Tags:
             Files
         """
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'size': size,
-            'parent': parent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/content"
-        query_params = {}
-        response = self._options(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('options_files_content', name=name, size=size, parent=parent)
 
     def post_files_content(self, fields: Optional[List[str]] = None, attributes: Optional[dict[str, Any]] = None, file: Optional[bytes] = None) -> dict[str, Any]:
         """
@@ -690,27 +1859,8 @@ class BoxApp(APIApplication):
 
         Tags:
             Uploads
-        """
-        request_body_data = None
-        files_data = None
-        request_body_data = {}
-        files_data = {}
-        if attributes is not None:
-            request_body_data['attributes'] = attributes
-        if file is not None:
-            files_data['file'] = file
-        files_data = {k: v for k, v in files_data.items() if v is not None}
-        if not files_data: files_data = None
-        url = f"{self.base_url}/files/content"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, files=files_data, params=query_params, content_type='multipart/form-data')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        """
+        return self._call('post_files_content', fields=fields, attributes=attributes, file=file)
 
     def post_files_upload_sessions(self, folder_id: Optional[str] = None, file_size: Optional[int] = None, file_name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -731,23 +1881,7 @@ class BoxApp(APIApplication):
         Tags:
             Uploads (Chunked)
         """
-        request_body_data = None
-        request_body_data = {
-            'folder_id': folder_id,
-            'file_size': file_size,
-            'file_name': file_name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/upload_sessions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_files_upload_sessions', folder_id=folder_id, file_size=file_size, file_name=file_name)
 
     def post_files_id_upload_sessions(self, file_id: str, file_size: Optional[int] = None, file_name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -768,24 +1902,7 @@ class BoxApp(APIApplication):
         Tags:
             Uploads (Chunked)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'file_size': file_size,
-            'file_name': file_name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}/upload_sessions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_files_id_upload_sessions', file_id=file_id, file_size=file_size, file_name=file_name)
 
     def get_files_upload_sessions_id(self, upload_session_id: str) -> dict[str, Any]:
         """
@@ -804,18 +1921,7 @@ class BoxApp(APIApplication):
         Tags:
             Uploads (Chunked)
         """
-        if upload_session_id is None:
-            raise ValueError("Missing required parameter 'upload_session_id'.")
-        url = f"{self.base_url}/files/upload_sessions/{upload_session_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_upload_sessions_id', upload_session_id=upload_session_id)
 
     def put_files_upload_sessions_id(self, upload_session_id: str, body_content: Optional[bytes] = None) -> dict[str, Any]:
         """
@@ -835,20 +1941,7 @@ class BoxApp(APIApplication):
         Tags:
             Uploads (Chunked)
         """
-        if upload_session_id is None:
-            raise ValueError("Missing required parameter 'upload_session_id'.")
-        request_body_data = None
-        request_body_data = body_content
-        url = f"{self.base_url}/files/upload_sessions/{upload_session_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/octet-stream')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_files_upload_sessions_id', upload_session_id=upload_session_id, body_content=body_content)
 
     def delete_upload_session_by_id(self, upload_session_id: str) -> Any:
         """
@@ -868,18 +1961,7 @@ class BoxApp(APIApplication):
         Tags:
             Uploads (Chunked)
         """
-        if upload_session_id is None:
-            raise ValueError("Missing required parameter 'upload_session_id'.")
-        url = f"{self.base_url}/files/upload_sessions/{upload_session_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_upload_session_by_id', upload_session_id=upload_session_id)
 
     def get_upload_session_parts(self, upload_session_id: str, offset: Optional[int] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -904,18 +1986,7 @@ class BoxApp(APIApplication):
         Tags:
             Uploads (Chunked)
         """
-        if upload_session_id is None:
-            raise ValueError("Missing required parameter 'upload_session_id'.")
-        url = f"{self.base_url}/files/upload_sessions/{upload_session_id}/parts"
-        query_params = {k: v for k, v in [('offset', offset), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_upload_session_parts', upload_session_id=upload_session_id, offset=offset, limit=limit)
 
     def commit_upload_session(self, upload_session_id: str, parts: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -935,23 +2006,7 @@ class BoxApp(APIApplication):
         Tags:
             Uploads (Chunked)
         """
-        if upload_session_id is None:
-            raise ValueError("Missing required parameter 'upload_session_id'.")
-        request_body_data = None
-        request_body_data = {
-            'parts': parts,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/upload_sessions/{upload_session_id}/commit"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('commit_upload_session', upload_session_id=upload_session_id, parts=parts)
 
     def post_files_id_copy(self, file_id: str, fields: Optional[List[str]] = None, name: Optional[str] = None, version: Optional[str] = None, parent: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -992,27 +2047,9 @@ class BoxApp(APIApplication):
         Tags:
             Files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'version': version,
-            'parent': parent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}/copy"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_files_id_copy', file_id=file_id, fields=fields, name=name, version=version, parent=parent)
 
-    def get_files_id_thumbnail_id(self, file_id: str, extension: str, min_height: Optional[int] = None, min_width: Optional[int] = None, max_height: Optional[int] = None, max_width: Optional[int] = None) -> Any:
+    def get_files_id_thumbnail_id(self, file_id: str, extension: str, min_height: Optional[int] = None, min_width: Optional[int] = None, max_height: Optional[int] = None, max_width: Optional[int] = None) -> Optional[bytes]:
         """
         Get file thumbnail
 
@@ -1025,30 +2062,19 @@ class BoxApp(APIApplication):
             max_width (integer): The maximum width of the thumbnail Example: '320'.
 
         Returns:
-            Any: When a thumbnail can be created the thumbnail data will be
+            Optional[bytes]: When a thumbnail can be created the thumbnail data will be
         returned in the body of the response.
 
         Raises:
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
-            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
         Tags:
             Files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        if extension is None:
-            raise ValueError("Missing required parameter 'extension'.")
-        url = f"{self.base_url}/files/{file_id}/thumbnail.{extension}"
-        query_params = {k: v for k, v in [('min_height', min_height), ('min_width', min_width), ('max_height', max_height), ('max_width', max_width)] if v is not None}
-        response = self._get(url, params=query_params)
+        url, params, _, _ = _request_builder('get_files_id_thumbnail_id')(self.base_url, file_id=file_id, extension=extension, min_height=min_height, min_width=min_width, max_height=max_height, max_width=max_width)
+        response = self.client.get(url, params=params, follow_redirects=True)
         response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return response.content or None
 
     def get_files_id_collaborations(self, file_id: str, fields: Optional[List[str]] = None, limit: Optional[int] = None, marker: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1086,18 +2112,7 @@ class BoxApp(APIApplication):
         Tags:
             Collaborations (List)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/collaborations"
-        query_params = {k: v for k, v in [('fields', fields), ('limit', limit), ('marker', marker)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_collaborations', file_id=file_id, fields=fields, limit=limit, marker=marker)
 
     def get_files_id_comments(self, file_id: str, fields: Optional[List[str]] = None, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -1132,18 +2147,7 @@ class BoxApp(APIApplication):
         Tags:
             Comments
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/comments"
-        query_params = {k: v for k, v in [('fields', fields), ('limit', limit), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_comments', file_id=file_id, fields=fields, limit=limit, offset=offset)
 
     def get_files_id_tasks(self, file_id: str) -> dict[str, Any]:
         """
@@ -1165,18 +2169,7 @@ class BoxApp(APIApplication):
         Tags:
             Tasks
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/tasks"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_tasks', file_id=file_id)
 
     def get_files_id_trash(self, file_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -1206,18 +2199,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/trash"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_trash', file_id=file_id, fields=fields)
 
     def delete_files_id_trash(self, file_id: str) -> Any:
         """
@@ -1237,18 +2219,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/trash"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_files_id_trash', file_id=file_id)
 
     def get_files_id_versions(self, file_id: str, fields: Optional[List[str]] = None, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -1282,18 +2253,7 @@ class BoxApp(APIApplication):
         Tags:
             File versions
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/versions"
-        query_params = {k: v for k, v in [('fields', fields), ('limit', limit), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_versions', file_id=file_id, fields=fields, limit=limit, offset=offset)
 
     def get_files_id_versions_id(self, file_id: str, file_version_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -1326,20 +2286,7 @@ class BoxApp(APIApplication):
         Tags:
             File versions
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        if file_version_id is None:
-            raise ValueError("Missing required parameter 'file_version_id'.")
-        url = f"{self.base_url}/files/{file_id}/versions/{file_version_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_versions_id', file_id=file_id, file_version_id=file_version_id, fields=fields)
 
     def delete_files_id_versions_id(self, file_id: str, file_version_id: str) -> Any:
         """
@@ -1360,20 +2307,7 @@ class BoxApp(APIApplication):
         Tags:
             File versions
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        if file_version_id is None:
-            raise ValueError("Missing required parameter 'file_version_id'.")
-        url = f"{self.base_url}/files/{file_id}/versions/{file_version_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_files_id_versions_id', file_id=file_id, file_version_id=file_version_id)
 
     def put_files_id_versions_id(self, file_id: str, file_version_id: str, trashed_at: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1395,25 +2329,7 @@ class BoxApp(APIApplication):
         Tags:
             File versions
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        if file_version_id is None:
-            raise ValueError("Missing required parameter 'file_version_id'.")
-        request_body_data = None
-        request_body_data = {
-            'trashed_at': trashed_at,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}/versions/{file_version_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_files_id_versions_id', file_id=file_id, file_version_id=file_version_id, trashed_at=trashed_at)
 
     def post_files_id_versions_current(self, file_id: str, fields: Optional[List[str]] = None, id: Optional[str] = None, type: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1443,24 +2359,7 @@ class BoxApp(APIApplication):
         Tags:
             File versions
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'id': id,
-            'type': type,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}/versions/current"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_files_id_versions_current', file_id=file_id, fields=fields, id=id, type=type)
 
     def get_files_id_metadata(self, file_id: str) -> dict[str, Any]:
         """
@@ -1482,18 +2381,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/metadata"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_metadata', file_id=file_id)
 
     def get_file_security_classification_by_id(self, file_id: str) -> dict[str, Any]:
         """
@@ -1515,18 +2403,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications on files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/metadata/enterprise/securityClassification-6VMVochwUWo"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_file_security_classification_by_id', file_id=file_id)
 
     def update_file_security_classification(self, file_id: str, Box__Security__Classification__Key: Optional[str] = None) -> dict[str, Any]:
         """
@@ -1552,23 +2429,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications on files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'Box__Security__Classification__Key': Box__Security__Classification__Key,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}/metadata/enterprise/securityClassification-6VMVochwUWo"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_file_security_classification', file_id=file_id, Box__Security__Classification__Key=Box__Security__Classification__Key)
 
     def put_update_file_security_classification(self, file_id: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -1587,21 +2448,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications on files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        # Using array parameter 'items' directly as request body
-        request_body_data = items
-        url = f"{self.base_url}/files/{file_id}/metadata/enterprise/securityClassification-6VMVochwUWo"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json-patch+json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_update_file_security_classification', file_id=file_id, items=items)
 
     def delete_file_metadata(self, file_id: str) -> Any:
         """
@@ -1621,18 +2468,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications on files
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/metadata/enterprise/securityClassification-6VMVochwUWo"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_file_metadata', file_id=file_id)
 
     def get_files_id_metadata_id_id(self, file_id: str, scope: str, template_key: str) -> dict[str, Any]:
         """
@@ -1655,22 +2491,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        url = f"{self.base_url}/files/{file_id}/metadata/{scope}/{template_key}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_metadata_id_id', file_id=file_id, scope=scope, template_key=template_key)
 
     def post_files_id_metadata_id_id(self, file_id: str, scope: str, template_key: str, request_body: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -1693,24 +2514,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        request_body_data = None
-        request_body_data = request_body if request_body is not None else {}
-        url = f"{self.base_url}/files/{file_id}/metadata/{scope}/{template_key}"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_files_id_metadata_id_id', file_id=file_id, scope=scope, template_key=template_key, request_body=request_body)
 
     def put_files_id_metadata_id_id(self, file_id: str, scope: str, template_key: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -1732,25 +2536,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        request_body_data = None
-        # Using array parameter 'items' directly as request body
-        request_body_data = items
-        url = f"{self.base_url}/files/{file_id}/metadata/{scope}/{template_key}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json-patch+json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_files_id_metadata_id_id', file_id=file_id, scope=scope, template_key=template_key, items=items)
 
     def delete_files_id_metadata_id_id(self, file_id: str, scope: str, template_key: str) -> Any:
         """
@@ -1772,22 +2558,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        url = f"{self.base_url}/files/{file_id}/metadata/{scope}/{template_key}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_files_id_metadata_id_id', file_id=file_id, scope=scope, template_key=template_key)
 
     def get_global_metadata(self, file_id: str) -> dict[str, Any]:
         """
@@ -1809,18 +2580,7 @@ class BoxApp(APIApplication):
         Tags:
             Skills
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/metadata/global/boxSkillsCards"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_global_metadata', file_id=file_id)
 
     def post_file_metadata_global_box_skills_cards(self, file_id: str, cards: Optional[List[Any]] = None) -> dict[str, Any]:
         """
@@ -1841,23 +2601,7 @@ class BoxApp(APIApplication):
         Tags:
             Skills
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'cards': cards,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}/metadata/global/boxSkillsCards"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_file_metadata_global_box_skills_cards', file_id=file_id, cards=cards)
 
     def update_file_metadata(self, file_id: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -1877,21 +2621,7 @@ class BoxApp(APIApplication):
         Tags:
             Skills
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        # Using array parameter 'items' directly as request body
-        request_body_data = items
-        url = f"{self.base_url}/files/{file_id}/metadata/global/boxSkillsCards"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json-patch+json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_file_metadata', file_id=file_id, items=items)
 
     def delete_file_global_box_skills_cards(self, file_id: str) -> Any:
         """
@@ -1911,18 +2641,7 @@ class BoxApp(APIApplication):
         Tags:
             Skills
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/metadata/global/boxSkillsCards"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_file_global_box_skills_cards', file_id=file_id)
 
     def get_files_id_watermark(self, file_id: str) -> dict[str, Any]:
         """
@@ -1942,18 +2661,7 @@ class BoxApp(APIApplication):
         Tags:
             Watermarks (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/watermark"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_watermark', file_id=file_id)
 
     def put_files_id_watermark(self, file_id: str, watermark: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -1974,23 +2682,7 @@ class BoxApp(APIApplication):
         Tags:
             Watermarks (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'watermark': watermark,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}/watermark"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_files_id_watermark', file_id=file_id, watermark=watermark)
 
     def delete_files_id_watermark(self, file_id: str) -> Any:
         """
@@ -2009,18 +2701,7 @@ class BoxApp(APIApplication):
         Tags:
             Watermarks (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}/watermark"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_files_id_watermark', file_id=file_id)
 
     def get_file_requests_id(self, file_request_id: str) -> dict[str, Any]:
         """
@@ -2039,18 +2720,7 @@ class BoxApp(APIApplication):
         Tags:
             File requests
         """
-        if file_request_id is None:
-            raise ValueError("Missing required parameter 'file_request_id'.")
-        url = f"{self.base_url}/file_requests/{file_request_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_file_requests_id', file_request_id=file_request_id)
 
     def put_file_requests_id(self, file_request_id: str, title: Optional[str] = None, description: Optional[str] = None, status: Optional[str] = None, is_email_required: Optional[bool] = None, is_description_required: Optional[bool] = None, expires_at: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2106,28 +2776,7 @@ class BoxApp(APIApplication):
         Tags:
             File requests
         """
-        if file_request_id is None:
-            raise ValueError("Missing required parameter 'file_request_id'.")
-        request_body_data = None
-        request_body_data = {
-            'title': title,
-            'description': description,
-            'status': status,
-            'is_email_required': is_email_required,
-            'is_description_required': is_description_required,
-            'expires_at': expires_at,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/file_requests/{file_request_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_file_requests_id', file_request_id=file_request_id, title=title, description=description, status=status, is_email_required=is_email_required, is_description_required=is_description_required, expires_at=expires_at)
 
     def delete_file_requests_id(self, file_request_id: str) -> Any:
         """
@@ -2147,18 +2796,7 @@ class BoxApp(APIApplication):
         Tags:
             File requests
         """
-        if file_request_id is None:
-            raise ValueError("Missing required parameter 'file_request_id'.")
-        url = f"{self.base_url}/file_requests/{file_request_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_file_requests_id', file_request_id=file_request_id)
 
     def post_file_requests_id_copy(self, file_request_id: str, title: Optional[str] = None, description: Optional[str] = None, status: Optional[str] = None, is_email_required: Optional[bool] = None, is_description_required: Optional[bool] = None, expires_at: Optional[str] = None, folder: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2215,29 +2853,7 @@ class BoxApp(APIApplication):
         Tags:
             File requests
         """
-        if file_request_id is None:
-            raise ValueError("Missing required parameter 'file_request_id'.")
-        request_body_data = None
-        request_body_data = {
-            'title': title,
-            'description': description,
-            'status': status,
-            'is_email_required': is_email_required,
-            'is_description_required': is_description_required,
-            'expires_at': expires_at,
-            'folder': folder,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/file_requests/{file_request_id}/copy"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_file_requests_id_copy', file_request_id=file_request_id, title=title, description=description, status=status, is_email_required=is_email_required, is_description_required=is_description_required, expires_at=expires_at, folder=folder)
 
     def get_folders_id(self, folder_id: str, fields: Optional[List[str]] = None, sort: Optional[str] = None, direction: Optional[str] = None, offset: Optional[int] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -2316,18 +2932,7 @@ class BoxApp(APIApplication):
         Tags:
             Folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}"
-        query_params = {k: v for k, v in [('fields', fields), ('sort', sort), ('direction', direction), ('offset', offset), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_id', folder_id=folder_id, fields=fields, sort=sort, direction=direction, offset=offset, limit=limit)
 
     def post_folders_id(self, folder_id: str, fields: Optional[List[str]] = None, name: Optional[str] = None, parent: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -2357,24 +2962,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'parent': parent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders/{folder_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_folders_id', folder_id=folder_id, fields=fields, name=name, parent=parent)
 
     def put_folders_id(self, folder_id: str, fields: Optional[List[str]] = None, name: Optional[str] = None, description: Optional[str] = None, sync_state: Optional[str] = None, can_non_owners_invite: Optional[bool] = None, parent: Optional[Any] = None, shared_link: Optional[Any] = None, folder_upload_email: Optional[Any] = None, tags: Optional[List[str]] = None, is_collaboration_restricted_to_enterprise: Optional[bool] = None, collections: Optional[List[dict[str, Any]]] = None, can_non_owners_view_collaborators: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -2462,33 +3050,7 @@ class BoxApp(APIApplication):
         Tags:
             Folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'description': description,
-            'sync_state': sync_state,
-            'can_non_owners_invite': can_non_owners_invite,
-            'parent': parent,
-            'shared_link': shared_link,
-            'folder_upload_email': folder_upload_email,
-            'tags': tags,
-            'is_collaboration_restricted_to_enterprise': is_collaboration_restricted_to_enterprise,
-            'collections': collections,
-            'can_non_owners_view_collaborators': can_non_owners_view_collaborators,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders/{folder_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_folders_id', folder_id=folder_id, fields=fields, name=name, description=description, sync_state=sync_state, can_non_owners_invite=can_non_owners_invite, parent=parent, shared_link=shared_link, folder_upload_email=folder_upload_email, tags=tags, is_collaboration_restricted_to_enterprise=is_collaboration_restricted_to_enterprise, collections=collections, can_non_owners_view_collaborators=can_non_owners_view_collaborators)
 
     def delete_folders_id(self, folder_id: str, recursive: Optional[bool] = None) -> Any:
         """
@@ -2510,18 +3072,7 @@ class BoxApp(APIApplication):
         Tags:
             Folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}"
-        query_params = {k: v for k, v in [('recursive', recursive)] if v is not None}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_folders_id', folder_id=folder_id, recursive=recursive)
 
     def get_folder_app_item_associations(self, folder_id: str, limit: Optional[int] = None, marker: Optional[str] = None, application_type: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2548,18 +3099,7 @@ class BoxApp(APIApplication):
         Tags:
             App item associations
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/app_item_associations"
-        query_params = {k: v for k, v in [('limit', limit), ('marker', marker), ('application_type', application_type)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folder_app_item_associations', folder_id=folder_id, limit=limit, marker=marker, application_type=application_type)
 
     def get_folders_id_items(self, folder_id: str, fields: Optional[List[str]] = None, usemarker: Optional[bool] = None, marker: Optional[str] = None, offset: Optional[int] = None, limit: Optional[int] = None, sort: Optional[str] = None, direction: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2639,18 +3179,7 @@ class BoxApp(APIApplication):
         Tags:
             Folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/items"
-        query_params = {k: v for k, v in [('fields', fields), ('usemarker', usemarker), ('marker', marker), ('offset', offset), ('limit', limit), ('sort', sort), ('direction', direction)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_id_items', folder_id=folder_id, fields=fields, usemarker=usemarker, marker=marker, offset=offset, limit=limit, sort=sort, direction=direction)
 
     def post_folders(self, fields: Optional[List[str]] = None, name: Optional[str] = None, parent: Optional[dict[str, Any]] = None, folder_upload_email: Optional[Any] = None, sync_state: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2696,24 +3225,7 @@ class BoxApp(APIApplication):
         Tags:
             Folders
         """
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'parent': parent,
-            'folder_upload_email': folder_upload_email,
-            'sync_state': sync_state,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_folders', fields=fields, name=name, parent=parent, folder_upload_email=folder_upload_email, sync_state=sync_state)
 
     def post_folders_id_copy(self, folder_id: str, fields: Optional[List[str]] = None, name: Optional[str] = None, parent: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -2755,24 +3267,7 @@ class BoxApp(APIApplication):
         Tags:
             Folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'parent': parent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders/{folder_id}/copy"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_folders_id_copy', folder_id=folder_id, fields=fields, name=name, parent=parent)
 
     def get_folders_id_collaborations(self, folder_id: str, fields: Optional[List[str]] = None, limit: Optional[int] = None, marker: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2810,18 +3305,7 @@ class BoxApp(APIApplication):
         Tags:
             Collaborations (List)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/collaborations"
-        query_params = {k: v for k, v in [('fields', fields), ('limit', limit), ('marker', marker)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_id_collaborations', folder_id=folder_id, fields=fields, limit=limit, marker=marker)
 
     def get_folders_id_trash(self, folder_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -2851,18 +3335,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/trash"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_id_trash', folder_id=folder_id, fields=fields)
 
     def delete_folders_id_trash(self, folder_id: str) -> Any:
         """
@@ -2882,18 +3355,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/trash"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_folders_id_trash', folder_id=folder_id)
 
     def get_folders_id_metadata(self, folder_id: str) -> dict[str, Any]:
         """
@@ -2915,18 +3377,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/metadata"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_id_metadata', folder_id=folder_id)
 
     def get_folder_security_classification(self, folder_id: str) -> dict[str, Any]:
         """
@@ -2948,18 +3399,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications on folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/metadata/enterprise/securityClassification-6VMVochwUWo"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folder_security_classification', folder_id=folder_id)
 
     def post_folder_metadata_security_classification(self, folder_id: str, Box__Security__Classification__Key: Optional[str] = None) -> dict[str, Any]:
         """
@@ -2985,23 +3425,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications on folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        request_body_data = {
-            'Box__Security__Classification__Key': Box__Security__Classification__Key,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders/{folder_id}/metadata/enterprise/securityClassification-6VMVochwUWo"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_folder_metadata_security_classification', folder_id=folder_id, Box__Security__Classification__Key=Box__Security__Classification__Key)
 
     def update_folder_security_classification(self, folder_id: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3020,21 +3444,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications on folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        # Using array parameter 'items' directly as request body
-        request_body_data = items
-        url = f"{self.base_url}/folders/{folder_id}/metadata/enterprise/securityClassification-6VMVochwUWo"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json-patch+json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_folder_security_classification', folder_id=folder_id, items=items)
 
     def delete_security_classification_by_folder_id(self, folder_id: str) -> Any:
         """
@@ -3054,18 +3464,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications on folders
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/metadata/enterprise/securityClassification-6VMVochwUWo"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_security_classification_by_folder_id', folder_id=folder_id)
 
     def get_folders_id_metadata_id_id(self, folder_id: str, scope: str, template_key: str) -> dict[str, Any]:
         """
@@ -3088,22 +3487,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        url = f"{self.base_url}/folders/{folder_id}/metadata/{scope}/{template_key}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_id_metadata_id_id', folder_id=folder_id, scope=scope, template_key=template_key)
 
     def post_folders_id_metadata_id_id(self, folder_id: str, scope: str, template_key: str, request_body: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -3126,24 +3510,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        request_body_data = None
-        request_body_data = request_body if request_body is not None else {}
-        url = f"{self.base_url}/folders/{folder_id}/metadata/{scope}/{template_key}"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_folders_id_metadata_id_id', folder_id=folder_id, scope=scope, template_key=template_key, request_body=request_body)
 
     def put_folders_id_metadata_id_id(self, folder_id: str, scope: str, template_key: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3165,25 +3532,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        request_body_data = None
-        # Using array parameter 'items' directly as request body
-        request_body_data = items
-        url = f"{self.base_url}/folders/{folder_id}/metadata/{scope}/{template_key}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json-patch+json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_folders_id_metadata_id_id', folder_id=folder_id, scope=scope, template_key=template_key, items=items)
 
     def delete_folder_metadata(self, folder_id: str, scope: str, template_key: str) -> Any:
         """
@@ -3205,22 +3554,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata instances (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        url = f"{self.base_url}/folders/{folder_id}/metadata/{scope}/{template_key}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_folder_metadata', folder_id=folder_id, scope=scope, template_key=template_key)
 
     def get_folders_trash_items(self, fields: Optional[List[str]] = None, limit: Optional[int] = None, offset: Optional[int] = None, usemarker: Optional[bool] = None, marker: Optional[str] = None, direction: Optional[str] = None, sort: Optional[str] = None) -> dict[str, Any]:
         """
@@ -3274,16 +3608,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed items
         """
-        url = f"{self.base_url}/folders/trash/items"
-        query_params = {k: v for k, v in [('fields', fields), ('limit', limit), ('offset', offset), ('usemarker', usemarker), ('marker', marker), ('direction', direction), ('sort', sort)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_trash_items', fields=fields, limit=limit, offset=offset, usemarker=usemarker, marker=marker, direction=direction, sort=sort)
 
     def get_folders_id_watermark(self, folder_id: str) -> dict[str, Any]:
         """
@@ -3303,18 +3628,7 @@ class BoxApp(APIApplication):
         Tags:
             Watermarks (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/watermark"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_id_watermark', folder_id=folder_id)
 
     def put_folders_id_watermark(self, folder_id: str, watermark: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -3335,23 +3649,7 @@ class BoxApp(APIApplication):
         Tags:
             Watermarks (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        request_body_data = {
-            'watermark': watermark,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders/{folder_id}/watermark"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_folders_id_watermark', folder_id=folder_id, watermark=watermark)
 
     def delete_folders_id_watermark(self, folder_id: str) -> Any:
         """
@@ -3368,21 +3666,10 @@ class BoxApp(APIApplication):
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
             JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
-        Tags:
-            Watermarks (Folders)
-        """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}/watermark"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        Tags:
+            Watermarks (Folders)
+        """
+        return self._call('delete_folders_id_watermark', folder_id=folder_id)
 
     def get_folder_locks(self, folder_id: str) -> dict[str, Any]:
         """
@@ -3411,16 +3698,7 @@ class BoxApp(APIApplication):
         Tags:
             Folder Locks
         """
-        url = f"{self.base_url}/folder_locks"
-        query_params = {k: v for k, v in [('folder_id', folder_id)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folder_locks', folder_id=folder_id)
 
     def post_folder_locks(self, locked_operations: Optional[dict[str, Any]] = None, folder: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -3443,22 +3721,7 @@ class BoxApp(APIApplication):
         Tags:
             Folder Locks
         """
-        request_body_data = None
-        request_body_data = {
-            'locked_operations': locked_operations,
-            'folder': folder,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folder_locks"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_folder_locks', locked_operations=locked_operations, folder=folder)
 
     def delete_folder_locks_id(self, folder_lock_id: str) -> Any:
         """
@@ -3477,18 +3740,7 @@ class BoxApp(APIApplication):
         Tags:
             Folder Locks
         """
-        if folder_lock_id is None:
-            raise ValueError("Missing required parameter 'folder_lock_id'.")
-        url = f"{self.base_url}/folder_locks/{folder_lock_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_folder_locks_id', folder_lock_id=folder_lock_id)
 
     def get_metadata_templates(self, metadata_instance_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -3513,16 +3765,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata templates
         """
-        url = f"{self.base_url}/metadata_templates"
-        query_params = {k: v for k, v in [('metadata_instance_id', metadata_instance_id), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_metadata_templates', metadata_instance_id=metadata_instance_id, marker=marker, limit=limit)
 
     def get_security_classification_schema(self) -> dict[str, Any]:
         """
@@ -3540,16 +3783,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications
         """
-        url = f"{self.base_url}/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_security_classification_schema')
 
     def add_security_classification_schema(self, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3569,19 +3803,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications
         """
-        request_body_data = None
-        # Using array parameter 'items' directly as request body
-        request_body_data = items
-        url = f"{self.base_url}/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema#add"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('add_security_classification_schema', items=items)
 
     def update_security_classification_schema(self, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3601,19 +3823,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications
         """
-        request_body_data = None
-        # Using array parameter 'items' directly as request body
-        request_body_data = items
-        url = f"{self.base_url}/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema#update"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json-patch+json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_security_classification_schema', items=items)
 
     def get_schema_template(self, scope: str, template_key: str) -> dict[str, Any]:
         """
@@ -3634,20 +3844,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata templates
         """
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        url = f"{self.base_url}/metadata_templates/{scope}/{template_key}/schema"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_schema_template', scope=scope, template_key=template_key)
 
     def update_schema_template(self, scope: str, template_key: str, items: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3668,23 +3865,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata templates
         """
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        request_body_data = None
-        # Using array parameter 'items' directly as request body
-        request_body_data = items
-        url = f"{self.base_url}/metadata_templates/{scope}/{template_key}/schema"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json-patch+json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_schema_template', scope=scope, template_key=template_key, items=items)
 
     def delete_metadata_template_schema(self, scope: str, template_key: str) -> Any:
         """
@@ -3705,20 +3886,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata templates
         """
-        if scope is None:
-            raise ValueError("Missing required parameter 'scope'.")
-        if template_key is None:
-            raise ValueError("Missing required parameter 'template_key'.")
-        url = f"{self.base_url}/metadata_templates/{scope}/{template_key}/schema"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_metadata_template_schema', scope=scope, template_key=template_key)
 
     def get_metadata_templates_id(self, template_id: str) -> dict[str, Any]:
         """
@@ -3737,18 +3905,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata templates
         """
-        if template_id is None:
-            raise ValueError("Missing required parameter 'template_id'.")
-        url = f"{self.base_url}/metadata_templates/{template_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_metadata_templates_id', template_id=template_id)
 
     def get_metadata_templates_global(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -3772,16 +3929,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata templates
         """
-        url = f"{self.base_url}/metadata_templates/global"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_metadata_templates_global', marker=marker, limit=limit)
 
     def get_metadata_templates_enterprise(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -3805,16 +3953,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata templates
         """
-        url = f"{self.base_url}/metadata_templates/enterprise"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_metadata_templates_enterprise', marker=marker, limit=limit)
 
     def post_metadata_templates_schema(self, scope: Optional[str] = None, templateKey: Optional[str] = None, displayName: Optional[str] = None, hidden: Optional[bool] = None, fields: Optional[List[dict[str, Any]]] = None, copyInstanceOnItemCopy: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -3853,26 +3992,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata templates
         """
-        request_body_data = None
-        request_body_data = {
-            'scope': scope,
-            'templateKey': templateKey,
-            'displayName': displayName,
-            'hidden': hidden,
-            'fields': fields,
-            'copyInstanceOnItemCopy': copyInstanceOnItemCopy,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/metadata_templates/schema"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_metadata_templates_schema', scope=scope, templateKey=templateKey, displayName=displayName, hidden=hidden, fields=fields, copyInstanceOnItemCopy=copyInstanceOnItemCopy)
 
     def create_metadata_template_classification(self, scope: Optional[str] = None, templateKey: Optional[str] = None, displayName: Optional[str] = None, hidden: Optional[bool] = None, copyInstanceOnItemCopy: Optional[bool] = None, fields: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -3907,26 +4027,7 @@ class BoxApp(APIApplication):
         Tags:
             Classifications
         """
-        request_body_data = None
-        request_body_data = {
-            'scope': scope,
-            'templateKey': templateKey,
-            'displayName': displayName,
-            'hidden': hidden,
-            'copyInstanceOnItemCopy': copyInstanceOnItemCopy,
-            'fields': fields,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/metadata_templates/schema#classifications"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_metadata_template_classification', scope=scope, templateKey=templateKey, displayName=displayName, hidden=hidden, copyInstanceOnItemCopy=copyInstanceOnItemCopy, fields=fields)
 
     def get_metadata_cascade_policies(self, folder_id: str, owner_enterprise_id: Optional[str] = None, marker: Optional[str] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -3958,16 +4059,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata cascade policies
         """
-        url = f"{self.base_url}/metadata_cascade_policies"
-        query_params = {k: v for k, v in [('folder_id', folder_id), ('owner_enterprise_id', owner_enterprise_id), ('marker', marker), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_metadata_cascade_policies', folder_id=folder_id, owner_enterprise_id=owner_enterprise_id, marker=marker, offset=offset)
 
     def post_metadata_cascade_policies(self, folder_id: Optional[str] = None, scope: Optional[str] = None, templateKey: Optional[str] = None) -> dict[str, Any]:
         """
@@ -4005,23 +4097,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata cascade policies
         """
-        request_body_data = None
-        request_body_data = {
-            'folder_id': folder_id,
-            'scope': scope,
-            'templateKey': templateKey,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/metadata_cascade_policies"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_metadata_cascade_policies', folder_id=folder_id, scope=scope, templateKey=templateKey)
 
     def get_metadata_cascade_policy_by_id(self, metadata_cascade_policy_id: str) -> dict[str, Any]:
         """
@@ -4040,18 +4116,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata cascade policies
         """
-        if metadata_cascade_policy_id is None:
-            raise ValueError("Missing required parameter 'metadata_cascade_policy_id'.")
-        url = f"{self.base_url}/metadata_cascade_policies/{metadata_cascade_policy_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_metadata_cascade_policy_by_id', metadata_cascade_policy_id=metadata_cascade_policy_id)
 
     def delete_metadata_cascade_policy(self, metadata_cascade_policy_id: str) -> Any:
         """
@@ -4071,18 +4136,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata cascade policies
         """
-        if metadata_cascade_policy_id is None:
-            raise ValueError("Missing required parameter 'metadata_cascade_policy_id'.")
-        url = f"{self.base_url}/metadata_cascade_policies/{metadata_cascade_policy_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_metadata_cascade_policy', metadata_cascade_policy_id=metadata_cascade_policy_id)
 
     def apply_metadata_cascade_policy_by_id(self, metadata_cascade_policy_id: str, conflict_resolution: Optional[str] = None) -> Any:
         """
@@ -4113,23 +4167,7 @@ class BoxApp(APIApplication):
         Tags:
             Metadata cascade policies
         """
-        if metadata_cascade_policy_id is None:
-            raise ValueError("Missing required parameter 'metadata_cascade_policy_id'.")
-        request_body_data = None
-        request_body_data = {
-            'conflict_resolution': conflict_resolution,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/metadata_cascade_policies/{metadata_cascade_policy_id}/apply"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('apply_metadata_cascade_policy_by_id', metadata_cascade_policy_id=metadata_cascade_policy_id, conflict_resolution=conflict_resolution)
 
     def execute_metadata_query(self, from_: Optional[str] = None, query: Optional[str] = None, query_params: Optional[dict[str, Any]] = None, ancestor_folder_id: Optional[str] = None, order_by: Optional[List[dict[str, Any]]] = None, limit: Optional[int] = None, marker: Optional[str] = None, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -4191,28 +4229,7 @@ class BoxApp(APIApplication):
         Tags:
             Search
         """
-        request_body_data = None
-        request_body_data = {
-            'from': from_,
-            'query': query,
-            'query_params': query_params,
-            'ancestor_folder_id': ancestor_folder_id,
-            'order_by': order_by,
-            'limit': limit,
-            'marker': marker,
-            'fields': fields,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/metadata_queries/execute_read"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('execute_metadata_query', from_=from_, query=query, query_params=query_params, ancestor_folder_id=ancestor_folder_id, order_by=order_by, limit=limit, marker=marker, fields=fields)
 
     def get_comments_id(self, comment_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -4240,18 +4257,7 @@ class BoxApp(APIApplication):
         Tags:
             Comments
         """
-        if comment_id is None:
-            raise ValueError("Missing required parameter 'comment_id'.")
-        url = f"{self.base_url}/comments/{comment_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_comments_id', comment_id=comment_id, fields=fields)
 
     def put_comments_id(self, comment_id: str, fields: Optional[List[str]] = None, message: Optional[str] = None) -> dict[str, Any]:
         """
@@ -4280,23 +4286,7 @@ class BoxApp(APIApplication):
         Tags:
             Comments
         """
-        if comment_id is None:
-            raise ValueError("Missing required parameter 'comment_id'.")
-        request_body_data = None
-        request_body_data = {
-            'message': message,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/comments/{comment_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_comments_id', comment_id=comment_id, fields=fields, message=message)
 
     def delete_comments_id(self, comment_id: str) -> Any:
         """
@@ -4315,18 +4305,7 @@ class BoxApp(APIApplication):
         Tags:
             Comments
         """
-        if comment_id is None:
-            raise ValueError("Missing required parameter 'comment_id'.")
-        url = f"{self.base_url}/comments/{comment_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_comments_id', comment_id=comment_id)
 
     def post_comments(self, fields: Optional[List[str]] = None, message: Optional[str] = None, tagged_message: Optional[str] = None, item: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -4373,23 +4352,7 @@ class BoxApp(APIApplication):
         Tags:
             Comments
         """
-        request_body_data = None
-        request_body_data = {
-            'message': message,
-            'tagged_message': tagged_message,
-            'item': item,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/comments"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_comments', fields=fields, message=message, tagged_message=tagged_message, item=item)
 
     def get_collaborations_id(self, collaboration_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -4417,18 +4380,7 @@ class BoxApp(APIApplication):
         Tags:
             Collaborations
         """
-        if collaboration_id is None:
-            raise ValueError("Missing required parameter 'collaboration_id'.")
-        url = f"{self.base_url}/collaborations/{collaboration_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_collaborations_id', collaboration_id=collaboration_id, fields=fields)
 
     def put_collaborations_id(self, collaboration_id: str, role: Optional[str] = None, status: Optional[str] = None, expires_at: Optional[str] = None, can_view_path: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -4477,26 +4429,7 @@ class BoxApp(APIApplication):
         Tags:
             Collaborations
         """
-        if collaboration_id is None:
-            raise ValueError("Missing required parameter 'collaboration_id'.")
-        request_body_data = None
-        request_body_data = {
-            'role': role,
-            'status': status,
-            'expires_at': expires_at,
-            'can_view_path': can_view_path,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/collaborations/{collaboration_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_collaborations_id', collaboration_id=collaboration_id, role=role, status=status, expires_at=expires_at, can_view_path=can_view_path)
 
     def delete_collaborations_id(self, collaboration_id: str) -> Any:
         """
@@ -4516,18 +4449,7 @@ class BoxApp(APIApplication):
         Tags:
             Collaborations
         """
-        if collaboration_id is None:
-            raise ValueError("Missing required parameter 'collaboration_id'.")
-        url = f"{self.base_url}/collaborations/{collaboration_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_collaborations_id', collaboration_id=collaboration_id)
 
     def get_collaborations(self, status: str, fields: Optional[List[str]] = None, offset: Optional[int] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -4564,16 +4486,7 @@ class BoxApp(APIApplication):
         Tags:
             Collaborations (List)
         """
-        url = f"{self.base_url}/collaborations"
-        query_params = {k: v for k, v in [('status', status), ('fields', fields), ('offset', offset), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_collaborations', status=status, fields=fields, offset=offset, limit=limit)
 
     def post_collaborations(self, fields: Optional[List[str]] = None, notify: Optional[bool] = None, item: Optional[dict[str, Any]] = None, accessible_by: Optional[dict[str, Any]] = None, role: Optional[str] = None, is_access_only: Optional[bool] = None, can_view_path: Optional[bool] = None, expires_at: Optional[str] = None) -> dict[str, Any]:
         """
@@ -4632,26 +4545,7 @@ class BoxApp(APIApplication):
         Tags:
             Collaborations
         """
-        request_body_data = None
-        request_body_data = {
-            'item': item,
-            'accessible_by': accessible_by,
-            'role': role,
-            'is_access_only': is_access_only,
-            'can_view_path': can_view_path,
-            'expires_at': expires_at,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/collaborations"
-        query_params = {k: v for k, v in [('fields', fields), ('notify', notify)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_collaborations', fields=fields, notify=notify, item=item, accessible_by=accessible_by, role=role, is_access_only=is_access_only, can_view_path=can_view_path, expires_at=expires_at)
 
     def get_search(self, query: Optional[str] = None, scope: Optional[str] = None, file_extensions: Optional[List[str]] = None, created_at_range: Optional[List[str]] = None, updated_at_range: Optional[List[str]] = None, size_range: Optional[List[int]] = None, owner_user_ids: Optional[List[str]] = None, recent_updater_user_ids: Optional[List[str]] = None, ancestor_folder_ids: Optional[List[str]] = None, content_types: Optional[List[str]] = None, type: Optional[str] = None, trash_content: Optional[str] = None, mdfilters: Optional[List[dict[str, Any]]] = None, sort: Optional[str] = None, direction: Optional[str] = None, limit: Optional[int] = None, include_recent_shared_links: Optional[bool] = None, fields: Optional[List[str]] = None, offset: Optional[int] = None, deleted_user_ids: Optional[List[str]] = None, deleted_at_range: Optional[List[str]] = None) -> Any:
         """
@@ -4887,16 +4781,7 @@ class BoxApp(APIApplication):
         Tags:
             Search
         """
-        url = f"{self.base_url}/search"
-        query_params = {k: v for k, v in [('query', query), ('scope', scope), ('file_extensions', file_extensions), ('created_at_range', created_at_range), ('updated_at_range', updated_at_range), ('size_range', size_range), ('owner_user_ids', owner_user_ids), ('recent_updater_user_ids', recent_updater_user_ids), ('ancestor_folder_ids', ancestor_folder_ids), ('content_types', content_types), ('type', type), ('trash_content', trash_content), ('mdfilters', mdfilters), ('sort', sort), ('direction', direction), ('limit', limit), ('include_recent_shared_links', include_recent_shared_links), ('fields', fields), ('offset', offset), ('deleted_user_ids', deleted_user_ids), ('deleted_at_range', deleted_at_range)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_search', query=query, scope=scope, file_extensions=file_extensions, created_at_range=created_at_range, updated_at_range=updated_at_range, size_range=size_range, owner_user_ids=owner_user_ids, recent_updater_user_ids=recent_updater_user_ids, ancestor_folder_ids=ancestor_folder_ids, content_types=content_types, type=type, trash_content=trash_content, mdfilters=mdfilters, sort=sort, direction=direction, limit=limit, include_recent_shared_links=include_recent_shared_links, fields=fields, offset=offset, deleted_user_ids=deleted_user_ids, deleted_at_range=deleted_at_range)
 
     def post_tasks(self, item: Optional[dict[str, Any]] = None, action: Optional[str] = None, message: Optional[str] = None, due_at: Optional[str] = None, completion_rule: Optional[str] = None) -> dict[str, Any]:
         """
@@ -4930,25 +4815,7 @@ class BoxApp(APIApplication):
         Tags:
             Tasks
         """
-        request_body_data = None
-        request_body_data = {
-            'item': item,
-            'action': action,
-            'message': message,
-            'due_at': due_at,
-            'completion_rule': completion_rule,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/tasks"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_tasks', item=item, action=action, message=message, due_at=due_at, completion_rule=completion_rule)
 
     def get_tasks_id(self, task_id: str) -> dict[str, Any]:
         """
@@ -4967,18 +4834,7 @@ class BoxApp(APIApplication):
         Tags:
             Tasks
         """
-        if task_id is None:
-            raise ValueError("Missing required parameter 'task_id'.")
-        url = f"{self.base_url}/tasks/{task_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_tasks_id', task_id=task_id)
 
     def put_tasks_id(self, task_id: str, action: Optional[str] = None, message: Optional[str] = None, due_at: Optional[str] = None, completion_rule: Optional[str] = None) -> dict[str, Any]:
         """
@@ -5011,26 +4867,7 @@ class BoxApp(APIApplication):
         Tags:
             Tasks
         """
-        if task_id is None:
-            raise ValueError("Missing required parameter 'task_id'.")
-        request_body_data = None
-        request_body_data = {
-            'action': action,
-            'message': message,
-            'due_at': due_at,
-            'completion_rule': completion_rule,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/tasks/{task_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_tasks_id', task_id=task_id, action=action, message=message, due_at=due_at, completion_rule=completion_rule)
 
     def delete_tasks_id(self, task_id: str) -> Any:
         """
@@ -5049,18 +4886,7 @@ class BoxApp(APIApplication):
         Tags:
             Tasks
         """
-        if task_id is None:
-            raise ValueError("Missing required parameter 'task_id'.")
-        url = f"{self.base_url}/tasks/{task_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_tasks_id', task_id=task_id)
 
     def get_tasks_id_assignments(self, task_id: str) -> dict[str, Any]:
         """
@@ -5080,18 +4906,7 @@ class BoxApp(APIApplication):
         Tags:
             Task assignments
         """
-        if task_id is None:
-            raise ValueError("Missing required parameter 'task_id'.")
-        url = f"{self.base_url}/tasks/{task_id}/assignments"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_tasks_id_assignments', task_id=task_id)
 
     def post_task_assignments(self, task: Optional[dict[str, Any]] = None, assign_to: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5111,22 +4926,7 @@ class BoxApp(APIApplication):
         Tags:
             Task assignments
         """
-        request_body_data = None
-        request_body_data = {
-            'task': task,
-            'assign_to': assign_to,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/task_assignments"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_task_assignments', task=task, assign_to=assign_to)
 
     def get_task_assignments_id(self, task_assignment_id: str) -> dict[str, Any]:
         """
@@ -5146,18 +4946,7 @@ class BoxApp(APIApplication):
         Tags:
             Task assignments
         """
-        if task_assignment_id is None:
-            raise ValueError("Missing required parameter 'task_assignment_id'.")
-        url = f"{self.base_url}/task_assignments/{task_assignment_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_task_assignments_id', task_assignment_id=task_assignment_id)
 
     def put_task_assignments_id(self, task_assignment_id: str, message: Optional[str] = None, resolution_state: Optional[str] = None) -> dict[str, Any]:
         """
@@ -5183,24 +4972,7 @@ class BoxApp(APIApplication):
         Tags:
             Task assignments
         """
-        if task_assignment_id is None:
-            raise ValueError("Missing required parameter 'task_assignment_id'.")
-        request_body_data = None
-        request_body_data = {
-            'message': message,
-            'resolution_state': resolution_state,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/task_assignments/{task_assignment_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_task_assignments_id', task_assignment_id=task_assignment_id, message=message, resolution_state=resolution_state)
 
     def delete_task_assignments_id(self, task_assignment_id: str) -> Any:
         """
@@ -5220,18 +4992,7 @@ class BoxApp(APIApplication):
         Tags:
             Task assignments
         """
-        if task_assignment_id is None:
-            raise ValueError("Missing required parameter 'task_assignment_id'.")
-        url = f"{self.base_url}/task_assignments/{task_assignment_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_task_assignments_id', task_assignment_id=task_assignment_id)
 
     def get_shared_items(self, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -5259,16 +5020,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Files)
         """
-        url = f"{self.base_url}/shared_items"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shared_items', fields=fields)
 
     def get_files_id_get_shared_link(self, file_id: str, fields: str) -> dict[str, Any]:
         """
@@ -5290,18 +5042,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        url = f"{self.base_url}/files/{file_id}#get_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_id_get_shared_link', file_id=file_id, fields=fields)
 
     def put_files_id_add_shared_link(self, file_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5326,23 +5067,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}#add_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_files_id_add_shared_link', file_id=file_id, fields=fields, shared_link=shared_link)
 
     def update_file_shared_link(self, file_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5365,23 +5090,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}#update_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_file_shared_link', file_id=file_id, fields=fields, shared_link=shared_link)
 
     def remove_shared_link_by_id(self, file_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5404,23 +5113,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Files)
         """
-        if file_id is None:
-            raise ValueError("Missing required parameter 'file_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/files/{file_id}#remove_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('remove_shared_link_by_id', file_id=file_id, fields=fields, shared_link=shared_link)
 
     def get_shared_items_folders(self, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -5448,16 +5141,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Folders)
         """
-        url = f"{self.base_url}/shared_items#folders"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shared_items_folders', fields=fields)
 
     def get_folders_id_get_shared_link(self, folder_id: str, fields: str) -> dict[str, Any]:
         """
@@ -5479,18 +5163,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        url = f"{self.base_url}/folders/{folder_id}#get_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_folders_id_get_shared_link', folder_id=folder_id, fields=fields)
 
     def put_folders_id_add_shared_link(self, folder_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5516,23 +5189,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders/{folder_id}#add_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_folders_id_add_shared_link', folder_id=folder_id, fields=fields, shared_link=shared_link)
 
     def update_shared_linkfolder(self, folder_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5555,23 +5212,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders/{folder_id}#update_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_shared_linkfolder', folder_id=folder_id, fields=fields, shared_link=shared_link)
 
     def remove_shared_link_by_folder_id(self, folder_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5594,23 +5235,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Folders)
         """
-        if folder_id is None:
-            raise ValueError("Missing required parameter 'folder_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/folders/{folder_id}#remove_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('remove_shared_link_by_folder_id', folder_id=folder_id, fields=fields, shared_link=shared_link)
 
     def post_web_links(self, url: Optional[str] = None, parent: Optional[dict[str, Any]] = None, name: Optional[str] = None, description: Optional[str] = None) -> dict[str, Any]:
         """
@@ -5633,24 +5258,7 @@ class BoxApp(APIApplication):
         Tags:
             Web links
         """
-        request_body_data = None
-        request_body_data = {
-            'url': url,
-            'parent': parent,
-            'name': name,
-            'description': description,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/web_links"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_web_links', url=url, parent=parent, name=name, description=description)
 
     def get_web_links_id(self, web_link_id: str) -> dict[str, Any]:
         """
@@ -5669,18 +5277,7 @@ class BoxApp(APIApplication):
         Tags:
             Web links
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        url = f"{self.base_url}/web_links/{web_link_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_web_links_id', web_link_id=web_link_id)
 
     def post_web_links_id(self, web_link_id: str, fields: Optional[List[str]] = None, name: Optional[str] = None, parent: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -5710,24 +5307,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed web links
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'parent': parent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/web_links/{web_link_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_web_links_id', web_link_id=web_link_id, fields=fields, name=name, parent=parent)
 
     def put_web_links_id(self, web_link_id: str, url: Optional[str] = None, parent: Optional[Any] = None, name: Optional[str] = None, description: Optional[str] = None, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5752,27 +5332,7 @@ class BoxApp(APIApplication):
         Tags:
             Web links
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        request_body_data = None
-        request_body_data = {
-            'url': url,
-            'parent': parent,
-            'name': name,
-            'description': description,
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/web_links/{web_link_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_web_links_id', web_link_id=web_link_id, url=url, parent=parent, name=name, description=description, shared_link=shared_link)
 
     def delete_web_links_id(self, web_link_id: str) -> Any:
         """
@@ -5792,18 +5352,7 @@ class BoxApp(APIApplication):
         Tags:
             Web links
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        url = f"{self.base_url}/web_links/{web_link_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_web_links_id', web_link_id=web_link_id)
 
     def get_web_links_id_trash(self, web_link_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -5833,18 +5382,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed web links
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        url = f"{self.base_url}/web_links/{web_link_id}/trash"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_web_links_id_trash', web_link_id=web_link_id, fields=fields)
 
     def delete_web_links_id_trash(self, web_link_id: str) -> Any:
         """
@@ -5864,18 +5402,7 @@ class BoxApp(APIApplication):
         Tags:
             Trashed web links
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        url = f"{self.base_url}/web_links/{web_link_id}/trash"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_web_links_id_trash', web_link_id=web_link_id)
 
     def get_shared_items_web_links(self, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -5903,16 +5430,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Web Links)
         """
-        url = f"{self.base_url}/shared_items#web_links"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shared_items_web_links', fields=fields)
 
     def get_shared_link_by_id(self, web_link_id: str, fields: str) -> dict[str, Any]:
         """
@@ -5934,18 +5452,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Web Links)
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        url = f"{self.base_url}/web_links/{web_link_id}#get_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shared_link_by_id', web_link_id=web_link_id, fields=fields)
 
     def update_web_link_shared_link(self, web_link_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -5971,23 +5478,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Web Links)
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/web_links/{web_link_id}#add_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_web_link_shared_link', web_link_id=web_link_id, fields=fields, shared_link=shared_link)
 
     def update_shared_link(self, web_link_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -6010,23 +5501,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Web Links)
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/web_links/{web_link_id}#update_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_shared_link', web_link_id=web_link_id, fields=fields, shared_link=shared_link)
 
     def remove_shared_link_by_web_link_id(self, web_link_id: str, fields: str, shared_link: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -6050,23 +5525,7 @@ class BoxApp(APIApplication):
         Tags:
             Shared links (Web Links)
         """
-        if web_link_id is None:
-            raise ValueError("Missing required parameter 'web_link_id'.")
-        request_body_data = None
-        request_body_data = {
-            'shared_link': shared_link,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/web_links/{web_link_id}#remove_shared_link"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('remove_shared_link_by_web_link_id', web_link_id=web_link_id, fields=fields, shared_link=shared_link)
 
     def get_shared_items_app_items(self) -> dict[str, Any]:
         """
@@ -6082,17 +5541,8 @@ class BoxApp(APIApplication):
 
         Tags:
             Shared links (App Items)
-        """
-        url = f"{self.base_url}/shared_items#app_items"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        """
+        return self._call('get_shared_items_app_items')
 
     def get_users(self, filter_term: Optional[str] = None, user_type: Optional[str] = None, external_app_user_id: Optional[str] = None, fields: Optional[List[str]] = None, offset: Optional[int] = None, limit: Optional[int] = None, usemarker: Optional[bool] = None, marker: Optional[str] = None) -> dict[str, Any]:
         """
@@ -6161,16 +5611,7 @@ class BoxApp(APIApplication):
         Tags:
             Users, important
         """
-        url = f"{self.base_url}/users"
-        query_params = {k: v for k, v in [('filter_term', filter_term), ('user_type', user_type), ('external_app_user_id', external_app_user_id), ('fields', fields), ('offset', offset), ('limit', limit), ('usemarker', usemarker), ('marker', marker)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_users', filter_term=filter_term, user_type=user_type, external_app_user_id=external_app_user_id, fields=fields, offset=offset, limit=limit, usemarker=usemarker, marker=marker)
 
     def post_users(self, fields: Optional[List[str]] = None, name: Optional[str] = None, login: Optional[str] = None, is_platform_access_only: Optional[bool] = None, role: Optional[str] = None, language: Optional[str] = None, is_sync_enabled: Optional[bool] = None, job_title: Optional[str] = None, phone: Optional[str] = None, address: Optional[str] = None, space_amount: Optional[int] = None, tracking_codes: Optional[List[dict[str, Any]]] = None, can_see_managed_users: Optional[bool] = None, timezone: Optional[str] = None, is_external_collab_restricted: Optional[bool] = None, is_exempt_from_device_limits: Optional[bool] = None, is_exempt_from_login_verification: Optional[bool] = None, status: Optional[str] = None, external_app_user_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -6227,38 +5668,7 @@ class BoxApp(APIApplication):
         Tags:
             Users
         """
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'login': login,
-            'is_platform_access_only': is_platform_access_only,
-            'role': role,
-            'language': language,
-            'is_sync_enabled': is_sync_enabled,
-            'job_title': job_title,
-            'phone': phone,
-            'address': address,
-            'space_amount': space_amount,
-            'tracking_codes': tracking_codes,
-            'can_see_managed_users': can_see_managed_users,
-            'timezone': timezone,
-            'is_external_collab_restricted': is_external_collab_restricted,
-            'is_exempt_from_device_limits': is_exempt_from_device_limits,
-            'is_exempt_from_login_verification': is_exempt_from_login_verification,
-            'status': status,
-            'external_app_user_id': external_app_user_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/users"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_users', fields=fields, name=name, login=login, is_platform_access_only=is_platform_access_only, role=role, language=language, is_sync_enabled=is_sync_enabled, job_title=job_title, phone=phone, address=address, space_amount=space_amount, tracking_codes=tracking_codes, can_see_managed_users=can_see_managed_users, timezone=timezone, is_external_collab_restricted=is_external_collab_restricted, is_exempt_from_device_limits=is_exempt_from_device_limits, is_exempt_from_login_verification=is_exempt_from_login_verification, status=status, external_app_user_id=external_app_user_id)
 
     def get_users_me(self, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -6285,16 +5695,7 @@ class BoxApp(APIApplication):
         Tags:
             Users
         """
-        url = f"{self.base_url}/users/me"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_users_me', fields=fields)
 
     def post_users_terminate_sessions(self, user_ids: Optional[List[str]] = None, user_logins: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -6314,22 +5715,7 @@ class BoxApp(APIApplication):
         Tags:
             Session termination
         """
-        request_body_data = None
-        request_body_data = {
-            'user_ids': user_ids,
-            'user_logins': user_logins,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/users/terminate_sessions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_users_terminate_sessions', user_ids=user_ids, user_logins=user_logins)
 
     def get_users_id(self, user_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -6362,18 +5748,7 @@ class BoxApp(APIApplication):
         Tags:
             Users
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        url = f"{self.base_url}/users/{user_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_users_id', user_id=user_id, fields=fields)
 
     def put_users_id(self, user_id: str, fields: Optional[List[str]] = None, enterprise: Optional[str] = None, notify: Optional[bool] = None, name: Optional[str] = None, login: Optional[str] = None, role: Optional[str] = None, language: Optional[str] = None, is_sync_enabled: Optional[bool] = None, job_title: Optional[str] = None, phone: Optional[str] = None, address: Optional[str] = None, tracking_codes: Optional[List[dict[str, Any]]] = None, can_see_managed_users: Optional[bool] = None, timezone: Optional[str] = None, is_external_collab_restricted: Optional[bool] = None, is_exempt_from_device_limits: Optional[bool] = None, is_exempt_from_login_verification: Optional[bool] = None, is_password_reset_required: Optional[bool] = None, status: Optional[str] = None, space_amount: Optional[int] = None, notification_email: Optional[dict[str, Any]] = None, external_app_user_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -6444,43 +5819,7 @@ class BoxApp(APIApplication):
         Tags:
             Users
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        request_body_data = None
-        request_body_data = {
-            'enterprise': enterprise,
-            'notify': notify,
-            'name': name,
-            'login': login,
-            'role': role,
-            'language': language,
-            'is_sync_enabled': is_sync_enabled,
-            'job_title': job_title,
-            'phone': phone,
-            'address': address,
-            'tracking_codes': tracking_codes,
-            'can_see_managed_users': can_see_managed_users,
-            'timezone': timezone,
-            'is_external_collab_restricted': is_external_collab_restricted,
-            'is_exempt_from_device_limits': is_exempt_from_device_limits,
-            'is_exempt_from_login_verification': is_exempt_from_login_verification,
-            'is_password_reset_required': is_password_reset_required,
-            'status': status,
-            'space_amount': space_amount,
-            'notification_email': notification_email,
-            'external_app_user_id': external_app_user_id,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/users/{user_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_users_id', user_id=user_id, fields=fields, enterprise=enterprise, notify=notify, name=name, login=login, role=role, language=language, is_sync_enabled=is_sync_enabled, job_title=job_title, phone=phone, address=address, tracking_codes=tracking_codes, can_see_managed_users=can_see_managed_users, timezone=timezone, is_external_collab_restricted=is_external_collab_restricted, is_exempt_from_device_limits=is_exempt_from_device_limits, is_exempt_from_login_verification=is_exempt_from_login_verification, is_password_reset_required=is_password_reset_required, status=status, space_amount=space_amount, notification_email=notification_email, external_app_user_id=external_app_user_id)
 
     def delete_users_id(self, user_id: str, notify: Optional[bool] = None, force: Optional[bool] = None) -> Any:
         """
@@ -6503,18 +5842,7 @@ class BoxApp(APIApplication):
         Tags:
             Users
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        url = f"{self.base_url}/users/{user_id}"
-        query_params = {k: v for k, v in [('notify', notify), ('force', force)] if v is not None}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_users_id', user_id=user_id, notify=notify, force=force)
 
     def get_users_id_avatar(self, user_id: str) -> Any:
         """
@@ -6535,18 +5863,7 @@ class BoxApp(APIApplication):
         Tags:
             User avatars
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        url = f"{self.base_url}/users/{user_id}/avatar"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_users_id_avatar', user_id=user_id)
 
     def post_users_id_avatar(self, user_id: str, pic: Optional[bytes] = None) -> dict[str, Any]:
         """
@@ -6569,26 +5886,7 @@ class BoxApp(APIApplication):
         Tags:
             User avatars
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        request_body_data = None
-        files_data = None
-        request_body_data = {}
-        files_data = {}
-        if pic is not None:
-            files_data['pic'] = pic
-        files_data = {k: v for k, v in files_data.items() if v is not None}
-        if not files_data: files_data = None
-        url = f"{self.base_url}/users/{user_id}/avatar"
-        query_params = {}
-        response = self._post(url, data=request_body_data, files=files_data, params=query_params, content_type='multipart/form-data')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_users_id_avatar', user_id=user_id, pic=pic)
 
     def delete_users_id_avatar(self, user_id: str) -> Any:
         """
@@ -6607,18 +5905,7 @@ class BoxApp(APIApplication):
         Tags:
             User avatars
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        url = f"{self.base_url}/users/{user_id}/avatar"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_users_id_avatar', user_id=user_id)
 
     def put_users_id_folders(self, user_id: str, fields: Optional[List[str]] = None, notify: Optional[bool] = None, owned_by: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -6650,23 +5937,7 @@ class BoxApp(APIApplication):
         Tags:
             Transfer folders
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        request_body_data = None
-        request_body_data = {
-            'owned_by': owned_by,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/users/{user_id}/folders/0"
-        query_params = {k: v for k, v in [('fields', fields), ('notify', notify)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_users_id_folders', user_id=user_id, fields=fields, notify=notify, owned_by=owned_by)
 
     def get_users_id_email_aliases(self, user_id: str) -> dict[str, Any]:
         """
@@ -6685,18 +5956,7 @@ class BoxApp(APIApplication):
         Tags:
             Email aliases
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        url = f"{self.base_url}/users/{user_id}/email_aliases"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_users_id_email_aliases', user_id=user_id)
 
     def post_users_id_email_aliases(self, user_id: str, email: Optional[str] = None) -> dict[str, Any]:
         """
@@ -6722,23 +5982,7 @@ class BoxApp(APIApplication):
         Tags:
             Email aliases
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        request_body_data = None
-        request_body_data = {
-            'email': email,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/users/{user_id}/email_aliases"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_users_id_email_aliases', user_id=user_id, email=email)
 
     def delete_email_alias_by_id(self, user_id: str, email_alias_id: str) -> Any:
         """
@@ -6758,20 +6002,7 @@ class BoxApp(APIApplication):
         Tags:
             Email aliases
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        if email_alias_id is None:
-            raise ValueError("Missing required parameter 'email_alias_id'.")
-        url = f"{self.base_url}/users/{user_id}/email_aliases/{email_alias_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_email_alias_by_id', user_id=user_id, email_alias_id=email_alias_id)
 
     def get_users_id_memberships(self, user_id: str, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -6797,18 +6028,7 @@ class BoxApp(APIApplication):
         Tags:
             Group memberships
         """
-        if user_id is None:
-            raise ValueError("Missing required parameter 'user_id'.")
-        url = f"{self.base_url}/users/{user_id}/memberships"
-        query_params = {k: v for k, v in [('limit', limit), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_users_id_memberships', user_id=user_id, limit=limit, offset=offset)
 
     def post_invites(self, fields: Optional[List[str]] = None, enterprise: Optional[dict[str, Any]] = None, actionable_by: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -6837,22 +6057,7 @@ class BoxApp(APIApplication):
         Tags:
             Invites
         """
-        request_body_data = None
-        request_body_data = {
-            'enterprise': enterprise,
-            'actionable_by': actionable_by,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/invites"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_invites', fields=fields, enterprise=enterprise, actionable_by=actionable_by)
 
     def get_invites_id(self, invite_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -6880,18 +6085,7 @@ class BoxApp(APIApplication):
         Tags:
             Invites
         """
-        if invite_id is None:
-            raise ValueError("Missing required parameter 'invite_id'.")
-        url = f"{self.base_url}/invites/{invite_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_invites_id', invite_id=invite_id, fields=fields)
 
     def get_groups(self, filter_term: Optional[str] = None, fields: Optional[List[str]] = None, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -6927,16 +6121,7 @@ class BoxApp(APIApplication):
         Tags:
             Groups
         """
-        url = f"{self.base_url}/groups"
-        query_params = {k: v for k, v in [('filter_term', filter_term), ('fields', fields), ('limit', limit), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_groups', filter_term=filter_term, fields=fields, limit=limit, offset=offset)
 
     def post_groups(self, fields: Optional[List[str]] = None, name: Optional[str] = None, provenance: Optional[str] = None, external_sync_identifier: Optional[str] = None, description: Optional[str] = None, invitability_level: Optional[str] = None, member_viewability_level: Optional[str] = None) -> dict[str, Any]:
         """
@@ -7003,26 +6188,7 @@ class BoxApp(APIApplication):
         Tags:
             Groups
         """
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'provenance': provenance,
-            'external_sync_identifier': external_sync_identifier,
-            'description': description,
-            'invitability_level': invitability_level,
-            'member_viewability_level': member_viewability_level,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/groups"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_groups', fields=fields, name=name, provenance=provenance, external_sync_identifier=external_sync_identifier, description=description, invitability_level=invitability_level, member_viewability_level=member_viewability_level)
 
     def post_groups_terminate_sessions(self, group_ids: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -7041,21 +6207,7 @@ class BoxApp(APIApplication):
         Tags:
             Session termination
         """
-        request_body_data = None
-        request_body_data = {
-            'group_ids': group_ids,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/groups/terminate_sessions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_groups_terminate_sessions', group_ids=group_ids)
 
     def get_groups_id(self, group_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -7083,18 +6235,7 @@ class BoxApp(APIApplication):
         Tags:
             Groups
         """
-        if group_id is None:
-            raise ValueError("Missing required parameter 'group_id'.")
-        url = f"{self.base_url}/groups/{group_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_groups_id', group_id=group_id, fields=fields)
 
     def put_groups_id(self, group_id: str, fields: Optional[List[str]] = None, name: Optional[str] = None, provenance: Optional[str] = None, external_sync_identifier: Optional[str] = None, description: Optional[str] = None, invitability_level: Optional[str] = None, member_viewability_level: Optional[str] = None) -> dict[str, Any]:
         """
@@ -7162,28 +6303,7 @@ class BoxApp(APIApplication):
         Tags:
             Groups
         """
-        if group_id is None:
-            raise ValueError("Missing required parameter 'group_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'provenance': provenance,
-            'external_sync_identifier': external_sync_identifier,
-            'description': description,
-            'invitability_level': invitability_level,
-            'member_viewability_level': member_viewability_level,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/groups/{group_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_groups_id', group_id=group_id, fields=fields, name=name, provenance=provenance, external_sync_identifier=external_sync_identifier, description=description, invitability_level=invitability_level, member_viewability_level=member_viewability_level)
 
     def delete_groups_id(self, group_id: str) -> Any:
         """
@@ -7203,18 +6323,7 @@ class BoxApp(APIApplication):
         Tags:
             Groups
         """
-        if group_id is None:
-            raise ValueError("Missing required parameter 'group_id'.")
-        url = f"{self.base_url}/groups/{group_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_groups_id', group_id=group_id)
 
     def get_groups_id_memberships(self, group_id: str, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -7240,18 +6349,7 @@ class BoxApp(APIApplication):
         Tags:
             Group memberships
         """
-        if group_id is None:
-            raise ValueError("Missing required parameter 'group_id'.")
-        url = f"{self.base_url}/groups/{group_id}/memberships"
-        query_params = {k: v for k, v in [('limit', limit), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_groups_id_memberships', group_id=group_id, limit=limit, offset=offset)
 
     def get_groups_id_collaborations(self, group_id: str, limit: Optional[int] = None, offset: Optional[int] = None) -> dict[str, Any]:
         """
@@ -7277,18 +6375,7 @@ class BoxApp(APIApplication):
         Tags:
             Collaborations (List)
         """
-        if group_id is None:
-            raise ValueError("Missing required parameter 'group_id'.")
-        url = f"{self.base_url}/groups/{group_id}/collaborations"
-        query_params = {k: v for k, v in [('limit', limit), ('offset', offset)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_groups_id_collaborations', group_id=group_id, limit=limit, offset=offset)
 
     def post_group_memberships(self, fields: Optional[List[str]] = None, user: Optional[dict[str, Any]] = None, group: Optional[dict[str, Any]] = None, role: Optional[str] = None, configurable_permissions: Optional[dict[str, bool]] = None) -> dict[str, Any]:
         """
@@ -7328,24 +6415,7 @@ class BoxApp(APIApplication):
         Tags:
             Group memberships
         """
-        request_body_data = None
-        request_body_data = {
-            'user': user,
-            'group': group,
-            'role': role,
-            'configurable_permissions': configurable_permissions,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/group_memberships"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_group_memberships', fields=fields, user=user, group=group, role=role, configurable_permissions=configurable_permissions)
 
     def get_group_memberships_id(self, group_membership_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -7373,18 +6443,7 @@ class BoxApp(APIApplication):
         Tags:
             Group memberships
         """
-        if group_membership_id is None:
-            raise ValueError("Missing required parameter 'group_membership_id'.")
-        url = f"{self.base_url}/group_memberships/{group_membership_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_group_memberships_id', group_membership_id=group_membership_id, fields=fields)
 
     def put_group_memberships_id(self, group_membership_id: str, fields: Optional[List[str]] = None, role: Optional[str] = None, configurable_permissions: Optional[dict[str, bool]] = None) -> dict[str, Any]:
         """
@@ -7423,24 +6482,7 @@ class BoxApp(APIApplication):
         Tags:
             Group memberships
         """
-        if group_membership_id is None:
-            raise ValueError("Missing required parameter 'group_membership_id'.")
-        request_body_data = None
-        request_body_data = {
-            'role': role,
-            'configurable_permissions': configurable_permissions,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/group_memberships/{group_membership_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_group_memberships_id', group_membership_id=group_membership_id, fields=fields, role=role, configurable_permissions=configurable_permissions)
 
     def delete_group_memberships_id(self, group_membership_id: str) -> Any:
         """
@@ -7460,18 +6502,7 @@ class BoxApp(APIApplication):
         Tags:
             Group memberships
         """
-        if group_membership_id is None:
-            raise ValueError("Missing required parameter 'group_membership_id'.")
-        url = f"{self.base_url}/group_memberships/{group_membership_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_group_memberships_id', group_membership_id=group_membership_id)
 
     def get_webhooks(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -7494,16 +6525,7 @@ class BoxApp(APIApplication):
         Tags:
             Webhooks
         """
-        url = f"{self.base_url}/webhooks"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_webhooks', marker=marker, limit=limit)
 
     def post_webhooks(self, target: Optional[dict[str, Any]] = None, address: Optional[str] = None, triggers: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -7525,23 +6547,7 @@ class BoxApp(APIApplication):
         Tags:
             Webhooks
         """
-        request_body_data = None
-        request_body_data = {
-            'target': target,
-            'address': address,
-            'triggers': triggers,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/webhooks"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_webhooks', target=target, address=address, triggers=triggers)
 
     def get_webhooks_id(self, webhook_id: str) -> dict[str, Any]:
         """
@@ -7560,18 +6566,7 @@ class BoxApp(APIApplication):
         Tags:
             Webhooks
         """
-        if webhook_id is None:
-            raise ValueError("Missing required parameter 'webhook_id'.")
-        url = f"{self.base_url}/webhooks/{webhook_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_webhooks_id', webhook_id=webhook_id)
 
     def put_webhooks_id(self, webhook_id: str, target: Optional[dict[str, Any]] = None, address: Optional[str] = None, triggers: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -7594,25 +6589,7 @@ class BoxApp(APIApplication):
         Tags:
             Webhooks
         """
-        if webhook_id is None:
-            raise ValueError("Missing required parameter 'webhook_id'.")
-        request_body_data = None
-        request_body_data = {
-            'target': target,
-            'address': address,
-            'triggers': triggers,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/webhooks/{webhook_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_webhooks_id', webhook_id=webhook_id, target=target, address=address, triggers=triggers)
 
     def delete_webhooks_id(self, webhook_id: str) -> Any:
         """
@@ -7632,18 +6609,7 @@ class BoxApp(APIApplication):
         Tags:
             Webhooks
         """
-        if webhook_id is None:
-            raise ValueError("Missing required parameter 'webhook_id'.")
-        url = f"{self.base_url}/webhooks/{webhook_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_webhooks_id', webhook_id=webhook_id)
 
     def put_skill_invocations_id(self, skill_id: str, status: Optional[str] = None, metadata: Optional[dict[str, Any]] = None, file: Optional[dict[str, Any]] = None, file_version: Optional[dict[str, Any]] = None, usage: Optional[dict[str, Any]] = None) -> Any:
         """
@@ -7672,27 +6638,7 @@ class BoxApp(APIApplication):
         Tags:
             Skills
         """
-        if skill_id is None:
-            raise ValueError("Missing required parameter 'skill_id'.")
-        request_body_data = None
-        request_body_data = {
-            'status': status,
-            'metadata': metadata,
-            'file': file,
-            'file_version': file_version,
-            'usage': usage,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/skill_invocations/{skill_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_skill_invocations_id', skill_id=skill_id, status=status, metadata=metadata, file=file, file_version=file_version, usage=usage)
 
     def options_events(self) -> dict[str, Any]:
         """
@@ -7709,17 +6655,7 @@ class BoxApp(APIApplication):
         Tags:
             Events
         """
-        request_body_data = None
-        url = f"{self.base_url}/events"
-        query_params = {}
-        response = self._options(url, data=request_body_data, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('options_events')
 
     def get_events(self, stream_type: Optional[str] = None, stream_position: Optional[str] = None, limit: Optional[int] = None, event_type: Optional[List[str]] = None, created_after: Optional[str] = None, created_before: Optional[str] = None) -> dict[str, Any]:
         """
@@ -7784,16 +6720,7 @@ class BoxApp(APIApplication):
         Tags:
             Events
         """
-        url = f"{self.base_url}/events"
-        query_params = {k: v for k, v in [('stream_type', stream_type), ('stream_position', stream_position), ('limit', limit), ('event_type', event_type), ('created_after', created_after), ('created_before', created_before)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_events', stream_type=stream_type, stream_position=stream_position, limit=limit, event_type=event_type, created_after=created_after, created_before=created_before)
 
     def get_collections(self, fields: Optional[List[str]] = None, offset: Optional[int] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -7826,16 +6753,7 @@ class BoxApp(APIApplication):
         Tags:
             Collections
         """
-        url = f"{self.base_url}/collections"
-        query_params = {k: v for k, v in [('fields', fields), ('offset', offset), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_collections', fields=fields, offset=offset, limit=limit)
 
     def get_collections_id_items(self, collection_id: str, fields: Optional[List[str]] = None, offset: Optional[int] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -7869,18 +6787,7 @@ class BoxApp(APIApplication):
         Tags:
             Collections
         """
-        if collection_id is None:
-            raise ValueError("Missing required parameter 'collection_id'.")
-        url = f"{self.base_url}/collections/{collection_id}/items"
-        query_params = {k: v for k, v in [('fields', fields), ('offset', offset), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_collections_id_items', collection_id=collection_id, fields=fields, offset=offset, limit=limit)
 
     def get_collections_id(self, collection_id: str) -> dict[str, Any]:
         """
@@ -7899,18 +6806,7 @@ class BoxApp(APIApplication):
         Tags:
             Collections
         """
-        if collection_id is None:
-            raise ValueError("Missing required parameter 'collection_id'.")
-        url = f"{self.base_url}/collections/{collection_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_collections_id', collection_id=collection_id)
 
     def get_recent_items(self, fields: Optional[List[str]] = None, limit: Optional[int] = None, marker: Optional[str] = None) -> dict[str, Any]:
         """
@@ -7942,16 +6838,7 @@ class BoxApp(APIApplication):
         Tags:
             Recent items
         """
-        url = f"{self.base_url}/recent_items"
-        query_params = {k: v for k, v in [('fields', fields), ('limit', limit), ('marker', marker)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_recent_items', fields=fields, limit=limit, marker=marker)
 
     def get_retention_policies(self, policy_name: Optional[str] = None, policy_type: Optional[str] = None, created_by_user_id: Optional[str] = None, fields: Optional[List[str]] = None, limit: Optional[int] = None, marker: Optional[str] = None) -> dict[str, Any]:
         """
@@ -7985,16 +6872,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policies
         """
-        url = f"{self.base_url}/retention_policies"
-        query_params = {k: v for k, v in [('policy_name', policy_name), ('policy_type', policy_type), ('created_by_user_id', created_by_user_id), ('fields', fields), ('limit', limit), ('marker', marker)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_retention_policies', policy_name=policy_name, policy_type=policy_type, created_by_user_id=created_by_user_id, fields=fields, limit=limit, marker=marker)
 
     def post_retention_policies(self, policy_name: Optional[str] = None, description: Optional[str] = None, policy_type: Optional[str] = None, disposition_action: Optional[str] = None, retention_length: Optional[Any] = None, retention_type: Optional[str] = None, can_owner_extend_retention: Optional[bool] = None, are_owners_notified: Optional[bool] = None, custom_notification_recipients: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -8052,29 +6930,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policies
         """
-        request_body_data = None
-        request_body_data = {
-            'policy_name': policy_name,
-            'description': description,
-            'policy_type': policy_type,
-            'disposition_action': disposition_action,
-            'retention_length': retention_length,
-            'retention_type': retention_type,
-            'can_owner_extend_retention': can_owner_extend_retention,
-            'are_owners_notified': are_owners_notified,
-            'custom_notification_recipients': custom_notification_recipients,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/retention_policies"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_retention_policies', policy_name=policy_name, description=description, policy_type=policy_type, disposition_action=disposition_action, retention_length=retention_length, retention_type=retention_type, can_owner_extend_retention=can_owner_extend_retention, are_owners_notified=are_owners_notified, custom_notification_recipients=custom_notification_recipients)
 
     def get_retention_policies_id(self, retention_policy_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -8102,18 +6958,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policies
         """
-        if retention_policy_id is None:
-            raise ValueError("Missing required parameter 'retention_policy_id'.")
-        url = f"{self.base_url}/retention_policies/{retention_policy_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_retention_policies_id', retention_policy_id=retention_policy_id, fields=fields)
 
     def put_retention_policies_id(self, retention_policy_id: str, policy_name: Optional[str] = None, description: Optional[str] = None, disposition_action: Optional[Any] = None, retention_type: Optional[str] = None, retention_length: Optional[Any] = None, status: Optional[str] = None, can_owner_extend_retention: Optional[bool] = None, are_owners_notified: Optional[bool] = None, custom_notification_recipients: Optional[List[dict[str, Any]]] = None) -> dict[str, Any]:
         """
@@ -8178,31 +7023,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policies
         """
-        if retention_policy_id is None:
-            raise ValueError("Missing required parameter 'retention_policy_id'.")
-        request_body_data = None
-        request_body_data = {
-            'policy_name': policy_name,
-            'description': description,
-            'disposition_action': disposition_action,
-            'retention_type': retention_type,
-            'retention_length': retention_length,
-            'status': status,
-            'can_owner_extend_retention': can_owner_extend_retention,
-            'are_owners_notified': are_owners_notified,
-            'custom_notification_recipients': custom_notification_recipients,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/retention_policies/{retention_policy_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_retention_policies_id', retention_policy_id=retention_policy_id, policy_name=policy_name, description=description, disposition_action=disposition_action, retention_type=retention_type, retention_length=retention_length, status=status, can_owner_extend_retention=can_owner_extend_retention, are_owners_notified=are_owners_notified, custom_notification_recipients=custom_notification_recipients)
 
     def delete_retention_policies_id(self, retention_policy_id: str) -> Any:
         """
@@ -8221,18 +7042,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policies
         """
-        if retention_policy_id is None:
-            raise ValueError("Missing required parameter 'retention_policy_id'.")
-        url = f"{self.base_url}/retention_policies/{retention_policy_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_retention_policies_id', retention_policy_id=retention_policy_id)
 
     def get_retention_policy_assignments(self, retention_policy_id: str, type: Optional[str] = None, fields: Optional[List[str]] = None, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -8265,18 +7075,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policy assignments
         """
-        if retention_policy_id is None:
-            raise ValueError("Missing required parameter 'retention_policy_id'.")
-        url = f"{self.base_url}/retention_policies/{retention_policy_id}/assignments"
-        query_params = {k: v for k, v in [('type', type), ('fields', fields), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_retention_policy_assignments', retention_policy_id=retention_policy_id, type=type, fields=fields, marker=marker, limit=limit)
 
     def create_retention_policy_assignment(self, policy_id: Optional[str] = None, assign_to: Optional[dict[str, Any]] = None, filter_fields: Optional[List[dict[str, Any]]] = None, start_date_field: Optional[str] = None) -> dict[str, Any]:
         """
@@ -8304,24 +7103,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policy assignments
         """
-        request_body_data = None
-        request_body_data = {
-            'policy_id': policy_id,
-            'assign_to': assign_to,
-            'filter_fields': filter_fields,
-            'start_date_field': start_date_field,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/retention_policy_assignments"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_retention_policy_assignment', policy_id=policy_id, assign_to=assign_to, filter_fields=filter_fields, start_date_field=start_date_field)
 
     def get_retention_policy_assignment_by_id(self, retention_policy_assignment_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -8349,18 +7131,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policy assignments
         """
-        if retention_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'retention_policy_assignment_id'.")
-        url = f"{self.base_url}/retention_policy_assignments/{retention_policy_assignment_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_retention_policy_assignment_by_id', retention_policy_assignment_id=retention_policy_assignment_id, fields=fields)
 
     def delete_retention_policy_assignment_by_id(self, retention_policy_assignment_id: str) -> Any:
         """
@@ -8380,18 +7151,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policy assignments
         """
-        if retention_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'retention_policy_assignment_id'.")
-        url = f"{self.base_url}/retention_policy_assignments/{retention_policy_assignment_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_retention_policy_assignment_by_id', retention_policy_assignment_id=retention_policy_assignment_id)
 
     def get_files_under_retention(self, retention_policy_assignment_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -8416,18 +7176,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policy assignments
         """
-        if retention_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'retention_policy_assignment_id'.")
-        url = f"{self.base_url}/retention_policy_assignments/{retention_policy_assignment_id}/files_under_retention"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_under_retention', retention_policy_assignment_id=retention_policy_assignment_id, marker=marker, limit=limit)
 
     def get_retention_policy_assignment_file_versions(self, retention_policy_assignment_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -8452,18 +7201,7 @@ class BoxApp(APIApplication):
         Tags:
             Retention policy assignments
         """
-        if retention_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'retention_policy_assignment_id'.")
-        url = f"{self.base_url}/retention_policy_assignments/{retention_policy_assignment_id}/file_versions_under_retention"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_retention_policy_assignment_file_versions', retention_policy_assignment_id=retention_policy_assignment_id, marker=marker, limit=limit)
 
     def get_legal_hold_policies(self, policy_name: Optional[str] = None, fields: Optional[List[str]] = None, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -8497,16 +7235,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policies
         """
-        url = f"{self.base_url}/legal_hold_policies"
-        query_params = {k: v for k, v in [('policy_name', policy_name), ('fields', fields), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_legal_hold_policies', policy_name=policy_name, fields=fields, marker=marker, limit=limit)
 
     def post_legal_hold_policies(self, policy_name: Optional[str] = None, description: Optional[str] = None, filter_started_at: Optional[str] = None, filter_ended_at: Optional[str] = None, is_ongoing: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -8556,25 +7285,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policies
         """
-        request_body_data = None
-        request_body_data = {
-            'policy_name': policy_name,
-            'description': description,
-            'filter_started_at': filter_started_at,
-            'filter_ended_at': filter_ended_at,
-            'is_ongoing': is_ongoing,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/legal_hold_policies"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_legal_hold_policies', policy_name=policy_name, description=description, filter_started_at=filter_started_at, filter_ended_at=filter_ended_at, is_ongoing=is_ongoing)
 
     def get_legal_hold_policies_id(self, legal_hold_policy_id: str) -> dict[str, Any]:
         """
@@ -8593,18 +7304,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policies
         """
-        if legal_hold_policy_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_policy_id'.")
-        url = f"{self.base_url}/legal_hold_policies/{legal_hold_policy_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_legal_hold_policies_id', legal_hold_policy_id=legal_hold_policy_id)
 
     def put_legal_hold_policies_id(self, legal_hold_policy_id: str, policy_name: Optional[str] = None, description: Optional[str] = None, release_notes: Optional[str] = None) -> dict[str, Any]:
         """
@@ -8626,25 +7326,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policies
         """
-        if legal_hold_policy_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_policy_id'.")
-        request_body_data = None
-        request_body_data = {
-            'policy_name': policy_name,
-            'description': description,
-            'release_notes': release_notes,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/legal_hold_policies/{legal_hold_policy_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_legal_hold_policies_id', legal_hold_policy_id=legal_hold_policy_id, policy_name=policy_name, description=description, release_notes=release_notes)
 
     def delete_legal_hold_policies_id(self, legal_hold_policy_id: str) -> Any:
         """
@@ -8664,18 +7346,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policies
         """
-        if legal_hold_policy_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_policy_id'.")
-        url = f"{self.base_url}/legal_hold_policies/{legal_hold_policy_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_legal_hold_policies_id', legal_hold_policy_id=legal_hold_policy_id)
 
     def get_legal_hold_policy_assignments(self, policy_id: str, assign_to_type: Optional[str] = None, assign_to_id: Optional[str] = None, marker: Optional[str] = None, limit: Optional[int] = None, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -8712,16 +7383,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policy assignments
         """
-        url = f"{self.base_url}/legal_hold_policy_assignments"
-        query_params = {k: v for k, v in [('policy_id', policy_id), ('assign_to_type', assign_to_type), ('assign_to_id', assign_to_id), ('marker', marker), ('limit', limit), ('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_legal_hold_policy_assignments', policy_id=policy_id, assign_to_type=assign_to_type, assign_to_id=assign_to_id, marker=marker, limit=limit, fields=fields)
 
     def assign_legal_hold_policy(self, policy_id: Optional[str] = None, assign_to: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -8741,22 +7403,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policy assignments
         """
-        request_body_data = None
-        request_body_data = {
-            'policy_id': policy_id,
-            'assign_to': assign_to,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/legal_hold_policy_assignments"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('assign_legal_hold_policy', policy_id=policy_id, assign_to=assign_to)
 
     def get_legal_hold_policy_assignment(self, legal_hold_policy_assignment_id: str) -> dict[str, Any]:
         """
@@ -8775,18 +7422,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policy assignments
         """
-        if legal_hold_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_policy_assignment_id'.")
-        url = f"{self.base_url}/legal_hold_policy_assignments/{legal_hold_policy_assignment_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_legal_hold_policy_assignment', legal_hold_policy_assignment_id=legal_hold_policy_assignment_id)
 
     def delete_legal_hold_assignment(self, legal_hold_policy_assignment_id: str) -> Any:
         """
@@ -8806,18 +7442,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policy assignments
         """
-        if legal_hold_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_policy_assignment_id'.")
-        url = f"{self.base_url}/legal_hold_policy_assignments/{legal_hold_policy_assignment_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_legal_hold_assignment', legal_hold_policy_assignment_id=legal_hold_policy_assignment_id)
 
     def get_files_on_hold_by_legl_hld_polcy_asgnmt_id(self, legal_hold_policy_assignment_id: str, marker: Optional[str] = None, limit: Optional[int] = None, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -8851,18 +7476,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policy assignments
         """
-        if legal_hold_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_policy_assignment_id'.")
-        url = f"{self.base_url}/legal_hold_policy_assignments/{legal_hold_policy_assignment_id}/files_on_hold"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit), ('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_files_on_hold_by_legl_hld_polcy_asgnmt_id', legal_hold_policy_assignment_id=legal_hold_policy_assignment_id, marker=marker, limit=limit, fields=fields)
 
     def get_file_version_retentions(self, file_id: Optional[str] = None, file_version_id: Optional[str] = None, policy_id: Optional[str] = None, disposition_action: Optional[str] = None, disposition_before: Optional[str] = None, disposition_after: Optional[str] = None, limit: Optional[int] = None, marker: Optional[str] = None) -> dict[str, Any]:
         """
@@ -8891,19 +7505,10 @@ class BoxApp(APIApplication):
             HTTPError: Raised when the API request fails (e.g., non-2XX status code).
             JSONDecodeError: Raised if the response body cannot be parsed as JSON.
 
-        Tags:
-            File version retentions
-        """
-        url = f"{self.base_url}/file_version_retentions"
-        query_params = {k: v for k, v in [('file_id', file_id), ('file_version_id', file_version_id), ('policy_id', policy_id), ('disposition_action', disposition_action), ('disposition_before', disposition_before), ('disposition_after', disposition_after), ('limit', limit), ('marker', marker)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        Tags:
+            File version retentions
+        """
+        return self._call('get_file_version_retentions', file_id=file_id, file_version_id=file_version_id, policy_id=policy_id, disposition_action=disposition_action, disposition_before=disposition_before, disposition_after=disposition_after, limit=limit, marker=marker)
 
     def get_legal_hold_file_versions_on_hold(self, legal_hold_policy_assignment_id: str, marker: Optional[str] = None, limit: Optional[int] = None, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -8937,18 +7542,7 @@ class BoxApp(APIApplication):
         Tags:
             Legal hold policy assignments
         """
-        if legal_hold_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'legal_hold_policy_assignment_id'.")
-        url = f"{self.base_url}/legal_hold_policy_assignments/{legal_hold_policy_assignment_id}/file_versions_on_hold"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit), ('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_legal_hold_file_versions_on_hold', legal_hold_policy_assignment_id=legal_hold_policy_assignment_id, marker=marker, limit=limit, fields=fields)
 
     def get_file_version_retentions_id(self, file_version_retention_id: str) -> dict[str, Any]:
         """
@@ -8967,18 +7561,7 @@ class BoxApp(APIApplication):
         Tags:
             File version retentions
         """
-        if file_version_retention_id is None:
-            raise ValueError("Missing required parameter 'file_version_retention_id'.")
-        url = f"{self.base_url}/file_version_retentions/{file_version_retention_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_file_version_retentions_id', file_version_retention_id=file_version_retention_id)
 
     def get_legal_hold(self, file_version_legal_hold_id: str) -> dict[str, Any]:
         """
@@ -8997,18 +7580,7 @@ class BoxApp(APIApplication):
         Tags:
             File version legal holds
         """
-        if file_version_legal_hold_id is None:
-            raise ValueError("Missing required parameter 'file_version_legal_hold_id'.")
-        url = f"{self.base_url}/file_version_legal_holds/{file_version_legal_hold_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_legal_hold', file_version_legal_hold_id=file_version_legal_hold_id)
 
     def get_file_version_legal_holds(self, policy_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -9034,16 +7606,7 @@ class BoxApp(APIApplication):
         Tags:
             File version legal holds
         """
-        url = f"{self.base_url}/file_version_legal_holds"
-        query_params = {k: v for k, v in [('policy_id', policy_id), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_file_version_legal_holds', policy_id=policy_id, marker=marker, limit=limit)
 
     def get_shield_information_barrier_by_id(self, shield_information_barrier_id: str) -> dict[str, Any]:
         """
@@ -9062,18 +7625,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barriers
         """
-        if shield_information_barrier_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_id'.")
-        url = f"{self.base_url}/shield_information_barriers/{shield_information_barrier_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_information_barrier_by_id', shield_information_barrier_id=shield_information_barrier_id)
 
     def change_shield_status(self, id: Optional[str] = None, status: Optional[str] = None) -> dict[str, Any]:
         """
@@ -9093,22 +7645,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barriers
         """
-        request_body_data = None
-        request_body_data = {
-            'id': id,
-            'status': status,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_information_barriers/change_status"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('change_shield_status', id=id, status=status)
 
     def get_shield_information_barriers(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -9131,16 +7668,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barriers
         """
-        url = f"{self.base_url}/shield_information_barriers"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_information_barriers', marker=marker, limit=limit)
 
     def create_shield_barriers(self, enterprise: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -9159,21 +7687,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barriers
         """
-        request_body_data = None
-        request_body_data = {
-            'enterprise': enterprise,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_information_barriers"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_shield_barriers', enterprise=enterprise)
 
     def get_shield_information_barrier_reports(self, shield_information_barrier_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -9197,16 +7711,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier reports
         """
-        url = f"{self.base_url}/shield_information_barrier_reports"
-        query_params = {k: v for k, v in [('shield_information_barrier_id', shield_information_barrier_id), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_information_barrier_reports', shield_information_barrier_id=shield_information_barrier_id, marker=marker, limit=limit)
 
     def generate_shield_report(self, shield_information_barrier: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -9226,21 +7731,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier reports
         """
-        request_body_data = None
-        request_body_data = {
-            'shield_information_barrier': shield_information_barrier,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_information_barrier_reports"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('generate_shield_report', shield_information_barrier=shield_information_barrier)
 
     def get_shield_report_by_id(self, shield_information_barrier_report_id: str) -> dict[str, Any]:
         """
@@ -9259,18 +7750,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier reports
         """
-        if shield_information_barrier_report_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_report_id'.")
-        url = f"{self.base_url}/shield_information_barrier_reports/{shield_information_barrier_report_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_report_by_id', shield_information_barrier_report_id=shield_information_barrier_report_id)
 
     def get_shield_segment_by_id(self, shield_information_barrier_segment_id: str) -> dict[str, Any]:
         """
@@ -9289,18 +7769,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segments
         """
-        if shield_information_barrier_segment_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_segment_id'.")
-        url = f"{self.base_url}/shield_information_barrier_segments/{shield_information_barrier_segment_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_segment_by_id', shield_information_barrier_segment_id=shield_information_barrier_segment_id)
 
     def delete_shield_inft_barrier_sgmt_by_id(self, shield_information_barrier_segment_id: str) -> Any:
         """
@@ -9319,18 +7788,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segments
         """
-        if shield_information_barrier_segment_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_segment_id'.")
-        url = f"{self.base_url}/shield_information_barrier_segments/{shield_information_barrier_segment_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_shield_inft_barrier_sgmt_by_id', shield_information_barrier_segment_id=shield_information_barrier_segment_id)
 
     def update_shield_barrier_segment(self, shield_information_barrier_segment_id: str, name: Optional[str] = None, description: Optional[str] = None) -> dict[str, Any]:
         """
@@ -9352,24 +7810,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segments
         """
-        if shield_information_barrier_segment_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_segment_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'description': description,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_information_barrier_segments/{shield_information_barrier_segment_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_shield_barrier_segment', shield_information_barrier_segment_id=shield_information_barrier_segment_id, name=name, description=description)
 
     def get_shield_segments(self, shield_information_barrier_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -9393,16 +7834,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segments
         """
-        url = f"{self.base_url}/shield_information_barrier_segments"
-        query_params = {k: v for k, v in [('shield_information_barrier_id', shield_information_barrier_id), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_segments', shield_information_barrier_id=shield_information_barrier_id, marker=marker, limit=limit)
 
     def create_shield_barrier_segments(self, shield_information_barrier: Optional[dict[str, Any]] = None, name: Optional[str] = None, description: Optional[str] = None) -> dict[str, Any]:
         """
@@ -9424,23 +7856,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segments
         """
-        request_body_data = None
-        request_body_data = {
-            'shield_information_barrier': shield_information_barrier,
-            'name': name,
-            'description': description,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_information_barrier_segments"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_shield_barrier_segments', shield_information_barrier=shield_information_barrier, name=name, description=description)
 
     def get_shield_infmt_barrier_sgmnt_member_by_id(self, shield_information_barrier_segment_member_id: str) -> dict[str, Any]:
         """
@@ -9459,18 +7875,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segment members
         """
-        if shield_information_barrier_segment_member_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_segment_member_id'.")
-        url = f"{self.base_url}/shield_information_barrier_segment_members/{shield_information_barrier_segment_member_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_infmt_barrier_sgmnt_member_by_id', shield_information_barrier_segment_member_id=shield_information_barrier_segment_member_id)
 
     def delete_shield_member(self, shield_information_barrier_segment_member_id: str) -> Any:
         """
@@ -9490,18 +7895,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segment members
         """
-        if shield_information_barrier_segment_member_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_segment_member_id'.")
-        url = f"{self.base_url}/shield_information_barrier_segment_members/{shield_information_barrier_segment_member_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_shield_member', shield_information_barrier_segment_member_id=shield_information_barrier_segment_member_id)
 
     def get_shield_infmt_barrier_sgmnt_members(self, shield_information_barrier_segment_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -9526,16 +7920,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segment members
         """
-        url = f"{self.base_url}/shield_information_barrier_segment_members"
-        query_params = {k: v for k, v in [('shield_information_barrier_segment_id', shield_information_barrier_segment_id), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_infmt_barrier_sgmnt_members', shield_information_barrier_segment_id=shield_information_barrier_segment_id, marker=marker, limit=limit)
 
     def add_shield_members(self, type: Optional[str] = None, shield_information_barrier: Optional[dict[str, Any]] = None, shield_information_barrier_segment: Optional[dict[str, Any]] = None, user: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -9559,24 +7944,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segment members
         """
-        request_body_data = None
-        request_body_data = {
-            'type': type,
-            'shield_information_barrier': shield_information_barrier,
-            'shield_information_barrier_segment': shield_information_barrier_segment,
-            'user': user,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_information_barrier_segment_members"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('add_shield_members', type=type, shield_information_barrier=shield_information_barrier, shield_information_barrier_segment=shield_information_barrier_segment, user=user)
 
     def get_shield_barrier_segment_restriction_by_id(self, shield_information_barrier_segment_restriction_id: str) -> dict[str, Any]:
         """
@@ -9596,18 +7964,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segment restrictions
         """
-        if shield_information_barrier_segment_restriction_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_segment_restriction_id'.")
-        url = f"{self.base_url}/shield_information_barrier_segment_restrictions/{shield_information_barrier_segment_restriction_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_barrier_segment_restriction_by_id', shield_information_barrier_segment_restriction_id=shield_information_barrier_segment_restriction_id)
 
     def delete_shield_restriction(self, shield_information_barrier_segment_restriction_id: str) -> Any:
         """
@@ -9626,18 +7983,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segment restrictions
         """
-        if shield_information_barrier_segment_restriction_id is None:
-            raise ValueError("Missing required parameter 'shield_information_barrier_segment_restriction_id'.")
-        url = f"{self.base_url}/shield_information_barrier_segment_restrictions/{shield_information_barrier_segment_restriction_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_shield_restriction', shield_information_barrier_segment_restriction_id=shield_information_barrier_segment_restriction_id)
 
     def get_shield_infmt_barrier_sgmnt_restrictions(self, shield_information_barrier_segment_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -9662,16 +8008,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segment restrictions
         """
-        url = f"{self.base_url}/shield_information_barrier_segment_restrictions"
-        query_params = {k: v for k, v in [('shield_information_barrier_segment_id', shield_information_barrier_segment_id), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_infmt_barrier_sgmnt_restrictions', shield_information_barrier_segment_id=shield_information_barrier_segment_id, marker=marker, limit=limit)
 
     def create_shield_restrictions(self, type: Optional[str] = None, shield_information_barrier: Optional[dict[str, Any]] = None, shield_information_barrier_segment: Optional[dict[str, Any]] = None, restricted_segment: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -9698,24 +8035,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield information barrier segment restrictions
         """
-        request_body_data = None
-        request_body_data = {
-            'type': type,
-            'shield_information_barrier': shield_information_barrier,
-            'shield_information_barrier_segment': shield_information_barrier_segment,
-            'restricted_segment': restricted_segment,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_information_barrier_segment_restrictions"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_shield_restrictions', type=type, shield_information_barrier=shield_information_barrier, shield_information_barrier_segment=shield_information_barrier_segment, restricted_segment=restricted_segment)
 
     def get_device_pinners_id(self, device_pinner_id: str) -> dict[str, Any]:
         """
@@ -9734,18 +8054,7 @@ class BoxApp(APIApplication):
         Tags:
             Device pinners
         """
-        if device_pinner_id is None:
-            raise ValueError("Missing required parameter 'device_pinner_id'.")
-        url = f"{self.base_url}/device_pinners/{device_pinner_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_device_pinners_id', device_pinner_id=device_pinner_id)
 
     def delete_device_pinners_id(self, device_pinner_id: str) -> Any:
         """
@@ -9764,18 +8073,7 @@ class BoxApp(APIApplication):
         Tags:
             Device pinners
         """
-        if device_pinner_id is None:
-            raise ValueError("Missing required parameter 'device_pinner_id'.")
-        url = f"{self.base_url}/device_pinners/{device_pinner_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_device_pinners_id', device_pinner_id=device_pinner_id)
 
     def list_device_pins(self, enterprise_id: str, marker: Optional[str] = None, limit: Optional[int] = None, direction: Optional[str] = None) -> dict[str, Any]:
         """
@@ -9801,18 +8099,7 @@ class BoxApp(APIApplication):
         Tags:
             Device pinners
         """
-        if enterprise_id is None:
-            raise ValueError("Missing required parameter 'enterprise_id'.")
-        url = f"{self.base_url}/enterprises/{enterprise_id}/device_pinners"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit), ('direction', direction)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('list_device_pins', enterprise_id=enterprise_id, marker=marker, limit=limit, direction=direction)
 
     def get_terms_of_services(self, tos_type: Optional[str] = None) -> dict[str, Any]:
         """
@@ -9832,16 +8119,7 @@ class BoxApp(APIApplication):
         Tags:
             Terms of service
         """
-        url = f"{self.base_url}/terms_of_services"
-        query_params = {k: v for k, v in [('tos_type', tos_type)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_terms_of_services', tos_type=tos_type)
 
     def post_terms_of_services(self, status: Optional[str] = None, tos_type: Optional[str] = None, text: Optional[str] = None) -> dict[str, Any]:
         """
@@ -9865,23 +8143,7 @@ class BoxApp(APIApplication):
         Tags:
             Terms of service
         """
-        request_body_data = None
-        request_body_data = {
-            'status': status,
-            'tos_type': tos_type,
-            'text': text,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/terms_of_services"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_terms_of_services', status=status, tos_type=tos_type, text=text)
 
     def get_terms_of_services_id(self, terms_of_service_id: str) -> dict[str, Any]:
         """
@@ -9900,18 +8162,7 @@ class BoxApp(APIApplication):
         Tags:
             Terms of service
         """
-        if terms_of_service_id is None:
-            raise ValueError("Missing required parameter 'terms_of_service_id'.")
-        url = f"{self.base_url}/terms_of_services/{terms_of_service_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_terms_of_services_id', terms_of_service_id=terms_of_service_id)
 
     def put_terms_of_services_id(self, terms_of_service_id: str, status: Optional[str] = None, text: Optional[str] = None) -> dict[str, Any]:
         """
@@ -9934,24 +8185,7 @@ class BoxApp(APIApplication):
         Tags:
             Terms of service
         """
-        if terms_of_service_id is None:
-            raise ValueError("Missing required parameter 'terms_of_service_id'.")
-        request_body_data = None
-        request_body_data = {
-            'status': status,
-            'text': text,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/terms_of_services/{terms_of_service_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_terms_of_services_id', terms_of_service_id=terms_of_service_id, status=status, text=text)
 
     def get_tos_user_statuses(self, tos_id: str, user_id: Optional[str] = None) -> dict[str, Any]:
         """
@@ -9971,16 +8205,7 @@ class BoxApp(APIApplication):
         Tags:
             Terms of service user statuses
         """
-        url = f"{self.base_url}/terms_of_service_user_statuses"
-        query_params = {k: v for k, v in [('tos_id', tos_id), ('user_id', user_id)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_tos_user_statuses', tos_id=tos_id, user_id=user_id)
 
     def create_terms_of_service_statuses(self, tos: Optional[dict[str, Any]] = None, user: Optional[dict[str, Any]] = None, is_accepted: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -10001,23 +8226,7 @@ class BoxApp(APIApplication):
         Tags:
             Terms of service user statuses
         """
-        request_body_data = None
-        request_body_data = {
-            'tos': tos,
-            'user': user,
-            'is_accepted': is_accepted,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/terms_of_service_user_statuses"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_terms_of_service_statuses', tos=tos, user=user, is_accepted=is_accepted)
 
     def update_terms_of_service_user_status_by_id(self, terms_of_service_user_status_id: str, is_accepted: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -10037,23 +8246,7 @@ class BoxApp(APIApplication):
         Tags:
             Terms of service user statuses
         """
-        if terms_of_service_user_status_id is None:
-            raise ValueError("Missing required parameter 'terms_of_service_user_status_id'.")
-        request_body_data = None
-        request_body_data = {
-            'is_accepted': is_accepted,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/terms_of_service_user_statuses/{terms_of_service_user_status_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_terms_of_service_user_status_by_id', terms_of_service_user_status_id=terms_of_service_user_status_id, is_accepted=is_accepted)
 
     def list_collaboration_whitelist_entries(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -10076,16 +8269,7 @@ class BoxApp(APIApplication):
         Tags:
             Domain restrictions for collaborations
         """
-        url = f"{self.base_url}/collaboration_whitelist_entries"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('list_collaboration_whitelist_entries', marker=marker, limit=limit)
 
     def create_collaboration_whitelist_entry(self, domain: Optional[str] = None, direction: Optional[str] = None) -> dict[str, Any]:
         """
@@ -10105,22 +8289,7 @@ class BoxApp(APIApplication):
         Tags:
             Domain restrictions for collaborations
         """
-        request_body_data = None
-        request_body_data = {
-            'domain': domain,
-            'direction': direction,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/collaboration_whitelist_entries"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_collaboration_whitelist_entry', domain=domain, direction=direction)
 
     def get_whitelist_entry_by_id(self, collaboration_whitelist_entry_id: str) -> dict[str, Any]:
         """
@@ -10139,18 +8308,7 @@ class BoxApp(APIApplication):
         Tags:
             Domain restrictions for collaborations
         """
-        if collaboration_whitelist_entry_id is None:
-            raise ValueError("Missing required parameter 'collaboration_whitelist_entry_id'.")
-        url = f"{self.base_url}/collaboration_whitelist_entries/{collaboration_whitelist_entry_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_whitelist_entry_by_id', collaboration_whitelist_entry_id=collaboration_whitelist_entry_id)
 
     def delete_collaboration_whitelist_entry_by_id(self, collaboration_whitelist_entry_id: str) -> Any:
         """
@@ -10170,18 +8328,7 @@ class BoxApp(APIApplication):
         Tags:
             Domain restrictions for collaborations
         """
-        if collaboration_whitelist_entry_id is None:
-            raise ValueError("Missing required parameter 'collaboration_whitelist_entry_id'.")
-        url = f"{self.base_url}/collaboration_whitelist_entries/{collaboration_whitelist_entry_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_collaboration_whitelist_entry_by_id', collaboration_whitelist_entry_id=collaboration_whitelist_entry_id)
 
     def list_whitelist_targets(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -10204,16 +8351,7 @@ class BoxApp(APIApplication):
         Tags:
             Domain restrictions (User exemptions)
         """
-        url = f"{self.base_url}/collaboration_whitelist_exempt_targets"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('list_whitelist_targets', marker=marker, limit=limit)
 
     def create_collaboration_whitelist_exempt_target(self, user: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -10232,21 +8370,7 @@ class BoxApp(APIApplication):
         Tags:
             Domain restrictions (User exemptions)
         """
-        request_body_data = None
-        request_body_data = {
-            'user': user,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/collaboration_whitelist_exempt_targets"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_collaboration_whitelist_exempt_target', user=user)
 
     def get_exempt_target_by_id(self, collaboration_whitelist_exempt_target_id: str) -> dict[str, Any]:
         """
@@ -10265,18 +8389,7 @@ class BoxApp(APIApplication):
         Tags:
             Domain restrictions (User exemptions)
         """
-        if collaboration_whitelist_exempt_target_id is None:
-            raise ValueError("Missing required parameter 'collaboration_whitelist_exempt_target_id'.")
-        url = f"{self.base_url}/collaboration_whitelist_exempt_targets/{collaboration_whitelist_exempt_target_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_exempt_target_by_id', collaboration_whitelist_exempt_target_id=collaboration_whitelist_exempt_target_id)
 
     def delete_collab_whitelist_exempt_target_by_id(self, collaboration_whitelist_exempt_target_id: str) -> Any:
         """
@@ -10296,18 +8409,7 @@ class BoxApp(APIApplication):
         Tags:
             Domain restrictions (User exemptions)
         """
-        if collaboration_whitelist_exempt_target_id is None:
-            raise ValueError("Missing required parameter 'collaboration_whitelist_exempt_target_id'.")
-        url = f"{self.base_url}/collaboration_whitelist_exempt_targets/{collaboration_whitelist_exempt_target_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_collab_whitelist_exempt_target_by_id', collaboration_whitelist_exempt_target_id=collaboration_whitelist_exempt_target_id)
 
     def get_storage_policies(self, fields: Optional[List[str]] = None, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -10339,16 +8441,7 @@ class BoxApp(APIApplication):
         Tags:
             Standard and Zones Storage Policies
         """
-        url = f"{self.base_url}/storage_policies"
-        query_params = {k: v for k, v in [('fields', fields), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_storage_policies', fields=fields, marker=marker, limit=limit)
 
     def get_storage_policies_id(self, storage_policy_id: str) -> dict[str, Any]:
         """
@@ -10367,18 +8460,7 @@ class BoxApp(APIApplication):
         Tags:
             Standard and Zones Storage Policies
         """
-        if storage_policy_id is None:
-            raise ValueError("Missing required parameter 'storage_policy_id'.")
-        url = f"{self.base_url}/storage_policies/{storage_policy_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_storage_policies_id', storage_policy_id=storage_policy_id)
 
     def get_storage_policy_assignments(self, resolved_for_type: str, resolved_for_id: str, marker: Optional[str] = None) -> dict[str, Any]:
         """
@@ -10403,16 +8485,7 @@ class BoxApp(APIApplication):
         Tags:
             Standard and Zones Storage Policy Assignments
         """
-        url = f"{self.base_url}/storage_policy_assignments"
-        query_params = {k: v for k, v in [('marker', marker), ('resolved_for_type', resolved_for_type), ('resolved_for_id', resolved_for_id)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_storage_policy_assignments', resolved_for_type=resolved_for_type, resolved_for_id=resolved_for_id, marker=marker)
 
     def create_storage_policy_assignment(self, storage_policy: Optional[dict[str, Any]] = None, assigned_to: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -10434,22 +8507,7 @@ class BoxApp(APIApplication):
         Tags:
             Standard and Zones Storage Policy Assignments
         """
-        request_body_data = None
-        request_body_data = {
-            'storage_policy': storage_policy,
-            'assigned_to': assigned_to,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/storage_policy_assignments"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_storage_policy_assignment', storage_policy=storage_policy, assigned_to=assigned_to)
 
     def get_storage_policy_assignment(self, storage_policy_assignment_id: str) -> dict[str, Any]:
         """
@@ -10468,18 +8526,7 @@ class BoxApp(APIApplication):
         Tags:
             Standard and Zones Storage Policy Assignments
         """
-        if storage_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'storage_policy_assignment_id'.")
-        url = f"{self.base_url}/storage_policy_assignments/{storage_policy_assignment_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_storage_policy_assignment', storage_policy_assignment_id=storage_policy_assignment_id)
 
     def update_storage_policy_assignment(self, storage_policy_assignment_id: str, storage_policy: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -10500,23 +8547,7 @@ class BoxApp(APIApplication):
         Tags:
             Standard and Zones Storage Policy Assignments
         """
-        if storage_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'storage_policy_assignment_id'.")
-        request_body_data = None
-        request_body_data = {
-            'storage_policy': storage_policy,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/storage_policy_assignments/{storage_policy_assignment_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_storage_policy_assignment', storage_policy_assignment_id=storage_policy_assignment_id, storage_policy=storage_policy)
 
     def delete_storage_policy_assignment(self, storage_policy_assignment_id: str) -> Any:
         """
@@ -10536,18 +8567,7 @@ class BoxApp(APIApplication):
         Tags:
             Standard and Zones Storage Policy Assignments
         """
-        if storage_policy_assignment_id is None:
-            raise ValueError("Missing required parameter 'storage_policy_assignment_id'.")
-        url = f"{self.base_url}/storage_policy_assignments/{storage_policy_assignment_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_storage_policy_assignment', storage_policy_assignment_id=storage_policy_assignment_id)
 
     def post_zip_downloads(self, items: Optional[List[dict[str, Any]]] = None, download_file_name: Optional[str] = None) -> dict[str, Any]:
         """
@@ -10571,22 +8591,7 @@ class BoxApp(APIApplication):
         Tags:
             Zip Downloads
         """
-        request_body_data = None
-        request_body_data = {
-            'items': items,
-            'download_file_name': download_file_name,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/zip_downloads"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_zip_downloads', items=items, download_file_name=download_file_name)
 
     def get_zip_downloads_id_content(self, zip_download_id: str) -> Any:
         """
@@ -10606,18 +8611,7 @@ class BoxApp(APIApplication):
         Tags:
             Zip Downloads
         """
-        if zip_download_id is None:
-            raise ValueError("Missing required parameter 'zip_download_id'.")
-        url = f"{self.base_url}/zip_downloads/{zip_download_id}/content"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_zip_downloads_id_content', zip_download_id=zip_download_id)
 
     def get_zip_downloads_id_status(self, zip_download_id: str) -> dict[str, Any]:
         """
@@ -10636,18 +8630,7 @@ class BoxApp(APIApplication):
         Tags:
             Zip Downloads
         """
-        if zip_download_id is None:
-            raise ValueError("Missing required parameter 'zip_download_id'.")
-        url = f"{self.base_url}/zip_downloads/{zip_download_id}/status"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_zip_downloads_id_status', zip_download_id=zip_download_id)
 
     def post_sign_requests_id_cancel(self, sign_request_id: str) -> dict[str, Any]:
         """
@@ -10666,19 +8649,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Sign requests
         """
-        if sign_request_id is None:
-            raise ValueError("Missing required parameter 'sign_request_id'.")
-        request_body_data = None
-        url = f"{self.base_url}/sign_requests/{sign_request_id}/cancel"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_sign_requests_id_cancel', sign_request_id=sign_request_id)
 
     def post_sign_requests_id_resend(self, sign_request_id: str) -> Any:
         """
@@ -10698,19 +8669,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Sign requests
         """
-        if sign_request_id is None:
-            raise ValueError("Missing required parameter 'sign_request_id'.")
-        request_body_data = None
-        url = f"{self.base_url}/sign_requests/{sign_request_id}/resend"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_sign_requests_id_resend', sign_request_id=sign_request_id)
 
     def get_sign_requests_id(self, sign_request_id: str) -> dict[str, Any]:
         """
@@ -10729,18 +8688,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Sign requests
         """
-        if sign_request_id is None:
-            raise ValueError("Missing required parameter 'sign_request_id'.")
-        url = f"{self.base_url}/sign_requests/{sign_request_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_sign_requests_id', sign_request_id=sign_request_id)
 
     def get_sign_requests(self, marker: Optional[str] = None, limit: Optional[int] = None, senders: Optional[List[str]] = None, shared_requests: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -10769,16 +8717,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Sign requests
         """
-        url = f"{self.base_url}/sign_requests"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit), ('senders', senders), ('shared_requests', shared_requests)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_sign_requests', marker=marker, limit=limit, senders=senders, shared_requests=shared_requests)
 
     def post_sign_requests(self, is_document_preparation_needed: Optional[bool] = None, redirect_url: Optional[str] = None, declined_redirect_url: Optional[str] = None, are_text_signatures_enabled: Optional[bool] = None, email_subject: Optional[str] = None, email_message: Optional[str] = None, are_reminders_enabled: Optional[bool] = None, name: Optional[str] = None, prefill_tags: Optional[List[dict[str, Any]]] = None, days_valid: Optional[int] = None, external_id: Optional[str] = None, template_id: Optional[str] = None, external_system_name: Optional[str] = None, source_files: Optional[List[dict[str, Any]]] = None, signature_color: Optional[str] = None, signers: Optional[List[dict[str, Any]]] = None, parent_folder: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -10820,37 +8759,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Sign requests
         """
-        request_body_data = None
-        request_body_data = {
-            'is_document_preparation_needed': is_document_preparation_needed,
-            'redirect_url': redirect_url,
-            'declined_redirect_url': declined_redirect_url,
-            'are_text_signatures_enabled': are_text_signatures_enabled,
-            'email_subject': email_subject,
-            'email_message': email_message,
-            'are_reminders_enabled': are_reminders_enabled,
-            'name': name,
-            'prefill_tags': prefill_tags,
-            'days_valid': days_valid,
-            'external_id': external_id,
-            'template_id': template_id,
-            'external_system_name': external_system_name,
-            'source_files': source_files,
-            'signature_color': signature_color,
-            'signers': signers,
-            'parent_folder': parent_folder,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/sign_requests"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_sign_requests', is_document_preparation_needed=is_document_preparation_needed, redirect_url=redirect_url, declined_redirect_url=declined_redirect_url, are_text_signatures_enabled=are_text_signatures_enabled, email_subject=email_subject, email_message=email_message, are_reminders_enabled=are_reminders_enabled, name=name, prefill_tags=prefill_tags, days_valid=days_valid, external_id=external_id, template_id=template_id, external_system_name=external_system_name, source_files=source_files, signature_color=signature_color, signers=signers, parent_folder=parent_folder)
 
     def get_workflows(self, folder_id: str, trigger_type: Optional[str] = None, limit: Optional[int] = None, marker: Optional[str] = None) -> dict[str, Any]:
         """
@@ -10884,16 +8793,7 @@ class BoxApp(APIApplication):
         Tags:
             Workflows
         """
-        url = f"{self.base_url}/workflows"
-        query_params = {k: v for k, v in [('folder_id', folder_id), ('trigger_type', trigger_type), ('limit', limit), ('marker', marker)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_workflows', folder_id=folder_id, trigger_type=trigger_type, limit=limit, marker=marker)
 
     def post_workflows_id_start(self, workflow_id: str, type: Optional[str] = None, flow: Optional[dict[str, Any]] = None, files: Optional[List[dict[str, Any]]] = None, folder: Optional[dict[str, Any]] = None, outcomes: Optional[List[dict[str, Any]]] = None) -> Any:
         """
@@ -10918,27 +8818,7 @@ class BoxApp(APIApplication):
         Tags:
             Workflows
         """
-        if workflow_id is None:
-            raise ValueError("Missing required parameter 'workflow_id'.")
-        request_body_data = None
-        request_body_data = {
-            'type': type,
-            'flow': flow,
-            'files': files,
-            'folder': folder,
-            'outcomes': outcomes,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/workflows/{workflow_id}/start"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_workflows_id_start', workflow_id=workflow_id, type=type, flow=flow, files=files, folder=folder, outcomes=outcomes)
 
     def get_sign_templates(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -10961,16 +8841,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Sign templates
         """
-        url = f"{self.base_url}/sign_templates"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_sign_templates', marker=marker, limit=limit)
 
     def get_sign_templates_id(self, template_id: str) -> dict[str, Any]:
         """
@@ -10989,18 +8860,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Sign templates
         """
-        if template_id is None:
-            raise ValueError("Missing required parameter 'template_id'.")
-        url = f"{self.base_url}/sign_templates/{template_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_sign_templates_id', template_id=template_id)
 
     def get_integration_mappings_slack(self, marker: Optional[str] = None, limit: Optional[int] = None, partner_item_type: Optional[str] = None, partner_item_id: Optional[str] = None, box_item_id: Optional[str] = None, box_item_type: Optional[str] = None, is_manually_created: Optional[bool] = None) -> dict[str, Any]:
         """
@@ -11028,16 +8888,7 @@ class BoxApp(APIApplication):
         Tags:
             Integration mappings
         """
-        url = f"{self.base_url}/integration_mappings/slack"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit), ('partner_item_type', partner_item_type), ('partner_item_id', partner_item_id), ('box_item_id', box_item_id), ('box_item_type', box_item_type), ('is_manually_created', is_manually_created)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_integration_mappings_slack', marker=marker, limit=limit, partner_item_type=partner_item_type, partner_item_id=partner_item_id, box_item_id=box_item_id, box_item_type=box_item_type, is_manually_created=is_manually_created)
 
     def create_slack_mapping(self, partner_item: Optional[Any] = None, box_item: Optional[Any] = None, options: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11057,24 +8908,8 @@ class BoxApp(APIApplication):
 
         Tags:
             Integration mappings
-        """
-        request_body_data = None
-        request_body_data = {
-            'partner_item': partner_item,
-            'box_item': box_item,
-            'options': options,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/integration_mappings/slack"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        """
+        return self._call('create_slack_mapping', partner_item=partner_item, box_item=box_item, options=options)
 
     def update_slack_integration_mapping_by_id(self, integration_mapping_id: str, box_item: Optional[Any] = None, options: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11095,24 +8930,7 @@ class BoxApp(APIApplication):
         Tags:
             Integration mappings
         """
-        if integration_mapping_id is None:
-            raise ValueError("Missing required parameter 'integration_mapping_id'.")
-        request_body_data = None
-        request_body_data = {
-            'box_item': box_item,
-            'options': options,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/integration_mappings/slack/{integration_mapping_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_slack_integration_mapping_by_id', integration_mapping_id=integration_mapping_id, box_item=box_item, options=options)
 
     def delete_slack_mapping_by_id(self, integration_mapping_id: str) -> Any:
         """
@@ -11131,18 +8949,7 @@ class BoxApp(APIApplication):
         Tags:
             Integration mappings
         """
-        if integration_mapping_id is None:
-            raise ValueError("Missing required parameter 'integration_mapping_id'.")
-        url = f"{self.base_url}/integration_mappings/slack/{integration_mapping_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_slack_mapping_by_id', integration_mapping_id=integration_mapping_id)
 
     def get_integration_mappings_teams(self, partner_item_type: Optional[str] = None, partner_item_id: Optional[str] = None, box_item_id: Optional[str] = None, box_item_type: Optional[str] = None) -> dict[str, Any]:
         """
@@ -11164,16 +8971,7 @@ class BoxApp(APIApplication):
         Tags:
             Integration mappings
         """
-        url = f"{self.base_url}/integration_mappings/teams"
-        query_params = {k: v for k, v in [('partner_item_type', partner_item_type), ('partner_item_id', partner_item_id), ('box_item_id', box_item_id), ('box_item_type', box_item_type)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_integration_mappings_teams', partner_item_type=partner_item_type, partner_item_id=partner_item_id, box_item_id=box_item_id, box_item_type=box_item_type)
 
     def create_integration_mapping_team(self, partner_item: Optional[Any] = None, box_item: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11193,22 +8991,7 @@ class BoxApp(APIApplication):
         Tags:
             Integration mappings
         """
-        request_body_data = None
-        request_body_data = {
-            'partner_item': partner_item,
-            'box_item': box_item,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/integration_mappings/teams"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('create_integration_mapping_team', partner_item=partner_item, box_item=box_item)
 
     def update_integration_mapping_team(self, integration_mapping_id: str, box_item: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11228,23 +9011,7 @@ class BoxApp(APIApplication):
         Tags:
             Integration mappings
         """
-        if integration_mapping_id is None:
-            raise ValueError("Missing required parameter 'integration_mapping_id'.")
-        request_body_data = None
-        request_body_data = {
-            'box_item': box_item,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/integration_mappings/teams/{integration_mapping_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('update_integration_mapping_team', integration_mapping_id=integration_mapping_id, box_item=box_item)
 
     def delete_integration_mapping_by_id(self, integration_mapping_id: str) -> Any:
         """
@@ -11263,18 +9030,7 @@ class BoxApp(APIApplication):
         Tags:
             Integration mappings
         """
-        if integration_mapping_id is None:
-            raise ValueError("Missing required parameter 'integration_mapping_id'.")
-        url = f"{self.base_url}/integration_mappings/teams/{integration_mapping_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_integration_mapping_by_id', integration_mapping_id=integration_mapping_id)
 
     def post_ai_ask(self, mode: Optional[str] = None, prompt: Optional[str] = None, items: Optional[List[dict[str, Any]]] = None, dialogue_history: Optional[List[dict[str, Any]]] = None, include_citations: Optional[bool] = None, ai_agent: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11298,26 +9054,7 @@ class BoxApp(APIApplication):
         Tags:
             AI
         """
-        request_body_data = None
-        request_body_data = {
-            'mode': mode,
-            'prompt': prompt,
-            'items': items,
-            'dialogue_history': dialogue_history,
-            'include_citations': include_citations,
-            'ai_agent': ai_agent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/ai/ask"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_ai_ask', mode=mode, prompt=prompt, items=items, dialogue_history=dialogue_history, include_citations=include_citations, ai_agent=ai_agent)
 
     def post_ai_text_gen(self, prompt: Optional[str] = None, items: Optional[List[dict[str, Any]]] = None, dialogue_history: Optional[List[dict[str, Any]]] = None, ai_agent: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11343,24 +9080,7 @@ class BoxApp(APIApplication):
         Tags:
             AI
         """
-        request_body_data = None
-        request_body_data = {
-            'prompt': prompt,
-            'items': items,
-            'dialogue_history': dialogue_history,
-            'ai_agent': ai_agent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/ai/text_gen"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_ai_text_gen', prompt=prompt, items=items, dialogue_history=dialogue_history, ai_agent=ai_agent)
 
     def get_ai_agent_default(self, mode: str, language: Optional[str] = None, model: Optional[str] = None) -> Any:
         """
@@ -11388,16 +9108,7 @@ class BoxApp(APIApplication):
         Tags:
             AI
         """
-        url = f"{self.base_url}/ai_agent_default"
-        query_params = {k: v for k, v in [('mode', mode), ('language', language), ('model', model)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_ai_agent_default', mode=mode, language=language, model=model)
 
     def post_ai_extract(self, prompt: Optional[str] = None, items: Optional[List[dict[str, Any]]] = None, ai_agent: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11418,23 +9129,7 @@ class BoxApp(APIApplication):
         Tags:
             AI
         """
-        request_body_data = None
-        request_body_data = {
-            'prompt': prompt,
-            'items': items,
-            'ai_agent': ai_agent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/ai/extract"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_ai_extract', prompt=prompt, items=items, ai_agent=ai_agent)
 
     def post_ai_extract_structured(self, items: Optional[List[dict[str, Any]]] = None, metadata_template: Optional[dict[str, Any]] = None, fields: Optional[List[dict[str, Any]]] = None, ai_agent: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11458,24 +9153,7 @@ class BoxApp(APIApplication):
         Tags:
             AI
         """
-        request_body_data = None
-        request_body_data = {
-            'items': items,
-            'metadata_template': metadata_template,
-            'fields': fields,
-            'ai_agent': ai_agent,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/ai/extract_structured"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_ai_extract_structured', items=items, metadata_template=metadata_template, fields=fields, ai_agent=ai_agent)
 
     def get_ai_agents(self, mode: Optional[List[str]] = None, fields: Optional[List[str]] = None, agent_state: Optional[List[str]] = None, include_box_default: Optional[bool] = None, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -11499,16 +9177,7 @@ class BoxApp(APIApplication):
         Tags:
             AI Studio, important
         """
-        url = f"{self.base_url}/ai_agents"
-        query_params = {k: v for k, v in [('mode', mode), ('fields', fields), ('agent_state', agent_state), ('include_box_default', include_box_default), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_ai_agents', mode=mode, fields=fields, agent_state=agent_state, include_box_default=include_box_default, marker=marker, limit=limit)
 
     def post_ai_agents(self, type: Optional[str] = None, name: Optional[str] = None, access_state: Optional[str] = None, icon_reference: Optional[str] = None, allowed_entities: Optional[List[dict[str, Any]]] = None, ask: Optional[dict[str, Any]] = None, text_gen: Optional[dict[str, Any]] = None, extract: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -11535,28 +9204,7 @@ class BoxApp(APIApplication):
         Tags:
             AI Studio
         """
-        request_body_data = None
-        request_body_data = {
-            'type': type,
-            'name': name,
-            'access_state': access_state,
-            'icon_reference': icon_reference,
-            'allowed_entities': allowed_entities,
-            'ask': ask,
-            'text_gen': text_gen,
-            'extract': extract,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/ai_agents"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_ai_agents', type=type, name=name, access_state=access_state, icon_reference=icon_reference, allowed_entities=allowed_entities, ask=ask, text_gen=text_gen, extract=extract)
 
     def put_ai_agents_id(self, agent_id: str, type: Optional[str] = None, name: Optional[str] = None, access_state: Optional[str] = None, icon_reference: Optional[str] = None, allowed_entities: Optional[List[dict[str, Any]]] = None, ask: Optional[dict[str, Any]] = None, text_gen: Optional[dict[str, Any]] = None, extract: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         """
@@ -11584,30 +9232,7 @@ class BoxApp(APIApplication):
         Tags:
             AI Studio
         """
-        if agent_id is None:
-            raise ValueError("Missing required parameter 'agent_id'.")
-        request_body_data = None
-        request_body_data = {
-            'type': type,
-            'name': name,
-            'access_state': access_state,
-            'icon_reference': icon_reference,
-            'allowed_entities': allowed_entities,
-            'ask': ask,
-            'text_gen': text_gen,
-            'extract': extract,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/ai_agents/{agent_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_ai_agents_id', agent_id=agent_id, type=type, name=name, access_state=access_state, icon_reference=icon_reference, allowed_entities=allowed_entities, ask=ask, text_gen=text_gen, extract=extract)
 
     def get_ai_agents_id(self, agent_id: str, fields: Optional[List[str]] = None) -> dict[str, Any]:
         """
@@ -11627,18 +9252,7 @@ class BoxApp(APIApplication):
         Tags:
             AI Studio
         """
-        if agent_id is None:
-            raise ValueError("Missing required parameter 'agent_id'.")
-        url = f"{self.base_url}/ai_agents/{agent_id}"
-        query_params = {k: v for k, v in [('fields', fields)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_ai_agents_id', agent_id=agent_id, fields=fields)
 
     def delete_ai_agents_id(self, agent_id: str) -> Any:
         """
@@ -11657,18 +9271,7 @@ class BoxApp(APIApplication):
         Tags:
             AI Studio
         """
-        if agent_id is None:
-            raise ValueError("Missing required parameter 'agent_id'.")
-        url = f"{self.base_url}/ai_agents/{agent_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_ai_agents_id', agent_id=agent_id)
 
     def post_docgen_templates_v(self, file: Any) -> dict[str, Any]:
         """
@@ -11687,21 +9290,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen templates
         """
-        request_body_data = None
-        request_body_data = {
-            'file': file,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/docgen_templates"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_docgen_templates_v', file=file)
 
     def get_docgen_templates_v(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -11724,16 +9313,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen templates
         """
-        url = f"{self.base_url}/docgen_templates"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_docgen_templates_v', marker=marker, limit=limit)
 
     def delete_template_by_id(self, template_id: str) -> Any:
         """
@@ -11752,18 +9332,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen templates
         """
-        if template_id is None:
-            raise ValueError("Missing required parameter 'template_id'.")
-        url = f"{self.base_url}/docgen_templates/{template_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_template_by_id', template_id=template_id)
 
     def get_docgen_template_by_id(self, template_id: str) -> dict[str, Any]:
         """
@@ -11782,18 +9351,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen templates
         """
-        if template_id is None:
-            raise ValueError("Missing required parameter 'template_id'.")
-        url = f"{self.base_url}/docgen_templates/{template_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_docgen_template_by_id', template_id=template_id)
 
     def get_docgen_template_tags(self, template_id: str, template_version_id: Optional[str] = None, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -11818,18 +9376,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen templates
         """
-        if template_id is None:
-            raise ValueError("Missing required parameter 'template_id'.")
-        url = f"{self.base_url}/docgen_templates/{template_id}/tags"
-        query_params = {k: v for k, v in [('template_version_id', template_version_id), ('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_docgen_template_tags', template_id=template_id, template_version_id=template_version_id, marker=marker, limit=limit)
 
     def get_docgen_jobs_id_v(self, job_id: str) -> dict[str, Any]:
         """
@@ -11848,18 +9395,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen
         """
-        if job_id is None:
-            raise ValueError("Missing required parameter 'job_id'.")
-        url = f"{self.base_url}/docgen_jobs/{job_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_docgen_jobs_id_v', job_id=job_id)
 
     def get_docgen_jobs_v(self, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -11882,16 +9418,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen
         """
-        url = f"{self.base_url}/docgen_jobs"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_docgen_jobs_v', marker=marker, limit=limit)
 
     def get_template_job(self, template_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -11915,18 +9442,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen templates
         """
-        if template_id is None:
-            raise ValueError("Missing required parameter 'template_id'.")
-        url = f"{self.base_url}/docgen_template_jobs/{template_id}"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_template_job', template_id=template_id, marker=marker, limit=limit)
 
     def get_batch_job_details(self, batch_id: str, marker: Optional[str] = None, limit: Optional[int] = None) -> dict[str, Any]:
         """
@@ -11950,18 +9466,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen
         """
-        if batch_id is None:
-            raise ValueError("Missing required parameter 'batch_id'.")
-        url = f"{self.base_url}/docgen_batch_jobs/{batch_id}"
-        query_params = {k: v for k, v in [('marker', marker), ('limit', limit)] if v is not None}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_batch_job_details', batch_id=batch_id, marker=marker, limit=limit)
 
     def post_docgen_batches_v(self, file: Any, input_source: str, destination_folder: Any, output_type: str, document_generation_data: List[dict[str, Any]], file_version: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -11985,26 +9490,7 @@ class BoxApp(APIApplication):
         Tags:
             Box Doc Gen
         """
-        request_body_data = None
-        request_body_data = {
-            'file': file,
-            'file_version': file_version,
-            'input_source': input_source,
-            'destination_folder': destination_folder,
-            'output_type': output_type,
-            'document_generation_data': document_generation_data,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/docgen_batches"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_docgen_batches_v', file=file, input_source=input_source, destination_folder=destination_folder, output_type=output_type, document_generation_data=document_generation_data, file_version=file_version)
 
     def get_shield_lists_v(self) -> dict[str, Any]:
         """
@@ -12020,16 +9506,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield lists
         """
-        url = f"{self.base_url}/shield_lists"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_lists_v')
 
     def post_shield_lists_v(self, name: str, content: Any, description: Optional[str] = None) -> dict[str, Any]:
         """
@@ -12050,23 +9527,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield lists
         """
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'description': description,
-            'content': content,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_lists"
-        query_params = {}
-        response = self._post(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('post_shield_lists_v', name=name, content=content, description=description)
 
     def get_shield_lists_id_v(self, shield_list_id: str) -> dict[str, Any]:
         """
@@ -12085,18 +9546,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield lists
         """
-        if shield_list_id is None:
-            raise ValueError("Missing required parameter 'shield_list_id'.")
-        url = f"{self.base_url}/shield_lists/{shield_list_id}"
-        query_params = {}
-        response = self._get(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('get_shield_lists_id_v', shield_list_id=shield_list_id)
 
     def delete_shield_lists_id_v(self, shield_list_id: str) -> Any:
         """
@@ -12115,18 +9565,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield lists
         """
-        if shield_list_id is None:
-            raise ValueError("Missing required parameter 'shield_list_id'.")
-        url = f"{self.base_url}/shield_lists/{shield_list_id}"
-        query_params = {}
-        response = self._delete(url, params=query_params)
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('delete_shield_lists_id_v', shield_list_id=shield_list_id)
 
     def put_shield_lists_id_v(self, shield_list_id: str, name: Optional[str] = None, description: Optional[str] = None, content: Optional[Any] = None) -> dict[str, Any]:
         """
@@ -12148,25 +9587,7 @@ class BoxApp(APIApplication):
         Tags:
             Shield lists
         """
-        if shield_list_id is None:
-            raise ValueError("Missing required parameter 'shield_list_id'.")
-        request_body_data = None
-        request_body_data = {
-            'name': name,
-            'description': description,
-            'content': content,
-        }
-        request_body_data = {k: v for k, v in request_body_data.items() if v is not None}
-        url = f"{self.base_url}/shield_lists/{shield_list_id}"
-        query_params = {}
-        response = self._put(url, data=request_body_data, params=query_params, content_type='application/json')
-        response.raise_for_status()
-        if response.status_code == 204 or not response.content or not response.text.strip():
-            return None
-        try:
-            return response.json()
-        except ValueError:
-            return None
+        return self._call('put_shield_lists_id_v', shield_list_id=shield_list_id, name=name, description=description, content=content)
 
     def list_tools(self):
         return [
@@ -12466,4 +9887,754 @@ class BoxApp(APIApplication):
             self.get_shield_lists_id_v,
             self.delete_shield_lists_id_v,
             self.put_shield_lists_id_v
-        ]
\ No newline at end of file
+        ]
+
+
+# Every generated tool forwards to BoxApp._call, which builds its request from this table.
+_ENDPOINTS: dict[str, _Endpoint] = {
+    'get_authorize': _Endpoint('GET', '/authorize', query=('response_type', 'client_id', 'redirect_uri', 'state', 'scope'), choices=(('response_type', frozenset({'code'})),)),
+    'post_oauth_token': _Endpoint('POST', '/oauth2/token', body=('grant_type', 'client_id', 'client_secret', 'code', 'refresh_token', 'assertion', 'subject_token', 'subject_token_type', 'actor_token', 'actor_token_type', 'scope', 'resource', 'box_subject_type', 'box_subject_id', 'box_shared_link'), content_type='application/x-www-form-urlencoded'),
+    'post_oauth_token_refresh': _Endpoint('POST', '/oauth2/token#refresh', body=('grant_type', 'client_id', 'client_secret', 'refresh_token'), content_type='application/x-www-form-urlencoded'),
+    'post_oauth_revoke': _Endpoint('POST', '/oauth2/revoke', body=('client_id', 'client_secret', 'token'), content_type='application/x-www-form-urlencoded'),
+    'get_files_id': _Endpoint('GET', '/files/{file_id}', query=('fields',)),
+    'post_files_id': _Endpoint('POST', '/files/{file_id}', query=('fields',), body=('name', 'parent')),
+    'put_files_id': _Endpoint('PUT', '/files/{file_id}', query=('fields',), body=('name', 'description', 'parent', 'shared_link', 'lock', 'disposition_at', 'permissions', 'collections', 'tags')),
+    'delete_files_id': _Endpoint('DELETE', '/files/{file_id}'),
+    'list_file_associations': _Endpoint('GET', '/files/{file_id}/app_item_associations', query=('limit', 'marker', 'application_type')),
+    'post_files_id_content': _Endpoint('POST', '/files/{file_id}/content', query=('fields',), body=('attributes',), content_type='multipart/form-data', files=('file',)),
+    'options_files_content': _Endpoint('OPTIONS', '/files/content', body=('name', 'size', 'parent')),
+    'post_files_content': _Endpoint('POST', '/files/content', query=('fields',), body=('attributes',), content_type='multipart/form-data', files=('file',)),
+    'post_files_upload_sessions': _Endpoint('POST', '/files/upload_sessions', body=('folder_id', 'file_size', 'file_name')),
+    'post_files_id_upload_sessions': _Endpoint('POST', '/files/{file_id}/upload_sessions', body=('file_size', 'file_name')),
+    'get_files_upload_sessions_id': _Endpoint('GET', '/files/upload_sessions/{upload_session_id}'),
+    'put_files_upload_sessions_id': _Endpoint('PUT', '/files/upload_sessions/{upload_session_id}', body='body_content', content_type='application/octet-stream'),
+    'delete_upload_session_by_id': _Endpoint('DELETE', '/files/upload_sessions/{upload_session_id}'),
+    'get_upload_session_parts': _Endpoint('GET', '/files/upload_sessions/{upload_session_id}/parts', query=('offset', 'limit')),
+    'commit_upload_session': _Endpoint('POST', '/files/upload_sessions/{upload_session_id}/commit', body=('parts',)),
+    'post_files_id_copy': _Endpoint('POST', '/files/{file_id}/copy', query=('fields',), body=('name', 'version', 'parent')),
+    'get_files_id_collaborations': _Endpoint('GET', '/files/{file_id}/collaborations', query=('fields', 'limit', 'marker')),
+    'get_files_id_comments': _Endpoint('GET', '/files/{file_id}/comments', query=('fields', 'limit', 'offset')),
+    'get_files_id_tasks': _Endpoint('GET', '/files/{file_id}/tasks'),
+    'get_files_id_trash': _Endpoint('GET', '/files/{file_id}/trash', query=('fields',)),
+    'delete_files_id_trash': _Endpoint('DELETE', '/files/{file_id}/trash'),
+    'get_files_id_versions': _Endpoint('GET', '/files/{file_id}/versions', query=('fields', 'limit', 'offset')),
+    'get_files_id_versions_id': _Endpoint('GET', '/files/{file_id}/versions/{file_version_id}', query=('fields',)),
+    'delete_files_id_versions_id': _Endpoint('DELETE', '/files/{file_id}/versions/{file_version_id}'),
+    'put_files_id_versions_id': _Endpoint('PUT', '/files/{file_id}/versions/{file_version_id}', body=('trashed_at',), nullable=('trashed_at',)),
+    'post_files_id_versions_current': _Endpoint('POST', '/files/{file_id}/versions/current', query=('fields',), body=('id', 'type')),
+    'get_files_id_metadata': _Endpoint('GET', '/files/{file_id}/metadata'),
+    'get_file_security_classification_by_id': _Endpoint('GET', '/files/{file_id}/metadata/enterprise/securityClassification-6VMVochwUWo'),
+    'update_file_security_classification': _Endpoint('POST', '/files/{file_id}/metadata/enterprise/securityClassification-6VMVochwUWo', body=('Box__Security__Classification__Key',)),
+    'put_update_file_security_classification': _Endpoint('PUT', '/files/{file_id}/metadata/enterprise/securityClassification-6VMVochwUWo', body='items', content_type='application/json-patch+json'),
+    'delete_file_metadata': _Endpoint('DELETE', '/files/{file_id}/metadata/enterprise/securityClassification-6VMVochwUWo'),
+    'get_files_id_metadata_id_id': _Endpoint('GET', '/files/{file_id}/metadata/{scope}/{template_key}'),
+    'post_files_id_metadata_id_id': _Endpoint('POST', '/files/{file_id}/metadata/{scope}/{template_key}', body='request_body'),
+    'put_files_id_metadata_id_id': _Endpoint('PUT', '/files/{file_id}/metadata/{scope}/{template_key}', body='items', content_type='application/json-patch+json'),
+    'delete_files_id_metadata_id_id': _Endpoint('DELETE', '/files/{file_id}/metadata/{scope}/{template_key}'),
+    'get_global_metadata': _Endpoint('GET', '/files/{file_id}/metadata/global/boxSkillsCards'),
+    'post_file_metadata_global_box_skills_cards': _Endpoint('POST', '/files/{file_id}/metadata/global/boxSkillsCards', body=('cards',)),
+    'update_file_metadata': _Endpoint('PUT', '/files/{file_id}/metadata/global/boxSkillsCards', body='items', content_type='application/json-patch+json'),
+    'delete_file_global_box_skills_cards': _Endpoint('DELETE', '/files/{file_id}/metadata/global/boxSkillsCards'),
+    'get_files_id_watermark': _Endpoint('GET', '/files/{file_id}/watermark'),
+    'put_files_id_watermark': _Endpoint('PUT', '/files/{file_id}/watermark', body=('watermark',)),
+    'delete_files_id_watermark': _Endpoint('DELETE', '/files/{file_id}/watermark'),
+    'get_file_requests_id': _Endpoint('GET', '/file_requests/{file_request_id}'),
+    'put_file_requests_id': _Endpoint('PUT', '/file_requests/{file_request_id}', body=('title', 'description', 'status', 'is_email_required', 'is_description_required', 'expires_at')),
+    'delete_file_requests_id': _Endpoint('DELETE', '/file_requests/{file_request_id}'),
+    'post_file_requests_id_copy': _Endpoint('POST', '/file_requests/{file_request_id}/copy', body=('title', 'description', 'status', 'is_email_required', 'is_description_required', 'expires_at', 'folder')),
+    'get_folders_id': _Endpoint('GET', '/folders/{folder_id}', query=('fields', 'sort', 'direction', 'offset', 'limit')),
+    'post_folders_id': _Endpoint('POST', '/folders/{folder_id}', query=('fields',), body=('name', 'parent')),
+    'put_folders_id': _Endpoint('PUT', '/folders/{folder_id}', query=('fields',), body=('name', 'description', 'sync_state', 'can_non_owners_invite', 'parent', 'shared_link', 'folder_upload_email', 'tags', 'is_collaboration_restricted_to_enterprise', 'collections', 'can_non_owners_view_collaborators')),
+    'delete_folders_id': _Endpoint('DELETE', '/folders/{folder_id}', query=('recursive',)),
+    'get_folder_app_item_associations': _Endpoint('GET', '/folders/{folder_id}/app_item_associations', query=('limit', 'marker', 'application_type')),
+    'get_folders_id_items': _Endpoint('GET', '/folders/{folder_id}/items', query=('fields', 'usemarker', 'marker', 'offset', 'limit', 'sort', 'direction')),
+    'post_folders': _Endpoint('POST', '/folders', query=('fields',), body=('name', 'parent', 'folder_upload_email', 'sync_state')),
+    'post_folders_id_copy': _Endpoint('POST', '/folders/{folder_id}/copy', query=('fields',), body=('name', 'parent')),
+    'get_folders_id_collaborations': _Endpoint('GET', '/folders/{folder_id}/collaborations', query=('fields', 'limit', 'marker')),
+    'get_folders_id_trash': _Endpoint('GET', '/folders/{folder_id}/trash', query=('fields',)),
+    'delete_folders_id_trash': _Endpoint('DELETE', '/folders/{folder_id}/trash'),
+    'get_folders_id_metadata': _Endpoint('GET', '/folders/{folder_id}/metadata'),
+    'get_folder_security_classification': _Endpoint('GET', '/folders/{folder_id}/metadata/enterprise/securityClassification-6VMVochwUWo'),
+    'post_folder_metadata_security_classification': _Endpoint('POST', '/folders/{folder_id}/metadata/enterprise/securityClassification-6VMVochwUWo', body=('Box__Security__Classification__Key',)),
+    'update_folder_security_classification': _Endpoint('PUT', '/folders/{folder_id}/metadata/enterprise/securityClassification-6VMVochwUWo', body='items', content_type='application/json-patch+json'),
+    'delete_security_classification_by_folder_id': _Endpoint('DELETE', '/folders/{folder_id}/metadata/enterprise/securityClassification-6VMVochwUWo'),
+    'get_folders_id_metadata_id_id': _Endpoint('GET', '/folders/{folder_id}/metadata/{scope}/{template_key}'),
+    'post_folders_id_metadata_id_id': _Endpoint('POST', '/folders/{folder_id}/metadata/{scope}/{template_key}', body='request_body'),
+    'put_folders_id_metadata_id_id': _Endpoint('PUT', '/folders/{folder_id}/metadata/{scope}/{template_key}', body='items', content_type='application/json-patch+json'),
+    'delete_folder_metadata': _Endpoint('DELETE', '/folders/{folder_id}/metadata/{scope}/{template_key}'),
+    'get_folders_trash_items': _Endpoint('GET', '/folders/trash/items', query=('fields', 'limit', 'offset', 'usemarker', 'marker', 'direction', 'sort')),
+    'get_folders_id_watermark': _Endpoint('GET', '/folders/{folder_id}/watermark'),
+    'put_folders_id_watermark': _Endpoint('PUT', '/folders/{folder_id}/watermark', body=('watermark',)),
+    'delete_folders_id_watermark': _Endpoint('DELETE', '/folders/{folder_id}/watermark'),
+    'get_folder_locks': _Endpoint('GET', '/folder_locks', query=('folder_id',)),
+    'post_folder_locks': _Endpoint('POST', '/folder_locks', body=('locked_operations', 'folder')),
+    'delete_folder_locks_id': _Endpoint('DELETE', '/folder_locks/{folder_lock_id}'),
+    'get_metadata_templates': _Endpoint('GET', '/metadata_templates', query=('metadata_instance_id', 'marker', 'limit')),
+    'get_security_classification_schema': _Endpoint('GET', '/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema'),
+    'add_security_classification_schema': _Endpoint('PUT', '/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema#add', body='items'),
+    'update_security_classification_schema': _Endpoint('PUT', '/metadata_templates/enterprise/securityClassification-6VMVochwUWo/schema#update', body='items', content_type='application/json-patch+json'),
+    'get_schema_template': _Endpoint('GET', '/metadata_templates/{scope}/{template_key}/schema'),
+    'update_schema_template': _Endpoint('PUT', '/metadata_templates/{scope}/{template_key}/schema', body='items', content_type='application/json-patch+json'),
+    'delete_metadata_template_schema': _Endpoint('DELETE', '/metadata_templates/{scope}/{template_key}/schema'),
+    'get_metadata_templates_id': _Endpoint('GET', '/metadata_templates/{template_id}'),
+    'get_metadata_templates_global': _Endpoint('GET', '/metadata_templates/global', query=('marker', 'limit')),
+    'get_metadata_templates_enterprise': _Endpoint('GET', '/metadata_templates/enterprise', query=('marker', 'limit')),
+    'post_metadata_templates_schema': _Endpoint('POST', '/metadata_templates/schema', body=('scope', 'templateKey', 'displayName', 'hidden', 'fields', 'copyInstanceOnItemCopy')),
+    'create_metadata_template_classification': _Endpoint('POST', '/metadata_templates/schema#classifications', body=('scope', 'templateKey', 'displayName', 'hidden', 'copyInstanceOnItemCopy', 'fields')),
+    'get_metadata_cascade_policies': _Endpoint('GET', '/metadata_cascade_policies', query=('folder_id', 'owner_enterprise_id', 'marker', 'offset')),
+    'post_metadata_cascade_policies': _Endpoint('POST', '/metadata_cascade_policies', body=('folder_id', 'scope', 'templateKey')),
+    'get_metadata_cascade_policy_by_id': _Endpoint('GET', '/metadata_cascade_policies/{metadata_cascade_policy_id}'),
+    'delete_metadata_cascade_policy': _Endpoint('DELETE', '/metadata_cascade_policies/{metadata_cascade_policy_id}'),
+    'apply_metadata_cascade_policy_by_id': _Endpoint('POST', '/metadata_cascade_policies/{metadata_cascade_policy_id}/apply', body=('conflict_resolution',)),
+    'execute_metadata_query': _Endpoint('POST', '/metadata_queries/execute_read', body=('from', 'query', 'query_params', 'ancestor_folder_id', 'order_by', 'limit', 'marker', 'fields')),
+    'get_comments_id': _Endpoint('GET', '/comments/{comment_id}', query=('fields',)),
+    'put_comments_id': _Endpoint('PUT', '/comments/{comment_id}', query=('fields',), body=('message',)),
+    'delete_comments_id': _Endpoint('DELETE', '/comments/{comment_id}'),
+    'post_comments': _Endpoint('POST', '/comments', query=('fields',), body=('message', 'tagged_message', 'item')),
+    'get_collaborations_id': _Endpoint('GET', '/collaborations/{collaboration_id}', query=('fields',)),
+    'put_collaborations_id': _Endpoint('PUT', '/collaborations/{collaboration_id}', body=('role', 'status', 'expires_at', 'can_view_path')),
+    'delete_collaborations_id': _Endpoint('DELETE', '/collaborations/{collaboration_id}'),
+    'get_collaborations': _Endpoint('GET', '/collaborations', query=('status', 'fields', 'offset', 'limit')),
+    'post_collaborations': _Endpoint('POST', '/collaborations', query=('fields', 'notify'), body=('item', 'accessible_by', 'role', 'is_access_only', 'can_view_path', 'expires_at')),
+    'get_search': _Endpoint('GET', '/search', query=('query', 'scope', 'file_extensions', 'created_at_range', 'updated_at_range', 'size_range', 'owner_user_ids', 'recent_updater_user_ids', 'ancestor_folder_ids', 'content_types', 'type', 'trash_content', 'mdfilters', 'sort', 'direction', 'limit', 'include_recent_shared_links', 'fields', 'offset', 'deleted_user_ids', 'deleted_at_range')),
+    'post_tasks': _Endpoint('POST', '/tasks', body=('item', 'action', 'message', 'due_at', 'completion_rule')),
+    'get_tasks_id': _Endpoint('GET', '/tasks/{task_id}'),
+    'put_tasks_id': _Endpoint('PUT', '/tasks/{task_id}', body=('action', 'message', 'due_at', 'completion_rule')),
+    'delete_tasks_id': _Endpoint('DELETE', '/tasks/{task_id}'),
+    'get_tasks_id_assignments': _Endpoint('GET', '/tasks/{task_id}/assignments'),
+    'post_task_assignments': _Endpoint('POST', '/task_assignments', body=('task', 'assign_to')),
+    'get_task_assignments_id': _Endpoint('GET', '/task_assignments/{task_assignment_id}'),
+    'put_task_assignments_id': _Endpoint('PUT', '/task_assignments/{task_assignment_id}', body=('message', 'resolution_state')),
+    'delete_task_assignments_id': _Endpoint('DELETE', '/task_assignments/{task_assignment_id}'),
+    'get_shared_items': _Endpoint('GET', '/shared_items', query=('fields',)),
+    'get_files_id_get_shared_link': _Endpoint('GET', '/files/{file_id}#get_shared_link', query=('fields',)),
+    'put_files_id_add_shared_link': _Endpoint('PUT', '/files/{file_id}#add_shared_link', query=('fields',), body=('shared_link',)),
+    'update_file_shared_link': _Endpoint('PUT', '/files/{file_id}#update_shared_link', query=('fields',), body=('shared_link',)),
+    'remove_shared_link_by_id': _Endpoint('PUT', '/files/{file_id}#remove_shared_link', query=('fields',), body=('shared_link',)),
+    'get_shared_items_folders': _Endpoint('GET', '/shared_items#folders', query=('fields',)),
+    'get_folders_id_get_shared_link': _Endpoint('GET', '/folders/{folder_id}#get_shared_link', query=('fields',)),
+    'put_folders_id_add_shared_link': _Endpoint('PUT', '/folders/{folder_id}#add_shared_link', query=('fields',), body=('shared_link',)),
+    'update_shared_linkfolder': _Endpoint('PUT', '/folders/{folder_id}#update_shared_link', query=('fields',), body=('shared_link',)),
+    'remove_shared_link_by_folder_id': _Endpoint('PUT', '/folders/{folder_id}#remove_shared_link', query=('fields',), body=('shared_link',)),
+    'post_web_links': _Endpoint('POST', '/web_links', body=('url', 'parent', 'name', 'description')),
+    'get_web_links_id': _Endpoint('GET', '/web_links/{web_link_id}'),
+    'post_web_links_id': _Endpoint('POST', '/web_links/{web_link_id}', query=('fields',), body=('name', 'parent')),
+    'put_web_links_id': _Endpoint('PUT', '/web_links/{web_link_id}', body=('url', 'parent', 'name', 'description', 'shared_link')),
+    'delete_web_links_id': _Endpoint('DELETE', '/web_links/{web_link_id}'),
+    'get_web_links_id_trash': _Endpoint('GET', '/web_links/{web_link_id}/trash', query=('fields',)),
+    'delete_web_links_id_trash': _Endpoint('DELETE', '/web_links/{web_link_id}/trash'),
+    'get_shared_items_web_links': _Endpoint('GET', '/shared_items#web_links', query=('fields',)),
+    'get_shared_link_by_id': _Endpoint('GET', '/web_links/{web_link_id}#get_shared_link', query=('fields',)),
+    'update_web_link_shared_link': _Endpoint('PUT', '/web_links/{web_link_id}#add_shared_link', query=('fields',), body=('shared_link',)),
+    'update_shared_link': _Endpoint('PUT', '/web_links/{web_link_id}#update_shared_link', query=('fields',), body=('shared_link',)),
+    'remove_shared_link_by_web_link_id': _Endpoint('PUT', '/web_links/{web_link_id}#remove_shared_link', query=('fields',), body=('shared_link',)),
+    'get_shared_items_app_items': _Endpoint('GET', '/shared_items#app_items'),
+    'get_users': _Endpoint('GET', '/users', query=('filter_term', 'user_type', 'external_app_user_id', 'fields', 'offset', 'limit', 'usemarker', 'marker')),
+    'post_users': _Endpoint('POST', '/users', query=('fields',), body=('name', 'login', 'is_platform_access_only', 'role', 'language', 'is_sync_enabled', 'job_title', 'phone', 'address', 'space_amount', 'tracking_codes', 'can_see_managed_users', 'timezone', 'is_external_collab_restricted', 'is_exempt_from_device_limits', 'is_exempt_from_login_verification', 'status', 'external_app_user_id')),
+    'get_users_me': _Endpoint('GET', '/users/me', query=('fields',)),
+    'post_users_terminate_sessions': _Endpoint('POST', '/users/terminate_sessions', body=('user_ids', 'user_logins')),
+    'get_users_id': _Endpoint('GET', '/users/{user_id}', query=('fields',)),
+    'put_users_id': _Endpoint('PUT', '/users/{user_id}', query=('fields',), body=('enterprise', 'notify', 'name', 'login', 'role', 'language', 'is_sync_enabled', 'job_title', 'phone', 'address', 'tracking_codes', 'can_see_managed_users', 'timezone', 'is_external_collab_restricted', 'is_exempt_from_device_limits', 'is_exempt_from_login_verification', 'is_password_reset_required', 'status', 'space_amount', 'notification_email', 'external_app_user_id')),
+    'delete_users_id': _Endpoint('DELETE', '/users/{user_id}', query=('notify', 'force')),
+    'get_users_id_avatar': _Endpoint('GET', '/users/{user_id}/avatar'),
+    'post_users_id_avatar': _Endpoint('POST', '/users/{user_id}/avatar', body=(), content_type='multipart/form-data', files=('pic',)),
+    'delete_users_id_avatar': _Endpoint('DELETE', '/users/{user_id}/avatar'),
+    'put_users_id_folders': _Endpoint('PUT', '/users/{user_id}/folders/0', query=('fields', 'notify'), body=('owned_by',)),
+    'get_users_id_email_aliases': _Endpoint('GET', '/users/{user_id}/email_aliases'),
+    'post_users_id_email_aliases': _Endpoint('POST', '/users/{user_id}/email_aliases', body=('email',)),
+    'delete_email_alias_by_id': _Endpoint('DELETE', '/users/{user_id}/email_aliases/{email_alias_id}'),
+    'get_users_id_memberships': _Endpoint('GET', '/users/{user_id}/memberships', query=('limit', 'offset')),
+    'post_invites': _Endpoint('POST', '/invites', query=('fields',), body=('enterprise', 'actionable_by')),
+    'get_invites_id': _Endpoint('GET', '/invites/{invite_id}', query=('fields',)),
+    'get_groups': _Endpoint('GET', '/groups', query=('filter_term', 'fields', 'limit', 'offset')),
+    'post_groups': _Endpoint('POST', '/groups', query=('fields',), body=('name', 'provenance', 'external_sync_identifier', 'description', 'invitability_level', 'member_viewability_level')),
+    'post_groups_terminate_sessions': _Endpoint('POST', '/groups/terminate_sessions', body=('group_ids',)),
+    'get_groups_id': _Endpoint('GET', '/groups/{group_id}', query=('fields',)),
+    'put_groups_id': _Endpoint('PUT', '/groups/{group_id}', query=('fields',), body=('name', 'provenance', 'external_sync_identifier', 'description', 'invitability_level', 'member_viewability_level')),
+    'delete_groups_id': _Endpoint('DELETE', '/groups/{group_id}'),
+    'get_groups_id_memberships': _Endpoint('GET', '/groups/{group_id}/memberships', query=('limit', 'offset')),
+    'get_groups_id_collaborations': _Endpoint('GET', '/groups/{group_id}/collaborations', query=('limit', 'offset')),
+    'post_group_memberships': _Endpoint('POST', '/group_memberships', query=('fields',), body=('user', 'group', 'role', 'configurable_permissions')),
+    'get_group_memberships_id': _Endpoint('GET', '/group_memberships/{group_membership_id}', query=('fields',)),
+    'put_group_memberships_id': _Endpoint('PUT', '/group_memberships/{group_membership_id}', query=('fields',), body=('role', 'configurable_permissions')),
+    'delete_group_memberships_id': _Endpoint('DELETE', '/group_memberships/{group_membership_id}'),
+    'get_webhooks': _Endpoint('GET', '/webhooks', query=('marker', 'limit')),
+    'post_webhooks': _Endpoint('POST', '/webhooks', body=('target', 'address', 'triggers')),
+    'get_webhooks_id': _Endpoint('GET', '/webhooks/{webhook_id}'),
+    'put_webhooks_id': _Endpoint('PUT', '/webhooks/{webhook_id}', body=('target', 'address', 'triggers')),
+    'delete_webhooks_id': _Endpoint('DELETE', '/webhooks/{webhook_id}'),
+    'put_skill_invocations_id': _Endpoint('PUT', '/skill_invocations/{skill_id}', body=('status', 'metadata', 'file', 'file_version', 'usage')),
+    'options_events': _Endpoint('OPTIONS', '/events'),
+    'get_events': _Endpoint('GET', '/events', query=('stream_type', 'stream_position', 'limit', 'event_type', 'created_after', 'created_before')),
+    'get_collections': _Endpoint('GET', '/collections', query=('fields', 'offset', 'limit')),
+    'get_collections_id_items': _Endpoint('GET', '/collections/{collection_id}/items', query=('fields', 'offset', 'limit')),
+    'get_collections_id': _Endpoint('GET', '/collections/{collection_id}'),
+    'get_recent_items': _Endpoint('GET', '/recent_items', query=('fields', 'limit', 'marker')),
+    'get_retention_policies': _Endpoint('GET', '/retention_policies', query=('policy_name', 'policy_type', 'created_by_user_id', 'fields', 'limit', 'marker')),
+    'post_retention_policies': _Endpoint('POST', '/retention_policies', body=('policy_name', 'description', 'policy_type', 'disposition_action', 'retention_length', 'retention_type', 'can_owner_extend_retention', 'are_owners_notified', 'custom_notification_recipients')),
+    'get_retention_policies_id': _Endpoint('GET', '/retention_policies/{retention_policy_id}', query=('fields',)),
+    'put_retention_policies_id': _Endpoint('PUT', '/retention_policies/{retention_policy_id}', body=('policy_name', 'description', 'disposition_action', 'retention_type', 'retention_length', 'status', 'can_owner_extend_retention', 'are_owners_notified', 'custom_notification_recipients')),
+    'delete_retention_policies_id': _Endpoint('DELETE', '/retention_policies/{retention_policy_id}'),
+    'get_retention_policy_assignments': _Endpoint('GET', '/retention_policies/{retention_policy_id}/assignments', query=('type', 'fields', 'marker', 'limit')),
+    'create_retention_policy_assignment': _Endpoint('POST', '/retention_policy_assignments', body=('policy_id', 'assign_to', 'filter_fields', 'start_date_field')),
+    'get_retention_policy_assignment_by_id': _Endpoint('GET', '/retention_policy_assignments/{retention_policy_assignment_id}', query=('fields',)),
+    'delete_retention_policy_assignment_by_id': _Endpoint('DELETE', '/retention_policy_assignments/{retention_policy_assignment_id}'),
+    'get_files_under_retention': _Endpoint('GET', '/retention_policy_assignments/{retention_policy_assignment_id}/files_under_retention', query=('marker', 'limit')),
+    'get_retention_policy_assignment_file_versions': _Endpoint('GET', '/retention_policy_assignments/{retention_policy_assignment_id}/file_versions_under_retention', query=('marker', 'limit')),
+    'get_legal_hold_policies': _Endpoint('GET', '/legal_hold_policies', query=('policy_name', 'fields', 'marker', 'limit')),
+    'post_legal_hold_policies': _Endpoint('POST', '/legal_hold_policies', body=('policy_name', 'description', 'filter_started_at', 'filter_ended_at', 'is_ongoing')),
+    'get_legal_hold_policies_id': _Endpoint('GET', '/legal_hold_policies/{legal_hold_policy_id}'),
+    'put_legal_hold_policies_id': _Endpoint('PUT', '/legal_hold_policies/{legal_hold_policy_id}', body=('policy_name', 'description', 'release_notes')),
+    'delete_legal_hold_policies_id': _Endpoint('DELETE', '/legal_hold_policies/{legal_hold_policy_id}'),
+    'get_legal_hold_policy_assignments': _Endpoint('GET', '/legal_hold_policy_assignments', query=('policy_id', 'assign_to_type', 'assign_to_id', 'marker', 'limit', 'fields')),
+    'assign_legal_hold_policy': _Endpoint('POST', '/legal_hold_policy_assignments', body=('policy_id', 'assign_to')),
+    'get_legal_hold_policy_assignment': _Endpoint('GET', '/legal_hold_policy_assignments/{legal_hold_policy_assignment_id}'),
+    'delete_legal_hold_assignment': _Endpoint('DELETE', '/legal_hold_policy_assignments/{legal_hold_policy_assignment_id}'),
+    'get_files_on_hold_by_legl_hld_polcy_asgnmt_id': _Endpoint('GET', '/legal_hold_policy_assignments/{legal_hold_policy_assignment_id}/files_on_hold', query=('marker', 'limit', 'fields')),
+    'get_file_version_retentions': _Endpoint('GET', '/file_version_retentions', query=('file_id', 'file_version_id', 'policy_id', 'disposition_action', 'disposition_before', 'disposition_after', 'limit', 'marker')),
+    'get_legal_hold_file_versions_on_hold': _Endpoint('GET', '/legal_hold_policy_assignments/{legal_hold_policy_assignment_id}/file_versions_on_hold', query=('marker', 'limit', 'fields')),
+    'get_file_version_retentions_id': _Endpoint('GET', '/file_version_retentions/{file_version_retention_id}'),
+    'get_legal_hold': _Endpoint('GET', '/file_version_legal_holds/{file_version_legal_hold_id}'),
+    'get_file_version_legal_holds': _Endpoint('GET', '/file_version_legal_holds', query=('policy_id', 'marker', 'limit')),
+    'get_shield_information_barrier_by_id': _Endpoint('GET', '/shield_information_barriers/{shield_information_barrier_id}'),
+    'change_shield_status': _Endpoint('POST', '/shield_information_barriers/change_status', body=('id', 'status')),
+    'get_shield_information_barriers': _Endpoint('GET', '/shield_information_barriers', query=('marker', 'limit')),
+    'create_shield_barriers': _Endpoint('POST', '/shield_information_barriers', body=('enterprise',)),
+    'get_shield_information_barrier_reports': _Endpoint('GET', '/shield_information_barrier_reports', query=('shield_information_barrier_id', 'marker', 'limit')),
+    'generate_shield_report': _Endpoint('POST', '/shield_information_barrier_reports', body=('shield_information_barrier',)),
+    'get_shield_report_by_id': _Endpoint('GET', '/shield_information_barrier_reports/{shield_information_barrier_report_id}'),
+    'get_shield_segment_by_id': _Endpoint('GET', '/shield_information_barrier_segments/{shield_information_barrier_segment_id}'),
+    'delete_shield_inft_barrier_sgmt_by_id': _Endpoint('DELETE', '/shield_information_barrier_segments/{shield_information_barrier_segment_id}'),
+    'update_shield_barrier_segment': _Endpoint('PUT', '/shield_information_barrier_segments/{shield_information_barrier_segment_id}', body=('name', 'description')),
+    'get_shield_segments': _Endpoint('GET', '/shield_information_barrier_segments', query=('shield_information_barrier_id', 'marker', 'limit')),
+    'create_shield_barrier_segments': _Endpoint('POST', '/shield_information_barrier_segments', body=('shield_information_barrier', 'name', 'description')),
+    'get_shield_infmt_barrier_sgmnt_member_by_id': _Endpoint('GET', '/shield_information_barrier_segment_members/{shield_information_barrier_segment_member_id}'),
+    'delete_shield_member': _Endpoint('DELETE', '/shield_information_barrier_segment_members/{shield_information_barrier_segment_member_id}'),
+    'get_shield_infmt_barrier_sgmnt_members': _Endpoint('GET', '/shield_information_barrier_segment_members', query=('shield_information_barrier_segment_id', 'marker', 'limit')),
+    'add_shield_members': _Endpoint('POST', '/shield_information_barrier_segment_members', body=('type', 'shield_information_barrier', 'shield_information_barrier_segment', 'user')),
+    'get_shield_barrier_segment_restriction_by_id': _Endpoint('GET', '/shield_information_barrier_segment_restrictions/{shield_information_barrier_segment_restriction_id}'),
+    'delete_shield_restriction': _Endpoint('DELETE', '/shield_information_barrier_segment_restrictions/{shield_information_barrier_segment_restriction_id}'),
+    'get_shield_infmt_barrier_sgmnt_restrictions': _Endpoint('GET', '/shield_information_barrier_segment_restrictions', query=('shield_information_barrier_segment_id', 'marker', 'limit')),
+    'create_shield_restrictions': _Endpoint('POST', '/shield_information_barrier_segment_restrictions', body=('type', 'shield_information_barrier', 'shield_information_barrier_segment', 'restricted_segment')),
+    'get_device_pinners_id': _Endpoint('GET', '/device_pinners/{device_pinner_id}'),
+    'delete_device_pinners_id': _Endpoint('DELETE', '/device_pinners/{device_pinner_id}'),
+    'list_device_pins': _Endpoint('GET', '/enterprises/{enterprise_id}/device_pinners', query=('marker', 'limit', 'direction')),
+    'get_terms_of_services': _Endpoint('GET', '/terms_of_services', query=('tos_type',)),
+    'post_terms_of_services': _Endpoint('POST', '/terms_of_services', body=('status', 'tos_type', 'text')),
+    'get_terms_of_services_id': _Endpoint('GET', '/terms_of_services/{terms_of_service_id}'),
+    'put_terms_of_services_id': _Endpoint('PUT', '/terms_of_services/{terms_of_service_id}', body=('status', 'text')),
+    'get_tos_user_statuses': _Endpoint('GET', '/terms_of_service_user_statuses', query=('tos_id', 'user_id')),
+    'create_terms_of_service_statuses': _Endpoint('POST', '/terms_of_service_user_statuses', body=('tos', 'user', 'is_accepted')),
+    'update_terms_of_service_user_status_by_id': _Endpoint('PUT', '/terms_of_service_user_statuses/{terms_of_service_user_status_id}', body=('is_accepted',)),
+    'list_collaboration_whitelist_entries': _Endpoint('GET', '/collaboration_whitelist_entries', query=('marker', 'limit')),
+    'create_collaboration_whitelist_entry': _Endpoint('POST', '/collaboration_whitelist_entries', body=('domain', 'direction')),
+    'get_whitelist_entry_by_id': _Endpoint('GET', '/collaboration_whitelist_entries/{collaboration_whitelist_entry_id}'),
+    'delete_collaboration_whitelist_entry_by_id': _Endpoint('DELETE', '/collaboration_whitelist_entries/{collaboration_whitelist_entry_id}'),
+    'list_whitelist_targets': _Endpoint('GET', '/collaboration_whitelist_exempt_targets', query=('marker', 'limit')),
+    'create_collaboration_whitelist_exempt_target': _Endpoint('POST', '/collaboration_whitelist_exempt_targets', body=('user',)),
+    'get_exempt_target_by_id': _Endpoint('GET', '/collaboration_whitelist_exempt_targets/{collaboration_whitelist_exempt_target_id}'),
+    'delete_collab_whitelist_exempt_target_by_id': _Endpoint('DELETE', '/collaboration_whitelist_exempt_targets/{collaboration_whitelist_exempt_target_id}'),
+    'get_storage_policies': _Endpoint('GET', '/storage_policies', query=('fields', 'marker', 'limit')),
+    'get_storage_policies_id': _Endpoint('GET', '/storage_policies/{storage_policy_id}'),
+    'get_storage_policy_assignments': _Endpoint('GET', '/storage_policy_assignments', query=('marker', 'resolved_for_type', 'resolved_for_id')),
+    'create_storage_policy_assignment': _Endpoint('POST', '/storage_policy_assignments', body=('storage_policy', 'assigned_to')),
+    'get_storage_policy_assignment': _Endpoint('GET', '/storage_policy_assignments/{storage_policy_assignment_id}'),
+    'update_storage_policy_assignment': _Endpoint('PUT', '/storage_policy_assignments/{storage_policy_assignment_id}', body=('storage_policy',)),
+    'delete_storage_policy_assignment': _Endpoint('DELETE', '/storage_policy_assignments/{storage_policy_assignment_id}'),
+    'post_zip_downloads': _Endpoint('POST', '/zip_downloads', body=('items', 'download_file_name')),
+    'get_zip_downloads_id_content': _Endpoint('GET', '/zip_downloads/{zip_download_id}/content'),
+    'get_zip_downloads_id_status': _Endpoint('GET', '/zip_downloads/{zip_download_id}/status'),
+    'post_sign_requests_id_cancel': _Endpoint('POST', '/sign_requests/{sign_request_id}/cancel'),
+    'post_sign_requests_id_resend': _Endpoint('POST', '/sign_requests/{sign_request_id}/resend'),
+    'get_sign_requests_id': _Endpoint('GET', '/sign_requests/{sign_request_id}'),
+    'get_sign_requests': _Endpoint('GET', '/sign_requests', query=('marker', 'limit', 'senders', 'shared_requests')),
+    'post_sign_requests': _Endpoint('POST', '/sign_requests', body=('is_document_preparation_needed', 'redirect_url', 'declined_redirect_url', 'are_text_signatures_enabled', 'email_subject', 'email_message', 'are_reminders_enabled', 'name', 'prefill_tags', 'days_valid', 'external_id', 'template_id', 'external_system_name', 'source_files', 'signature_color', 'signers', 'parent_folder')),
+    'get_workflows': _Endpoint('GET', '/workflows', query=('folder_id', 'trigger_type', 'limit', 'marker')),
+    'post_workflows_id_start': _Endpoint('POST', '/workflows/{workflow_id}/start', body=('type', 'flow', 'files', 'folder', 'outcomes')),
+    'get_sign_templates': _Endpoint('GET', '/sign_templates', query=('marker', 'limit')),
+    'get_sign_templates_id': _Endpoint('GET', '/sign_templates/{template_id}'),
+    'get_integration_mappings_slack': _Endpoint('GET', '/integration_mappings/slack', query=('marker', 'limit', 'partner_item_type', 'partner_item_id', 'box_item_id', 'box_item_type', 'is_manually_created')),
+    'create_slack_mapping': _Endpoint('POST', '/integration_mappings/slack', body=('partner_item', 'box_item', 'options')),
+    'update_slack_integration_mapping_by_id': _Endpoint('PUT', '/integration_mappings/slack/{integration_mapping_id}', body=('box_item', 'options')),
+    'delete_slack_mapping_by_id': _Endpoint('DELETE', '/integration_mappings/slack/{integration_mapping_id}'),
+    'get_integration_mappings_teams': _Endpoint('GET', '/integration_mappings/teams', query=('partner_item_type', 'partner_item_id', 'box_item_id', 'box_item_type')),
+    'create_integration_mapping_team': _Endpoint('POST', '/integration_mappings/teams', body=('partner_item', 'box_item')),
+    'update_integration_mapping_team': _Endpoint('PUT', '/integration_mappings/teams/{integration_mapping_id}', body=('box_item',)),
+    'delete_integration_mapping_by_id': _Endpoint('DELETE', '/integration_mappings/teams/{integration_mapping_id}'),
+    'post_ai_ask': _Endpoint('POST', '/ai/ask', body=('mode', 'prompt', 'items', 'dialogue_history', 'include_citations', 'ai_agent')),
+    'post_ai_text_gen': _Endpoint('POST', '/ai/text_gen', body=('prompt', 'items', 'dialogue_history', 'ai_agent')),
+    'get_ai_agent_default': _Endpoint('GET', '/ai_agent_default', query=('mode', 'language', 'model')),
+    'post_ai_extract': _Endpoint('POST', '/ai/extract', body=('prompt', 'items', 'ai_agent')),
+    'post_ai_extract_structured': _Endpoint('POST', '/ai/extract_structured', body=('items', 'metadata_template', 'fields', 'ai_agent')),
+    'get_ai_agents': _Endpoint('GET', '/ai_agents', query=('mode', 'fields', 'agent_state', 'include_box_default', 'marker', 'limit')),
+    'post_ai_agents': _Endpoint('POST', '/ai_agents', body=('type', 'name', 'access_state', 'icon_reference', 'allowed_entities', 'ask', 'text_gen', 'extract')),
+    'put_ai_agents_id': _Endpoint('PUT', '/ai_agents/{agent_id}', body=('type', 'name', 'access_state', 'icon_reference', 'allowed_entities', 'ask', 'text_gen', 'extract')),
+    'get_ai_agents_id': _Endpoint('GET', '/ai_agents/{agent_id}', query=('fields',)),
+    'delete_ai_agents_id': _Endpoint('DELETE', '/ai_agents/{agent_id}'),
+    'post_docgen_templates_v': _Endpoint('POST', '/docgen_templates', body=('file',)),
+    'get_docgen_templates_v': _Endpoint('GET', '/docgen_templates', query=('marker', 'limit')),
+    'delete_template_by_id': _Endpoint('DELETE', '/docgen_templates/{template_id}'),
+    'get_docgen_template_by_id': _Endpoint('GET', '/docgen_templates/{template_id}'),
+    'get_docgen_template_tags': _Endpoint('GET', '/docgen_templates/{template_id}/tags', query=('template_version_id', 'marker', 'limit')),
+    'get_docgen_jobs_id_v': _Endpoint('GET', '/docgen_jobs/{job_id}'),
+    'get_docgen_jobs_v': _Endpoint('GET', '/docgen_jobs', query=('marker', 'limit')),
+    'get_template_job': _Endpoint('GET', '/docgen_template_jobs/{template_id}', query=('marker', 'limit')),
+    'get_batch_job_details': _Endpoint('GET', '/docgen_batch_jobs/{batch_id}', query=('marker', 'limit')),
+    'post_docgen_batches_v': _Endpoint('POST', '/docgen_batches', body=('file', 'file_version', 'input_source', 'destination_folder', 'output_type', 'document_generation_data')),
+    'get_shield_lists_v': _Endpoint('GET', '/shield_lists'),
+    'post_shield_lists_v': _Endpoint('POST', '/shield_lists', body=('name', 'description', 'content')),
+    'get_shield_lists_id_v': _Endpoint('GET', '/shield_lists/{shield_list_id}'),
+    'delete_shield_lists_id_v': _Endpoint('DELETE', '/shield_lists/{shield_list_id}'),
+    'put_shield_lists_id_v': _Endpoint('PUT', '/shield_lists/{shield_list_id}', body=('name', 'description', 'content')),
+}
+
+
+# Binary downloads. Their hand-written tools share the compiled request builders
+# but send the request and read the body themselves.
+_BINARY_ENDPOINTS: dict[str, _Endpoint] = {
+    'get_files_id_content': _Endpoint('GET', '/files/{file_id}/content', query=('version', 'access_token')),
+    'get_files_id_thumbnail_id': _Endpoint('GET', '/files/{file_id}/thumbnail.{extension}', query=('min_height', 'min_width', 'max_height', 'max_width'), choices=(('extension', frozenset({'png', 'jpg'})),)),
+}
+
+
+class AsyncBoxApp(BoxApp):
+    """
+    Coroutine flavour of BoxApp for concurrent fan-out.
+
+    Every tool exposed by BoxApp is available here as a coroutine with the same
+    signature and docstring. Table-driven tools are sent natively over a pooled
+    ``httpx.AsyncClient`` (HTTP/2 when ``h2`` is installed) and share BoxApp's
+    response cache, so callers can ``asyncio.gather`` many Box requests without
+    a worker thread per call. Streaming downloads use the async client as well,
+    while the other hand-written download helpers still run on worker threads. At most ``max_concurrency`` requests are in flight at any
+    time.
+    """
+
+    def __init__(self, integration: Integration = None, max_concurrency: int = 32, async_client: Optional[httpx.AsyncClient] = None, warm_up: bool = False, **kwargs) -> None:
+        super().__init__(integration=integration, **kwargs)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._async_client = async_client
+        if async_client is not None and async_client.auth is None:
+            async_client.auth = self._credentials
+        self._async_inflight: dict[str, asyncio.Task] = {}
+        if warm_up:
+            self.warm_up()
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Pooled keep-alive async client, configured like ``client``.
+
+        Returns:
+            httpx.AsyncClient: The lazily created, shared async HTTP client.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                auth=self._credentials,
+                timeout=self.default_timeout,
+                transport=_AsyncRetryTransport(httpx.AsyncHTTPTransport(limits=self._limits, retries=self._connect_retries, http2=self._http2), retries=self._status_retries, throttle=self._throttle),
+            )
+        return self._async_client
+
+    def _call(self, operation: str, **arguments: Any) -> Any:
+        return self._acall(operation, **arguments)
+
+    async def _acall(self, operation: str, **arguments: Any) -> Any:
+        """
+        Coroutine counterpart of ``BoxApp._call``.
+        """
+        endpoint = _ENDPOINTS[operation]
+        url, params, body, files = _request_builder(operation)(self.base_url, **arguments)
+        method = endpoint.method
+        async with self._semaphore:
+            if method == "GET":
+                response = await self._aget(url, params)
+            elif method == "OPTIONS":
+                content = _request_content(body, endpoint.content_type, None) if body is not None else {}
+                response = await self.async_client.request(method, url, params=params, **content)
+            else:
+                try:
+                    if method == "DELETE":
+                        response = await self.async_client.request(method, url, params=params)
+                    else:
+                        response = await self.async_client.request(method, url, params=params, **_request_content(body, endpoint.content_type, files))
+                finally:
+                    self._invalidate(url)
+        return _decode(response)
+
+    async def _aget(self, url: str, params: Optional[dict[str, Any]]) -> httpx.Response:
+        key = _cache_key(url, params)
+        cached = self._cache.get(key) if self._cache.maxsize else None
+        if cached is not None and cached[1]:
+            return cached[0]
+        task = self._async_inflight.get(key)
+        if task is None:
+            task = self._async_inflight[key] = asyncio.ensure_future(self._afetch(url, params, key, cached))
+            task.add_done_callback(lambda done: self._async_inflight.pop(key) if self._async_inflight.get(key) is done else None)
+        # Shielded so that one cancelled caller does not cancel the request for the others.
+        return await asyncio.shield(task)
+
+    async def _afetch(self, url: str, params: Optional[dict[str, Any]], key: str, cached: Optional[tuple[httpx.Response, bool]]) -> httpx.Response:
+        if not self._cache.maxsize:
+            return await self.async_client.get(url, params=params)
+        etag = cached[0].headers.get("etag") if cached is not None else None
+        generation = self._begin_fetch(key)
+        try:
+            response = await self.async_client.get(url, params=params, headers={"If-None-Match": etag} if etag else None)
+        finally:
+            current = self._end_fetch(key, generation)
+        return self._remember(key, cached, response, current)
+
+    def _forget_inflight(self, prefix: str, nested: bool = True) -> None:
+        super()._forget_inflight(prefix, nested)
+        for key in [key for key in self._async_inflight if _is_under(key, prefix, nested)]:
+            del self._async_inflight[key]
+
+    async def gather_files(self, file_ids: List[str], fields: Optional[List[str]] = None) -> list[dict[str, Any]]:
+        """
+        Fetch file information for many files concurrently.
+
+        Args:
+            file_ids: IDs of the files to fetch.
+            fields: Optional attributes to include for every file.
+
+        Returns:
+            list[dict[str, Any]]: File objects in the same order as ``file_ids``.
+        """
+        return await asyncio.gather(*(self.get_files_id(file_id, fields=fields) for file_id in file_ids))
+
+    async def get_files_id_with_metadata(self, file_id: str, templates: List[tuple[str, str]], fields: Optional[List[str]] = None) -> dict[str, Any]:
+        """
+        Coroutine counterpart of ``BoxApp.get_files_id_with_metadata``.
+        """
+        return await self.get_files_id(file_id, fields=_metadata_fields(templates, fields))
+
+    async def get_folders_id_with_metadata(self, folder_id: str, templates: List[tuple[str, str]], fields: Optional[List[str]] = None) -> dict[str, Any]:
+        """
+        Coroutine counterpart of ``BoxApp.get_folders_id_with_metadata``.
+        """
+        return await self.get_folders_id(folder_id, fields=_metadata_fields(templates, fields))
+
+    async def get_folders_id_details(self, folder_id: str, concurrency: int = 8) -> dict[str, Any]:
+        """
+        Coroutine counterpart of ``BoxApp.get_folders_id_details``.
+        """
+        async def fetch(operation: str) -> Any:
+            try:
+                return await self._acall(operation, folder_id=folder_id)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    return None
+                raise
+
+        results = await _gather_bounded(fetch, [operation for _, operation in _FOLDER_DETAILS], concurrency)
+        return {part: result for (part, _), result in zip(_FOLDER_DETAILS, results)}
+
+    async def get_files_many(self, file_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Coroutine counterpart of ``BoxApp.get_files_many``.
+        """
+        return await _gather_bounded(lambda file_id: self.get_files_id(file_id, fields=fields), file_ids, concurrency)
+
+    async def get_files_many_comments(self, file_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Coroutine counterpart of ``BoxApp.get_files_many_comments``.
+        """
+        return await _gather_bounded(lambda file_id: self.get_files_id_comments(file_id, fields=fields), file_ids, concurrency)
+
+    async def get_files_many_metadata(self, file_ids: List[str], concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Coroutine counterpart of ``BoxApp.get_files_many_metadata``.
+        """
+        return await _gather_bounded(self.get_files_id_metadata, file_ids, concurrency)
+
+    async def get_files_many_versions(self, file_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Coroutine counterpart of ``BoxApp.get_files_many_versions``.
+        """
+        return await _gather_bounded(lambda file_id: self.get_files_id_versions(file_id, fields=fields), file_ids, concurrency)
+
+    async def get_file_requests_many(self, file_request_ids: List[str], concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Coroutine counterpart of ``BoxApp.get_file_requests_many``.
+        """
+        return await _gather_bounded(self.get_file_requests_id, file_request_ids, concurrency)
+
+    async def get_comments_many(self, comment_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Coroutine counterpart of ``BoxApp.get_comments_many``.
+        """
+        return await _gather_bounded(lambda comment_id: self.get_comments_id(comment_id, fields=fields), comment_ids, concurrency)
+
+    async def get_collaborations_many(self, collaboration_ids: List[str], fields: Optional[List[str]] = None, concurrency: int = 16) -> list[dict[str, Any]]:
+        """
+        Coroutine counterpart of ``BoxApp.get_collaborations_many``.
+        """
+        return await _gather_bounded(lambda collaboration_id: self.get_collaborations_id(collaboration_id, fields=fields), collaboration_ids, concurrency)
+
+    async def delete_files_many(self, file_ids: List[str], concurrency: int = 16) -> None:
+        """
+        Coroutine counterpart of ``BoxApp.delete_files_many``.
+        """
+        await _gather_bounded(self.delete_files_id, file_ids, concurrency)
+
+    async def apply_metadata_cascade_policies_many(self, metadata_cascade_policy_ids: List[str], conflict_resolution: Optional[str] = None, concurrency: int = 16, return_exceptions: bool = False) -> list[Any]:
+        """
+        Coroutine counterpart of ``BoxApp.apply_metadata_cascade_policies_many``.
+        """
+        return await _gather_bounded(lambda policy_id: self.apply_metadata_cascade_policy_by_id(policy_id, conflict_resolution=conflict_resolution), metadata_cascade_policy_ids, concurrency, return_exceptions)
+
+    async def call_many(self, calls: List[tuple[str, dict[str, Any]]], concurrency: int = 16) -> list[Any]:
+        """
+        Coroutine counterpart of ``BoxApp.call_many``.
+        """
+        return await _gather_bounded(lambda call: self._call(call[0], **call[1]), _batch_calls(calls), concurrency)
+
+    def iter_folders_id_items(self, *args: Any, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """
+        Not available on AsyncBoxApp; use ``aiter_folders_id_items``.
+        """
+        raise _sync_iteration_error("iter_folders_id_items", "aiter_folders_id_items")
+
+    def walk_folders_id(self, *args: Any, **kwargs: Any) -> Iterator[tuple[str, dict[str, Any]]]:
+        """
+        Not available on AsyncBoxApp; use ``awalk_folders_id``.
+        """
+        raise _sync_iteration_error("walk_folders_id", "awalk_folders_id")
+
+    def iter_marker_entries(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """
+        Not available on AsyncBoxApp; use ``aiter_marker_entries``.
+        """
+        raise _sync_iteration_error("iter_marker_entries", "aiter_marker_entries")
+
+    def iter_offset_entries(self, *args: Any, **kwargs: Any) -> Iterator[Any]:
+        """
+        Not available on AsyncBoxApp; use ``aiter_offset_entries``.
+        """
+        raise _sync_iteration_error("iter_offset_entries", "aiter_offset_entries")
+
+    def iter_files_id_content(self, *args: Any, **kwargs: Any) -> Iterator[bytes]:
+        """
+        Not available on AsyncBoxApp; use ``aiter_files_id_content``.
+        """
+        raise _sync_iteration_error("iter_files_id_content", "aiter_files_id_content")
+
+    async def aiter_files_id_content(self, file_id: str, version: Optional[str] = None, access_token: Optional[str] = None, chunk_size: int = 1 << 20) -> AsyncIterator[bytes]:
+        """
+        Async counterpart of ``BoxApp.iter_files_id_content``, streamed over ``async_client``.
+        """
+        url, params, _, _ = _request_builder('get_files_id_content')(self.base_url, file_id=file_id, version=version, access_token=access_token)
+        async with self._semaphore, self.async_client.stream("GET", url, params=params, follow_redirects=True) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def download_files_id_content(self, file_id: str, path: str, version: Optional[str] = None, access_token: Optional[str] = None, chunk_size: int = 1 << 20) -> int:
+        """
+        Coroutine counterpart of ``BoxApp.download_files_id_content``.
+        """
+        written = 0
+        with open(path, "wb") as fh:
+            async for chunk in self.aiter_files_id_content(file_id, version=version, access_token=access_token, chunk_size=chunk_size):
+                written += fh.write(chunk)
+        return written
+
+    async def aiter_folders_id_items(self, folder_id: str, fields: Optional[List[str]] = None, sort: Optional[str] = None, direction: Optional[str] = None, page_size: int = 1000) -> AsyncIterator[dict[str, Any]]:
+        """
+        Async counterpart of ``BoxApp.iter_folders_id_items``.
+        """
+        async for item in self.aiter_marker_entries('get_folders_id_items', folder_id=folder_id, fields=fields, sort=sort, direction=direction, limit=page_size):
+            yield item
+
+    async def awalk_folders_id(self, folder_id: str, fields: Optional[List[str]] = None, concurrency: int = 8) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Async counterpart of ``BoxApp.walk_folders_id``.
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def list_folder(parent_id: str) -> tuple[str, list[dict[str, Any]]]:
+            async with semaphore:
+                return parent_id, [item async for item in self.aiter_marker_entries('get_folders_id_items', prefetch=False, folder_id=parent_id, fields=fields, limit=1000)]
+
+        pending = {asyncio.ensure_future(list_folder(folder_id))}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    parent_id, items = task.result()
+                    for item in items:
+                        if item.get("type") == "folder":
+                            pending.add(asyncio.ensure_future(list_folder(item["id"])))
+                        yield parent_id, item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def aiter_offset_entries(self, operation: str, page_size: int = 1000, prefetch: int = 2, **arguments: Any) -> AsyncIterator[Any]:
+        """
+        Async counterpart of ``iter_offset_entries``.
+
+        Args:
+            operation: Name of a listing tool that takes ``offset`` and ``limit``.
+            page_size: Entries requested per page, unless ``limit`` is given.
+            prefetch: Number of pages requested ahead of the one being consumed.
+            **arguments: Arguments for the listing tool. ``offset`` optionally sets the first entry.
+
+        Returns:
+            AsyncIterator[Any]: The ``entries`` of every page, in order.
+        """
+        offset, limit = _offset_arguments(operation, arguments, page_size)
+        if not offset and "marker" in _fields(operation):
+            async for entry in self.aiter_marker_entries(operation, prefetch=prefetch > 0, limit=limit, **arguments):
+                yield entry
+            return
+        page = await self._acall(operation, offset=offset, limit=limit, **arguments)
+        if not page:
+            return
+        limit = _page_stride(page, limit)
+        # Box still serves the page starting at _MAX_OFFSET itself.
+        end = min(page.get("total_count") or 0, _MAX_OFFSET + 1)
+        offsets = iter(range(offset + limit, end, limit) if limit else ())
+        pending = deque(asyncio.ensure_future(self._acall(operation, offset=o, limit=limit, **arguments)) for o in itertools.islice(offsets, prefetch))
+        try:
+            while page:
+                for entry in page.get("entries", ()):
+                    yield entry
+                following = next(offsets, None)
+                if following is not None:
+                    pending.append(asyncio.ensure_future(self._acall(operation, offset=following, limit=limit, **arguments)))
+                page = await pending.popleft() if pending else None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def aiter_marker_entries(self, operation: str, prefetch: bool = True, **arguments: Any) -> AsyncIterator[Any]:
+        """
+        Async counterpart of ``iter_marker_entries``.
+
+        With ``prefetch`` the next page is requested as a task as soon as its
+        marker is known, while the caller consumes the current page.
+
+        Args:
+            operation: Name of a listing tool that takes a ``marker`` argument.
+            prefetch: Whether to fetch the next page while the current one is consumed.
+            **arguments: Arguments for the listing tool. ``marker`` optionally sets the starting page.
+
+        Returns:
+            AsyncIterator[Any]: The ``entries`` of every page, in order.
+        """
+        marker = _marker_arguments(operation, arguments)
+        page = await self._acall(operation, marker=marker, **arguments)
+        while page:
+            marker = page.get("next_marker")
+            upcoming = asyncio.ensure_future(self._acall(operation, marker=marker, **arguments)) if marker and prefetch else None
+            try:
+                for entry in page.get("entries", ()):
+                    yield entry
+            except BaseException:
+                if upcoming is not None:
+                    upcoming.cancel()
+                raise
+            if upcoming is not None:
+                page = await upcoming
+            else:
+                page = await self._acall(operation, marker=marker, **arguments) if marker else None
+
+    def warm_up(self) -> Optional[asyncio.Task]:
+        """
+        Open a pooled connection for the coroutine tools in the background.
+
+        The async pool belongs to the event loop that uses it, so the probe
+        is scheduled as a task on the running loop; called outside of one,
+        this does nothing and the first request connects as usual.
+
+        Returns:
+            Optional[asyncio.Task]: The task doing the warm-up, or None without a running loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running event loop; skipping the Box connection warm-up")
+            return None
+        return loop.create_task(self.awarm_up())
+
+    async def awarm_up(self) -> None:
+        """
+        Open a pooled connection on ``async_client``, as ``BoxApp.warm_up`` does for ``client``.
+        """
+        try:
+            await self.async_client.head(self.base_url, auth=None, timeout=5)
+        except Exception as e:
+            logger.debug(f"Box connection warm-up failed: {e}")
+
+    def close(self) -> None:
+        """
+        Close the pooled sync client, and the async one as well where possible.
+
+        Closing the async client needs its event loop: inside a running loop
+        ``aclose`` is scheduled on it, otherwise a warning points to ``aclose``.
+        """
+        super().close()
+        if self._async_client is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("AsyncBoxApp.close() cannot close the async HTTP client outside an event loop; use 'await aclose()' or 'async with'")
+            return
+        loop.create_task(self._async_client.aclose())
+        self._async_client = None
+
+    async def aclose(self) -> None:
+        """
+        Close both pooled HTTP clients and release their connections.
+        """
+        super().close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    async def __aenter__(self) -> "AsyncBoxApp":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+def _sync_iteration_error(name: str, variant: str) -> TypeError:
+    # On AsyncBoxApp every page request is a coroutine, which the synchronous iterators cannot await.
+    return TypeError(f"AsyncBoxApp.{name} cannot await its page requests; iterate AsyncBoxApp.{variant} with 'async for' instead")
+
+
+async def _gather_bounded(function: Callable[[Any], Any], items: List[Any], concurrency: int, return_exceptions: bool = False) -> list[Any]:
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def bounded(item: Any) -> Any:
+        async with semaphore:
+            return await function(item)
+
+    return await asyncio.gather(*(bounded(item) for item in items), return_exceptions=return_exceptions)
+
+
+def _as_coroutine(method):
+    @functools.wraps(method)
+    async def coroutine(self, *args, **kwargs):
+        async with self._semaphore:
+            return await asyncio.to_thread(method, self, *args, **kwargs)
+    return coroutine
+
+
+def _as_native_coroutine(method):
+    # On AsyncBoxApp, _call returns the _acall coroutine, which is awaited here.
+    @functools.wraps(method)
+    async def coroutine(self, *args, **kwargs):
+        return await method(self, *args, **kwargs)
+    return coroutine
+
+
+# Looking the tools up on the class yields the plain functions rather than bound methods.
+for _tool in BoxApp.list_tools(BoxApp):
+    setattr(AsyncBoxApp, _tool.__name__, (_as_native_coroutine if _tool.__name__ in _ENDPOINTS else _as_coroutine)(_tool))
+del _tool
@@ -14,6 +14,7 @@ mcp = SingleMCPServer(
 )
 
 if __name__ == "__main__":
+    app_instance.warm_up()
     mcp.run()
 
 
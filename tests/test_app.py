@@ -1,11 +1,20 @@
+import asyncio
+import gzip
+import inspect
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
+from urllib.parse import quote
 
+import httpx
 import pytest
 from universal_mcp.utils.testing import (
     check_application_instance,
 )
 
-from universal_mcp_box.app import BoxApp
+from universal_mcp_box.app import AsyncBoxApp, BoxApp, _RetryTransport, _Throttle
 
 @pytest.fixture
 def app_instance():
@@ -13,5 +22,605 @@ def app_instance():
     mock_integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
     return BoxApp(integration=mock_integration)
 
+def mock_app(handler, app_class=BoxApp, **kwargs):
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    if app_class is AsyncBoxApp:
+        kwargs["async_client"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return app_class(integration=mock_integration, client=client, **kwargs)
+
 def test_application(app_instance):
     check_application_instance(app_instance, app_name="box")
+
+def test_client_is_pooled_and_closable(app_instance):
+    client = app_instance.client
+    assert app_instance.client is client
+    app_instance.close()
+    assert client.is_closed
+    assert app_instance.client is not client
+
+def test_credentials_are_resolved_once_and_uploads_keep_their_boundary(app_instance):
+    assert "content-type" not in app_instance.client.headers
+    seen = []
+
+    def handler(request):
+        seen.append((request.headers["authorization"], request.headers["content-type"]))
+        return httpx.Response(201, json={"entries": []})
+
+    app = mock_app(handler)
+    app.post_files_content(attributes='{"name": "a.txt", "parent": {"id": "0"}}', file=b"hello")
+    app.post_comments(message="hi", item={"type": "file", "id": "1"})
+    assert seen[0][0] == seen[1][0] == "Bearer dummy_access_token"
+    assert seen[0][1].startswith("multipart/form-data; boundary=")
+    assert seen[1][1].startswith("application/json")
+    assert app.integration.get_credentials.call_count == 1
+
+def test_rotated_tokens_are_refreshed_and_the_request_retried_once():
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.headers["authorization"]))
+        if request.headers["authorization"] != "Bearer new":
+            return httpx.Response(401)
+        return httpx.Response(201, json={"id": "1"})
+
+    app = mock_app(handler)
+    app.integration.get_credentials.side_effect = [{"access_token": "old"}, {"access_token": "new"}]
+    assert app.post_comments(message="hi", item={"type": "file", "id": "1"}) == {"id": "1"}
+    assert app.get_files_id("1") == {"id": "1"}
+    assert seen == [("POST", "Bearer old"), ("POST", "Bearer new"), ("GET", "Bearer new")]
+    assert app.integration.get_credentials.call_count == 2
+
+    app = mock_app(handler, AsyncBoxApp)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(app.delete_files_id("1"))
+    assert seen[-2:] == [("DELETE", "Bearer dummy_access_token")] * 2
+
+def test_transient_errors_are_retried_for_idempotent_requests():
+    statuses = iter([503, 502, 200, 503])
+
+    def handler(request):
+        return httpx.Response(next(statuses))
+
+    client = httpx.Client(transport=_RetryTransport(httpx.MockTransport(handler), retries=3, backoff=0))
+    assert client.get("https://api.box.com/2.0/files/1").status_code == 200
+    assert client.post("https://api.box.com/2.0/files/1/copy").status_code == 503
+
+def test_rate_limited_requests_honour_retry_after():
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(201, json={"id": "2"}),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+    ])
+
+    def handler(request):
+        return next(responses)
+
+    client = httpx.Client(transport=_RetryTransport(httpx.MockTransport(handler), retries=1, backoff=0))
+    assert client.post("https://api.box.com/2.0/files/1/copy").status_code == 201
+    assert client.get("https://api.box.com/2.0/files/1").status_code == 429
+
+def test_throttle_paces_requests_and_shares_429_pauses(monkeypatch):
+    throttle = _Throttle(rate=2)
+    assert [round(throttle.delay(), 1) for _ in range(4)] == [0, 0, 0.5, 1.0]
+
+    waits = []
+    monkeypatch.setattr(time, "sleep", waits.append)
+    responses = iter([httpx.Response(429, headers={"Retry-After": "5"}), httpx.Response(200), httpx.Response(200)])
+    client = httpx.Client(transport=_RetryTransport(httpx.MockTransport(lambda request: next(responses)), retries=1, backoff=0, throttle=_Throttle()))
+    assert client.get("https://api.box.com/2.0/files/1").status_code == 200
+    assert client.get("https://api.box.com/2.0/files/2").status_code == 200
+    assert [round(wait) for wait in waits] == [5, 5]
+
+def test_async_app_gathers_concurrently():
+    def handler(request):
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    app = mock_app(handler, app_class=AsyncBoxApp)
+    check_application_instance(app, app_name="box")
+    files = asyncio.run(app.gather_files(["1", "2", "3"]))
+    assert [f["id"] for f in files] == ["1", "2", "3"]
+
+def test_async_app_writes_natively_and_invalidates_cache():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.headers.get("content-type", "").partition(";")[0] or None))
+        return httpx.Response(200, json={"id": "1", "name": f"v{len(calls)}"})
+
+    app = mock_app(handler, cache_ttl=30, app_class=AsyncBoxApp)
+
+    async def scenario():
+        first = await app.get_files_id("1")
+        assert await app.get_files_id("1") == first
+        await app.put_files_id("1", name="renamed")
+        return await app.get_files_id("1")
+
+    assert asyncio.run(scenario())["name"] == "v3"
+    assert calls == [("GET", None), ("PUT", "application/json"), ("GET", None)]
+
+def test_concurrent_identical_gets_share_one_request():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"id": "1"})
+
+    app = mock_app(handler, app_class=AsyncBoxApp, cache_size=0)
+
+    async def burst():
+        return await asyncio.gather(*(app.get_files_id("1") for _ in range(5)))
+
+    assert asyncio.run(burst()) == [{"id": "1"}] * 5
+    assert calls == ["/2.0/files/1"]
+
+def test_metadata_is_fetched_inline_with_comma_separated_fields():
+    def handler(request):
+        assert request.url.params.get_list("fields") == ["name,metadata.enterprise.invoice,metadata.global.properties"]
+        return httpx.Response(200, json={"id": "1", "metadata": {"enterprise": {"invoice": {}}}})
+
+    app = mock_app(handler)
+    file = app.get_files_id_with_metadata("1", [("enterprise", "invoice"), ("global", "properties")], fields=["name"])
+    assert "invoice" in file["metadata"]["enterprise"]
+    app = mock_app(handler, app_class=AsyncBoxApp)
+    assert inspect.iscoroutinefunction(app.get_folders_id_with_metadata)
+    file = asyncio.run(app.get_files_id_with_metadata("1", [("enterprise", "invoice"), ("global", "properties")], fields=["name"]))
+    assert "invoice" in file["metadata"]["enterprise"]
+
+def test_async_app_points_sync_iterators_to_their_async_variants():
+    app = mock_app(lambda request: httpx.Response(200, json={"entries": []}), app_class=AsyncBoxApp)
+    for name, arguments in [("iter_folders_id_items", ("0",)), ("walk_folders_id", ("0",)), ("iter_marker_entries", ("get_folders_id_items",)), ("iter_offset_entries", ("get_search",))]:
+        with pytest.raises(TypeError, match=f"a{name}"):
+            list(getattr(app, name)(*arguments))
+
+def test_folder_details_are_fetched_together():
+    def handler(request):
+        if "securityClassification" in request.url.path:
+            return httpx.Response(404, json={"code": "instance_not_found"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    details = mock_app(handler, cache_size=0).get_folders_id_details("5")
+    assert details["folder"] == {"path": "/2.0/folders/5"}
+    assert details["collaborations"] == {"path": "/2.0/folders/5/collaborations"}
+    assert details["classification"] is None
+    details = asyncio.run(mock_app(handler, app_class=AsyncBoxApp, cache_size=0).get_folders_id_details("5"))
+    assert details["metadata"] == {"path": "/2.0/folders/5/metadata"}
+    assert details["classification"] is None
+
+def test_bulk_helpers_preserve_order():
+    deleted = []
+
+    def handler(request):
+        if request.method == "DELETE":
+            deleted.append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(204)
+        return httpx.Response(200, json={"id": request.url.path.split("/")[3]})
+
+    app = mock_app(handler)
+    ids = [str(i) for i in range(20)]
+    assert [f["id"] for f in app.get_files_many(ids, concurrency=4)] == ids
+    assert [c["id"] for c in app.get_files_many_comments(ids[:3])] == ids[:3]
+    assert [v["id"] for v in app.get_files_many_versions(ids[:3])] == ids[:3]
+    assert [c["id"] for c in app.get_collaborations_many(ids[:3])] == ids[:3]
+    app.delete_files_many(ids[:5])
+    assert sorted(deleted) == sorted(ids[:5])
+    app = mock_app(handler, app_class=AsyncBoxApp)
+    assert [f["id"] for f in asyncio.run(app.get_files_many(ids, concurrency=4))] == ids
+    assert [m["id"] for m in asyncio.run(app.get_files_many_metadata(ids[:3]))] == ids[:3]
+    assert [c["id"] for c in asyncio.run(app.get_comments_many(ids[:3]))] == ids[:3]
+    calls = [("get_folders_id", {"folder_id": "7"}), ("get_files_id", {"file_id": "8"})]
+    assert [r["id"] for r in asyncio.run(app.call_many(calls))] == ["7", "8"]
+    with pytest.raises(ValueError, match="close"):
+        mock_app(handler).call_many(calls + [("close", {})])
+
+def test_cascade_policies_are_applied_concurrently_reporting_failures():
+    def handler(request):
+        policy_id = request.url.path.split("/")[3]
+        return httpx.Response(409 if policy_id == "2" else 202)
+
+    ids = ["1", "2", "3"]
+    results = mock_app(handler).apply_metadata_cascade_policies_many(ids, conflict_resolution="none", return_exceptions=True)
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], httpx.HTTPStatusError)
+    app = mock_app(handler, app_class=AsyncBoxApp)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(app.apply_metadata_cascade_policies_many(ids))
+
+def test_reads_are_revalidated_by_default(monkeypatch):
+    # Every read lands in the same clock tick as the one it repeats.
+    monkeypatch.setattr(time, "monotonic", lambda: 100.0)
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.headers.get("if-none-match")))
+        if request.headers.get("if-none-match") == '"1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"entries": [{"id": "9"}]}, headers={"etag": '"1"'})
+
+    app = mock_app(handler)
+    app.get_folders_id_items("0")
+    app.get_folders_id_items("0")
+    app.delete_files_id("9")
+    assert app.get_folders_id_items("0") == {"entries": [{"id": "9"}]}
+    assert seen == [("GET", None), ("GET", '"1"'), ("DELETE", None), ("GET", '"1"')]
+
+def test_get_responses_are_cached_until_the_resource_is_written():
+    calls = []
+
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        return httpx.Response(200, json={"id": "1", "name": f"v{len(calls)}"})
+
+    app = mock_app(handler, cache_ttl=30)
+    assert app.get_files_id("1") == app.get_files_id("1")
+    assert len(calls) == 1
+    app.put_files_id("1", name="renamed")
+    assert app.get_files_id("1")["name"] == "v3"
+    assert len(calls) == 3
+    app.get_files_id_get_shared_link("1", fields="shared_link")
+    app.put_files_id_add_shared_link("1", fields="shared_link", shared_link={"access": "open"})
+    app.get_files_id_get_shared_link("1", fields="shared_link")
+    assert len(calls) == 6
+
+def test_writes_drop_filtered_listings_of_their_collection():
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"entries": [], "id": "8"})
+
+    app = mock_app(handler, cache_ttl=30)
+    app.get_folder_locks(folder_id="1")
+    app.get_collaborations_id("8")
+    app.delete_folder_locks_id("9")
+    app.get_folder_locks(folder_id="1")
+    app.get_collaborations_id("8")
+    assert len(calls) == 4
+
+def test_template_schemas_stay_cached_longer(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"entries": []})
+
+    app = mock_app(handler, cache_ttl=1e-9, schema_cache_ttl=3600, cache_dir=str(tmp_path))
+    app.get_security_classification_schema()
+    app.get_security_classification_schema()
+    app.get_files_id("1")
+    app.get_files_id("1")
+    assert len(calls) == 3
+    app.add_security_classification_schema(items=[])
+    app.get_security_classification_schema()
+    assert len(calls) == 5
+    app.get_schema_template("enterprise_42", "invoice")
+    app.get_schema_template("enterprise_42", "invoice")
+    app.get_metadata_templates_global()
+    app.get_metadata_templates_global()
+    app.get_metadata_templates_enterprise()
+    app.get_metadata_templates_enterprise()
+    assert len(calls) == 9
+    mock_app(handler, cache_ttl=1e-9, schema_cache_ttl=3600, cache_dir=str(tmp_path)).get_schema_template("enterprise_42", "invoice")
+    assert len(calls) == 9
+    app = mock_app(handler, cache_ttl=1e-9)
+    app.get_metadata_templates_global()
+    app.get_metadata_templates_global()
+    assert len(calls) == 11
+
+def test_reads_overtaken_by_a_write_are_not_cached():
+    state = {"name": "v1"}
+    started, release = threading.Event(), threading.Event()
+
+    def handler(request):
+        if request.method == "PUT":
+            state["name"] = json.loads(request.content)["name"]
+            return httpx.Response(200, json={"id": "1", **state})
+        body = {"id": "1", **state}
+        if not started.is_set():
+            started.set()
+            release.wait(5)
+        return httpx.Response(200, json=body)
+
+    app = mock_app(handler, cache_ttl=30)
+    slow = threading.Thread(target=app.get_files_id, args=("1",))
+    slow.start()
+    started.wait(5)
+    app.put_files_id("1", name="v2")
+    release.set()
+    slow.join()
+    assert app.get_files_id("1")["name"] == "v2"
+
+def test_cached_reads_persist_across_instances(tmp_path):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": "1"}, headers={"etag": '"1"'})
+
+    assert mock_app(handler, cache_ttl=30, cache_dir=str(tmp_path)).get_files_id("1") == {"id": "1"}
+    assert mock_app(handler, cache_ttl=30, cache_dir=str(tmp_path)).get_files_id("1") == {"id": "1"}
+    assert seen == [None]
+    assert mock_app(handler, cache_dir=str(tmp_path), cache_ttl=0).get_files_id("1") == {"id": "1"}
+    assert seen == [None, '"1"']
+    mock_app(handler, cache_ttl=30, cache_dir=str(tmp_path)).delete_files_id("1")
+    mock_app(handler, cache_ttl=30, cache_dir=str(tmp_path)).get_files_id("1")
+    assert seen == [None, '"1"', None, None]
+
+def test_oversized_responses_are_not_cached():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"entries": ["x" * 100]})
+
+    app = mock_app(handler, cache_ttl=30, cache_entry_bytes=64)
+    app.get_files_id_versions("1")
+    app.get_files_id_versions("1")
+    assert len(calls) == 2
+
+def test_cache_evicts_least_recently_used_entries_beyond_its_byte_budget():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"id": "x" * 100})
+
+    app = mock_app(handler, cache_ttl=30, cache_bytes=250)
+    for file_id in ["1", "2", "1", "3", "1", "2"]:
+        app.get_files_id(file_id)
+    assert calls == ["/2.0/files/1", "/2.0/files/2", "/2.0/files/3", "/2.0/files/2"]
+
+def test_stale_entries_are_revalidated_with_etag():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": "1"}, headers={"etag": '"1"'})
+
+    app = mock_app(handler, cache_ttl=0)
+    assert app.get_files_id("1") == {"id": "1"}
+    assert app.get_files_id("1") == {"id": "1"}
+    assert seen == [None, '"1"']
+
+def test_compressed_listings_are_decoded_from_bytes():
+    def handler(request):
+        assert "gzip" in request.headers["accept-encoding"]
+        body = gzip.compress(json.dumps({"entries": [{"id": str(i)} for i in range(100)]}).encode())
+        return httpx.Response(200, content=body, headers={"content-encoding": "gzip", "content-type": "application/json"})
+
+    app = mock_app(handler)
+    assert len(app.get_files_id_comments("1")["entries"]) == 100
+    app = mock_app(lambda request: httpx.Response(200, content=b" \n"))
+    assert app.delete_files_id("1") is None
+
+def test_invalid_enum_values_are_rejected_without_a_request():
+    def handler(request):
+        raise AssertionError("no request expected")
+
+    app = mock_app(handler)
+    with pytest.raises(ValueError, match="response_type"):
+        app.get_authorize(response_type="token", client_id="abc")
+    with pytest.raises(ValueError, match="extension"):
+        app.get_files_id_thumbnail_id("1", extension="gif")
+    with pytest.raises(ValueError, match="collaboration_id"):
+        app.delete_collaborations_id("")
+    with pytest.raises(ValueError, match="usemarker"):
+        app.get_folders_id_items("0", offset=10001)
+    with pytest.raises(ValueError, match="offset"):
+        asyncio.run(mock_app(handler, app_class=AsyncBoxApp).get_search(query="x", offset="20000"))
+
+def test_path_parameters_are_percent_encoded():
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.raw_path)
+        return httpx.Response(204)
+
+    mock_app(handler).delete_files_id("../folders/0?recursive=true")
+    assert paths == [b"/2.0/files/..%2Ffolders%2F0%3Frecursive%3Dtrue"]
+
+def test_search_sends_scalar_arrays_comma_separated_and_mdfilters_as_json():
+    queries = []
+
+    def handler(request):
+        queries.append(request.url.query)
+        return httpx.Response(200, json={"entries": []})
+
+    mdfilters = [{"scope": "enterprise", "templateKey": "invoice", "filters": {"amount": {"gt": 10}}}]
+    mock_app(handler).get_search(query="q", file_extensions=["pdf", "docx"], mdfilters=mdfilters)
+    assert queries == [b"query=q&file_extensions=pdf%2Cdocx&mdfilters=" + quote('[{"scope":"enterprise","templateKey":"invoice","filters":{"amount":{"gt":10}}}]', safe="").encode()]
+
+def test_error_statuses_raise_http_status_error():
+    app = mock_app(lambda request: httpx.Response(404, json={"code": "not_found"}), cache_size=0)
+    with pytest.raises(httpx.HTTPStatusError):
+        app.get_files_id("1")
+    app = mock_app(lambda request: httpx.Response(404, json={"code": "not_found"}), app_class=AsyncBoxApp, cache_size=0)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(app.get_files_id("1"))
+
+def test_marker_listings_are_iterated_across_pages():
+    pages = {None: ("a", "m1"), "m1": ("b", "m2"), "m2": ("c", None)}
+
+    def handler(request):
+        assert request.url.params["usemarker"] == "true"
+        entry, next_marker = pages[request.url.params.get("marker")]
+        return httpx.Response(200, json={"entries": [{"id": entry}], "next_marker": next_marker})
+
+    app = mock_app(handler, cache_size=0)
+    assert [e["id"] for e in app.iter_marker_entries("get_folders_id_items", folder_id="0")] == ["a", "b", "c"]
+    assert [e["id"] for e in app.iter_folders_id_items("0")] == ["a", "b", "c"]
+
+    async def collect():
+        app = mock_app(handler, app_class=AsyncBoxApp, cache_size=0)
+        return [e["id"] async for e in app.aiter_marker_entries("get_folders_id_items", folder_id="0")]
+
+    assert asyncio.run(collect()) == ["a", "b", "c"]
+    with pytest.raises(ValueError):
+        next(app.iter_marker_entries("get_files_id", file_id="1"))
+
+def test_offset_listings_prefetch_pages_up_to_total_count():
+    offsets = []
+
+    def handler(request):
+        offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+        offsets.append(offset)
+        return httpx.Response(200, json={"total_count": 7, "entries": list(range(offset, min(offset + limit, 7)))})
+
+    app = mock_app(handler, cache_size=0)
+    assert list(app.iter_offset_entries("get_files_id_versions", page_size=2, file_id="1")) == list(range(7))
+    assert sorted(offsets) == [0, 2, 4, 6]
+
+    async def collect():
+        app = mock_app(handler, app_class=AsyncBoxApp, cache_size=0)
+        return [e async for e in app.aiter_offset_entries("get_files_id_versions", page_size=3, file_id="1")]
+
+    assert asyncio.run(collect()) == list(range(7))
+
+def test_offset_listings_follow_the_page_size_box_serves():
+    def handler(request):
+        if request.url.params.get("query") == "none":
+            return httpx.Response(204)
+        total = 20000 if request.url.params["query"] == "many" else 1000
+        offset, limit = int(request.url.params["offset"]), min(int(request.url.params["limit"]), 200)
+        return httpx.Response(200, json={"total_count": total, "limit": limit, "entries": list(range(offset, min(offset + limit, total)))})
+
+    app = mock_app(handler, cache_size=0)
+    assert list(app.iter_offset_entries("get_search", query="x")) == list(range(1000))
+    assert list(app.iter_offset_entries("get_search", query="x", offset="600")) == list(range(600, 1000))
+    assert list(app.iter_offset_entries("get_search", query="many")) == list(range(10200))
+    assert list(app.iter_offset_entries("get_search", query="none")) == []
+
+    async def collect():
+        app = mock_app(handler, app_class=AsyncBoxApp, cache_size=0)
+        return [e async for e in app.aiter_offset_entries("get_search", query="many", offset="9800")]
+
+    assert asyncio.run(collect()) == list(range(9800, 10200))
+
+def test_folder_trees_are_walked_in_parallel():
+    tree = {"0": [("folder", "1"), ("file", "a")], "1": [("folder", "2"), ("file", "b")], "2": [("file", "c")]}
+
+    def handler(request):
+        folder_id = request.url.path.split("/")[3]
+        return httpx.Response(200, json={"entries": [{"type": t, "id": i} for t, i in tree[folder_id]], "next_marker": None})
+
+    expected = [("0", "1"), ("0", "a"), ("1", "2"), ("1", "b"), ("2", "c")]
+    walked = mock_app(handler, cache_size=0).walk_folders_id("0")
+    assert sorted((parent, item["id"]) for parent, item in walked) == expected
+
+    async def collect():
+        app = mock_app(handler, app_class=AsyncBoxApp, cache_size=0)
+        return [(parent, item["id"]) async for parent, item in app.awalk_folders_id("0")]
+
+    assert sorted(asyncio.run(collect())) == expected
+
+def test_file_content_follows_redirect_and_streams_to_disk(tmp_path):
+    tokens = []
+
+    def handler(request):
+        if request.url.host == "api.box.com":
+            tokens.append(request.url.params.get("access_token"))
+            return httpx.Response(302, headers={"location": "https://dl.boxcloud.com/d/1"})
+        return httpx.Response(200, content=b"x" * 10)
+
+    app = mock_app(handler)
+    assert app.get_files_id_content("1") == b"x" * 10
+    assert list(app.iter_files_id_content("1", access_token="scoped", chunk_size=4)) == [b"xxxx", b"xxxx", b"xx"]
+    target = tmp_path / "file.bin"
+    assert app.download_files_id_content("1", str(target)) == 10
+    assert target.read_bytes() == b"x" * 10
+    assert tokens == [None, "scoped", None]
+
+    app = mock_app(handler, app_class=AsyncBoxApp)
+    with pytest.raises(TypeError, match="aiter_files_id_content"):
+        list(app.iter_files_id_content("1"))
+
+    async def stream():
+        chunks = [chunk async for chunk in app.aiter_files_id_content("1", access_token="scoped", chunk_size=4)]
+        return chunks, await app.download_files_id_content("1", str(target))
+
+    assert asyncio.run(stream()) == ([b"xxxx", b"xxxx", b"xx"], 10)
+    assert tokens[3:] == ["scoped", None]
+
+def test_json_patch_bodies_are_serialized():
+    sent = []
+
+    def handler(request):
+        sent.append((request.headers["content-type"], request.content))
+        return httpx.Response(200, json={})
+
+    app = mock_app(handler)
+    app.put_update_file_security_classification("1", items=[{"op": "replace", "path": "/Box__Security__Classification__Key", "value": "Sensitive"}])
+    content_type, body = sent[0]
+    assert content_type == "application/json-patch+json"
+    assert json.loads(body)[0]["op"] == "replace"
+
+def test_restoring_a_file_version_sends_null_trashed_at():
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"id": "2"})
+
+    mock_app(handler).put_files_id_versions_id("1", "2")
+    assert bodies == [{"trashed_at": None}]
+
+def test_options_requests_keep_empty_bodies():
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.path, request.content))
+        return httpx.Response(200, json={"upload_url": "u"})
+
+    app = mock_app(handler)
+    app.options_files_content()
+    app.options_events()
+    asyncio.run(mock_app(handler, AsyncBoxApp).options_files_content())
+    assert seen == [("/2.0/files/content", b"{}"), ("/2.0/events", b""), ("/2.0/files/content", b"{}")]
+
+def test_warm_up_opens_a_connection_in_the_background():
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.headers.get("authorization")))
+        return httpx.Response(404)
+
+    app = mock_app(handler)
+    app.warm_up().join(timeout=5)
+    assert seen == [("HEAD", None)]
+    assert app.integration.get_credentials.call_count == 0
+
+def test_async_warm_up_probes_the_async_pool_and_close_releases_it():
+    seen = []
+
+    def transport(name):
+        return httpx.MockTransport(lambda request: seen.append((name, request.method)) or httpx.Response(404))
+
+    async def scenario():
+        app = AsyncBoxApp(integration=MagicMock(), client=httpx.Client(transport=transport("sync")), async_client=httpx.AsyncClient(transport=transport("async")), warm_up=True)
+        await asyncio.sleep(0.1)
+        async_client = app.async_client
+        with app:
+            pass
+        await asyncio.sleep(0)
+        return async_client
+
+    assert AsyncBoxApp(integration=MagicMock(), warm_up=True).warm_up() is None
+    assert asyncio.run(scenario()).is_closed
+    assert seen == [("async", "HEAD")]
+
+def test_concurrent_first_requests_share_one_client(app_instance):
+    barrier = threading.Barrier(8)
+
+    def first_client():
+        barrier.wait()
+        return app_instance.client
+
+    with ThreadPoolExecutor(8) as pool:
+        clients = [pool.submit(first_client) for _ in range(8)]
+    assert len({id(client.result()) for client in clients}) == 1